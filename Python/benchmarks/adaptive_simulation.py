@@ -0,0 +1,63 @@
+import argparse
+import random
+import statistics
+import sys
+
+from quiz_core.adaptive import LEVEL_DIFFICULTY, AdaptiveQuiz, label_cuts, label_for_ability, p_correct
+from quiz_core.questions import build_builtin_questions, build_exam_questions
+from quiz_core.quiz import Quiz
+
+STUDENTS = 5000
+SECONDS_PER_QUESTION = 40
+CONFIDENCES = (0.7, 0.75, 0.8, 0.9)
+
+def answer_all(quiz: Quiz, theta: float, rng: random.Random, difficulty) -> None:
+    # Rasch modeline göre cevaplayan sanal öğrenci.
+    while quiz.has_more_questions():
+        question = quiz.get_current_question()
+        knows = rng.random() < p_correct(theta, difficulty(question))
+        choice = question.answer_index if knows else (question.answer_index + 1) % len(question.choices)
+        quiz.answer_current(choice)
+
+def level_difficulty(question) -> float:
+    return LEVEL_DIFFICULTY[question.level]
+
+def run(label: str, make_quiz, abilities: list, seed: int) -> None:
+    rng = random.Random(seed)
+    cuts = label_cuts()
+    lengths = []
+    hits = 0
+    for theta in abilities:
+        quiz = make_quiz(rng)
+        answer_all(quiz, theta, rng, getattr(quiz, "difficulty", level_difficulty))
+        lengths.append(quiz.answered)
+        hits += quiz.get_results()[8] == label_for_ability(theta, cuts)
+    median = statistics.median(lengths)
+    per_hour = 3600 / (statistics.mean(lengths) * SECONDS_PER_QUESTION)
+    print(
+        f"{label:<26} doğruluk: {hits / len(abilities) * 100:5.1f}%  medyan soru: {median:4.1f}  "
+        f"ort.: {statistics.mean(lengths):4.1f}  medyan süre: {median * SECONDS_PER_QUESTION / 60:4.1f} dk  "
+        f"koltuk/saat: {per_hour:4.1f} öğrenci"
+    )
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.adaptive_simulation")
+    parser.add_argument("--students", type=int, default=STUDENTS)
+    args = parser.parse_args(argv[1:])
+    pools = build_builtin_questions()
+    population = random.Random(11)
+    abilities = [population.gauss(0.0, 1.0) for _ in range(args.students)]
+    print(f"{args.students} sanal öğrenci, θ ~ N(0, 1), soru başına {SECONDS_PER_QUESTION} sn; "
+          f"seviye eşikleri θ = {', '.join(f'{c:.2f}' for c in label_cuts())}")
+    run("sabit 5/5/5", lambda rng: Quiz(build_exam_questions(*pools)), abilities, 1)
+    for confidence in CONFIDENCES:
+        run(
+            f"uyarlamalı (güven {confidence:.2f})",
+            lambda rng, c=confidence: AdaptiveQuiz(pools, confidence=c, rng=rng),
+            abilities,
+            1,
+        )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,100 @@
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from quiz_core.analytics import run_analytics
+from quiz_core.quiz import LEVELS
+from quiz_core.records import encode_record
+from quiz_core.reports import LEADERBOARD_SIZE
+from quiz_core.shards import shard_file
+
+RECORDS = 1_000_000
+SHARDS = 16
+RECORDS_PER_STUDENT = 8
+TEACHERS = ("Admin", "Ayşe Hoca", "Mehmet Hoca", "Zeynep Hoca")
+LEVEL_LABELS = ("Beginner", "Intermediate", "Advanced")
+
+def synthetic_shard(args) -> str:
+    # Her parça kendi tohumuyla ayrı süreçte üretilir; öğrenciler parçalara
+    # ayrık dağıtılır (öğrenciye göre parçalama ile aynı yapı).
+    directory, index, students, first_order = args
+    rng = random.Random(index)
+    entries = []
+    for offset in range(students):
+        order = first_order + offset
+        records = []
+        for _ in range(RECORDS_PER_STUDENT):
+            level_stats = {level: {"correct": rng.randint(0, 5), "wrong": rng.randint(0, 5)} for level in LEVELS}
+            correct = sum(stats["correct"] for stats in level_stats.values())
+            wrong = sum(stats["wrong"] for stats in level_stats.values())
+            records.append(encode_record({
+                "datetime": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:00:00",
+                "correct": correct,
+                "wrong": wrong,
+                "percent": correct / 15 * 100,
+                "points": rng.randint(0, 30),
+                "level_label": rng.choice(LEVEL_LABELS),
+                "level_stats": level_stats,
+                "teacher": rng.choice(TEACHERS),
+            }))
+        entries.append([f"Öğrenci {order}", order, records, None])
+    path = shard_file(directory, index)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False, separators=(",", ":"))
+    return path
+
+def build_dataset(directory: str, records: int, shards: int) -> list:
+    students = records // RECORDS_PER_STUDENT
+    per_shard = -(-students // shards)
+    jobs = []
+    for index in range(shards):
+        first = index * per_shard
+        count = max(0, min(per_shard, students - first))
+        jobs.append((directory, index, count, first))
+    with ProcessPoolExecutor() as pool:
+        return list(pool.map(synthetic_shard, jobs))
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.analytics_scaling")
+    parser.add_argument("--records", type=int, default=RECORDS)
+    parser.add_argument("--shards", type=int, default=SHARDS)
+    args = parser.parse_args(argv[1:])
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, cores} & set(range(1, max(cores, 2) + 1)))
+    directory = tempfile.mkdtemp(prefix="sinav-shards-")
+    try:
+        started = time.perf_counter()
+        paths = build_dataset(directory, args.records, args.shards)
+        print(f"{args.records} kayıt, {args.shards} parça hazırlandı ({time.perf_counter() - started:.1f} sn), çekirdek: {cores}")
+        baseline = None
+        reference = None
+        for workers in worker_counts:
+            started = time.perf_counter()
+            summary = run_analytics(paths, workers=workers)
+            elapsed = time.perf_counter() - started
+            report = summary.general_report(LEADERBOARD_SIZE)
+            if reference is None:
+                reference = report
+                baseline = elapsed
+            elif report != reference:
+                print(f"{workers} süreç: sonuç tek süreçli çalıştırmadan farklı!")
+                return 1
+            speedup = baseline / elapsed
+            print(
+                f"{workers:>2} süreç: {elapsed:6.2f} sn  hızlanma: {speedup:4.2f}x  "
+                f"verim: {speedup / workers * 100:5.1f}%  kayıt: {summary.records}"
+            )
+        if cores < 2:
+            print("Not: tek çekirdekli makinede ölçeklenme gözlenemez; yalnızca süreç ek yükü görülür.")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,104 @@
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from quiz_core import storage
+from quiz_core.columnar import ColumnarSnapshot, refresh_snapshot
+from quiz_core.quiz import LEVELS
+from quiz_core.records import ExamRecord
+from quiz_core.reports import build_teacher_general_report
+
+RECORDS = 500_000
+RECORDS_PER_STUDENT = 5
+NEW_RECORDS = 1000
+TEACHERS = ("Admin", "Ayşe Hoca", "Mehmet Hoca", "Zeynep Hoca")
+LEVEL_LABELS = ("Beginner", "Intermediate", "Advanced")
+
+def synthetic_record(rng: random.Random) -> ExamRecord:
+    levels = tuple(rng.randint(0, 5) for _ in range(2 * len(LEVELS)))
+    correct = sum(levels[0::2])
+    answered = sum(levels)
+    points = rng.randint(0, 30)
+    return ExamRecord(
+        f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(8, 18):02d}:{rng.randint(0, 59):02d}:00",
+        correct,
+        answered - correct,
+        correct / answered * 100 if answered else 0,
+        answered,
+        30,
+        answered < 30,
+        points,
+        30,
+        points / 30 * 100,
+        rng.choice(LEVEL_LABELS),
+        levels,
+        (0, 1, 2, 3, 4, 15, 16, 17),
+        rng.choice(TEACHERS),
+    )
+
+def timed(action):
+    started = time.perf_counter()
+    value = action()
+    return value, time.perf_counter() - started
+
+def directory_size(directory: str) -> int:
+    return sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.columnar_snapshot")
+    parser.add_argument("--records", type=int, default=RECORDS)
+    args = parser.parse_args(argv[1:])
+    rng = random.Random(3)
+    students = args.records // RECORDS_PER_STUDENT
+    results = {f"Öğrenci {s}": [synthetic_record(rng) for _ in range(RECORDS_PER_STUDENT)] for s in range(students)}
+    cwd = os.getcwd()
+    directory = tempfile.mkdtemp(prefix="sinav-columnar-")
+    os.chdir(directory)
+    try:
+        storage.JsonStorage().save_results(results)
+        json_size = os.path.getsize(storage.RESULTS_FILE)
+        del results
+        loaded, load_time = timed(storage.load_results)
+        json_report, report_time = timed(lambda: build_teacher_general_report(loaded, None))
+        print(f"{students * RECORDS_PER_STUDENT} kayıt, {students} öğrenci")
+        print(f"JSON      : dosya {json_size / 1e6:6.1f} MB  yükleme {load_time:5.2f} sn  rapor {report_time:5.2f} sn")
+
+        info, export_time = timed(lambda: refresh_snapshot(loaded, "cols"))
+        print(f"dışa aktar: {info['rows']} satır  {export_time:5.2f} sn  görüntü {directory_size('cols') / 1e6:6.1f} MB")
+
+        def columnar_report():
+            return ColumnarSnapshot("cols").summary().general_report(None)
+
+        report, columnar_time = timed(columnar_report)
+        print(f"sütunlu   : açma + rapor {columnar_time:5.2f} sn (JSON yolu {load_time + report_time:5.2f} sn)")
+
+        def by_teacher():
+            snapshot = ColumnarSnapshot("cols")
+            teacher = snapshot.column("teacher")
+            sums = np.bincount(teacher, weights=snapshot.column("point_percent"), minlength=len(snapshot.teachers))
+            counts = np.bincount(teacher, minlength=len(snapshot.teachers))
+            return dict(zip(snapshot.teachers, (sums / np.maximum(counts, 1)).round(2).tolist()))
+
+        averages, query_time = timed(by_teacher)
+        print(f"sorgu     : öğretmen başına ortalama puan yüzdesi {query_time * 1000:6.1f} ms  {averages}")
+
+        for _ in range(NEW_RECORDS):
+            storage.append_result(loaded, f"Öğrenci {rng.randrange(students + 100)}", synthetic_record(rng))
+        storage.wait_for_compaction()
+        info, refresh_time = timed(lambda: refresh_snapshot(loaded, "cols"))
+        print(f"artımlı   : +{info['added']} kayıt  {refresh_time * 1000:6.0f} ms  (tam dışa aktarım {export_time:5.2f} sn)")
+        same = report == json_report and columnar_report() == build_teacher_general_report(loaded, None)
+        print("Rapor eşitliği:", "aynı" if same else "FARKLI")
+        return 0 if same else 1
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,84 @@
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from quiz_core import storage
+
+PROCESSES = 8
+RECORDS_PER_PROCESS = 200
+COMPACT_THRESHOLD = 25
+
+def writer(directory: str, mode: str, worker: int, count: int, start) -> None:
+    # Her süreç aynı veri klasörünü paylaşan ayrı bir sınav koltuğudur.
+    os.chdir(directory)
+    storage.RESULTS_STORAGE_MODE = mode
+    storage.JOURNAL_COMPACT_THRESHOLD = COMPACT_THRESHOLD
+    backend = storage.JsonStorage()
+    storage.set_storage(backend)
+    results = {}
+    start.wait()
+    for i in range(count):
+        record = {"worker": worker, "i": i, "correct": i % 15, "wrong": 15 - i % 15, "teacher": "Admin"}
+        storage.append_result(results, f"Öğrenci {worker}", record)
+    backend.close()
+
+def run(mode: str, processes: int, count: int) -> bool:
+    directory = tempfile.mkdtemp(prefix=f"sinav-writers-{mode}-")
+    try:
+        start = multiprocessing.Event()
+        workers = [
+            multiprocessing.Process(target=writer, args=(directory, mode, worker, count, start))
+            for worker in range(processes)
+        ]
+        for process in workers:
+            process.start()
+        started = time.perf_counter()
+        start.set()
+        for process in workers:
+            process.join()
+        elapsed = time.perf_counter() - started
+        failed = [process.exitcode for process in workers if process.exitcode]
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            results = storage.JsonStorage().load_results()
+        finally:
+            os.chdir(cwd)
+        seen = {}
+        for records in results.values():
+            for record in records:
+                key = (record["worker"], record["i"])
+                seen[key] = seen.get(key, 0) + 1
+        expected = processes * count
+        missing = expected - sum(1 for key in seen if seen[key] >= 1)
+        duplicated = sum(1 for value in seen.values() if value > 1)
+        ordered = all(
+            [record["i"] for record in results.get(f"Öğrenci {worker}", [])] == list(range(count))
+            for worker in range(processes)
+        )
+        ok = not failed and not missing and not duplicated and ordered
+        print(
+            f"{mode:<8} {processes} süreç x {count} kayıt: {elapsed:6.2f} sn  "
+            f"{expected / elapsed:8.0f} kayıt/sn  eksik: {missing}  çift: {duplicated}  "
+            f"sıra: {'tamam' if ordered else 'BOZUK'}  {'OK' if ok else 'HATA'}"
+        )
+        return ok
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.concurrent_writers")
+    parser.add_argument("--processes", type=int, default=PROCESSES)
+    parser.add_argument("--records", type=int, default=RECORDS_PER_PROCESS)
+    args = parser.parse_args(argv[1:])
+    ok = True
+    for mode in ("journal", "snapshot"):
+        ok = run(mode, args.processes, args.records) and ok
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
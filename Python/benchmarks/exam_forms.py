@@ -0,0 +1,88 @@
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from quiz_core.forms import ExamForms, exposure_counts, generate_forms, write_forms
+from quiz_core.questions import build_builtin_questions, build_exam_questions
+from quiz_core.quiz import LEVELS
+
+FORMS = 100_000
+PER_LEVEL = 5
+WINDOW = 1000
+DRAWS = 20_000
+
+def spread(counts: list) -> str:
+    return "  ".join(f"{level} {min(c)}-{max(c)}" for level, c in zip(LEVELS, counts))
+
+def baseline_forms(pools, count: int, per_level: int):
+    # Bugünkü yol: her sınav için random.sample; form satırları aynı numaralarla.
+    numbers = {id(q): i for i, q in enumerate(q for pool in pools for q in pool)}
+    rng_state = random.getstate()
+    random.seed(5)
+    try:
+        rows = [[numbers[id(q)] for q in build_exam_questions(*pools, per_level=per_level)] for _ in range(count)]
+    finally:
+        random.setstate(rng_state)
+    return np.array(rows, dtype=np.uint16)
+
+def distinct(forms) -> int:
+    return len(np.unique(np.sort(forms, axis=1), axis=0))
+
+def per_draw_us(action, draws: int) -> float:
+    started = time.perf_counter()
+    for _ in range(draws):
+        action()
+    return (time.perf_counter() - started) / draws * 1e6
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.exam_forms")
+    parser.add_argument("--forms", type=int, default=FORMS)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv[1:])
+    pools = build_builtin_questions()
+    sizes = [len(pool) for pool in pools]
+    print(f"{args.forms} form, seviye başına {PER_LEVEL} soru, havuz {'/'.join(map(str, sizes))}")
+
+    started = time.perf_counter()
+    baseline = baseline_forms(pools, args.forms, PER_LEVEL)
+    baseline_time = time.perf_counter() - started
+    started = time.perf_counter()
+    forms = generate_forms(pools, args.forms, PER_LEVEL, args.seed)
+    generate_time = time.perf_counter() - started
+    print(f"üretim    : random.sample {baseline_time:5.2f} sn   form üretici {generate_time:5.2f} sn")
+    print(f"farklı    : random.sample {distinct(baseline)}   form üretici {distinct(forms)}")
+    print(f"kullanım  : random.sample {spread(exposure_counts(baseline, sizes))}")
+    print(f"            form üretici  {spread(exposure_counts(forms, sizes))}")
+    start = args.forms // 3
+    print(f"{WINDOW} formluk ardışık pencerede:")
+    print(f"            random.sample {spread(exposure_counts(baseline[start:start + WINDOW], sizes))}")
+    print(f"            form üretici  {spread(exposure_counts(forms[start:start + WINDOW], sizes))}")
+    repeat = generate_forms(pools, args.forms, PER_LEVEL, args.seed)
+    same = bool((repeat == forms).all())
+    print("Tekrar üretim:", "aynı" if same else "FARKLI")
+
+    directory = tempfile.mkdtemp(prefix="sinav-forms-")
+    try:
+        path = os.path.join(directory, "exam_forms.bin")
+        write_forms(forms, pools, PER_LEVEL, args.seed, path)
+        size = os.path.getsize(path)
+        print(f"dosya     : {size / 1e6:5.2f} MB ({size / args.forms:.1f} B/form)")
+        book = ExamForms(path)
+        rng = random.Random(2)
+        lookup = per_draw_us(lambda: book.questions(rng.randrange(args.forms), pools), DRAWS)
+        sample = per_draw_us(lambda: build_exam_questions(*pools, per_level=PER_LEVEL), DRAWS)
+        print(f"sınav başlatma: form okuma {lookup:5.1f} µs   random.sample {sample:5.1f} µs")
+        same = same and book.form(start) == forms[start].tolist()
+        book.close()
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,40 @@
+import os
+import re
+import sys
+import statistics
+import subprocess
+
+# quiz_core içe aktarımı için üst sınır (kümülatif, mikro saniye).
+IMPORT_BUDGET_US = 60000
+RUNS = 7
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def measure_once() -> int:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import quiz_core, sys; print('PyQt6' in sys.modules)"],
+        cwd=PACKAGE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    if proc.stdout.strip() != "False":
+        raise SystemExit("quiz_core PyQt6 içe aktarmamalı.")
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| quiz_core$", line)
+        if match:
+            return int(match.group(1))
+    raise SystemExit("quiz_core satırı -X importtime çıktısında bulunamadı.")
+
+def main() -> int:
+    samples = [measure_once() for _ in range(RUNS)]
+    median = statistics.median(samples)
+    print(f"quiz_core içe aktarma süresi (medyan {RUNS} çalıştırma): {median / 1000:.1f} ms "
+          f"(bütçe {IMPORT_BUDGET_US / 1000:.0f} ms)")
+    if median > IMPORT_BUDGET_US:
+        print("Bütçe aşıldı.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from quiz_core.items import AnswerLog, ItemAnalysis, answer_event_line, exam_end_line, load_item_stats, save_item_stats
+
+EXAMS = 50_000
+ITEMS = 600
+PER_EXAM = 15
+BROKEN = 12
+INCREMENT = 100
+ABANDONED = 0.05
+
+def simulate(rng: random.Random, exams: int) -> tuple:
+    # Rasch modeli: doğru cevap olasılığı yetenek ile zorluk farkının lojistiği.
+    # "Bozuk" maddelerin cevap anahtarı yanlış: iyi öğrenciler (gerçek doğru
+    # olan) 1. şıkkı seçer, sistem 0'ı doğru sayar. Sınavların bir kısmı
+    # yarıda bırakılır (bitiş satırı yok); eşzamanlı sınavların satırları
+    # günlükte iç içe geçer.
+    difficulty = [rng.gauss(0, 1) for _ in range(ITEMS)]
+    broken = set(rng.sample(range(ITEMS), BROKEN))
+    qids = [f"{i:016x}" for i in range(ITEMS)]
+    lines = []
+    running = []
+    for exam in range(exams):
+        ability = rng.gauss(0, 1)
+        log = AnswerLog()
+        exam_lines = []
+        items = rng.sample(range(ITEMS), PER_EXAM)
+        if rng.random() < ABANDONED:
+            items = items[: rng.randint(1, PER_EXAM - 1)]
+        for item in items:
+            knows = rng.random() < 1 / (1 + math.exp(difficulty[item] - ability))
+            if item in broken:
+                choice = 1 if knows else rng.choice((0, 2, 3))
+            else:
+                choice = 0 if knows else rng.randint(1, 3)
+            event = (qids[item], choice, choice == 0, rng.randint(2000, 60000))
+            exam_lines.append(answer_event_line(log.exam, event))
+        if len(items) == PER_EXAM:
+            record = {"datetime": f"2026-01-01 00:{exam % 60:02d}", "adaptive": False}
+            exam_lines.append(exam_end_line(log.exam, f"öğrenci {exam}", record))
+        running.append(exam_lines)
+        if len(running) == 8:
+            while running:
+                for exam_lines in list(running):
+                    lines.append(exam_lines.pop(0))
+                    if not exam_lines:
+                        running.remove(exam_lines)
+    for exam_lines in running:
+        lines.extend(exam_lines)
+    return lines, qids, broken
+
+def batch(lines: list) -> dict:
+    # Karşılaştırma için klasik toplu hesap: tüm geçmiş her seferinde taranır.
+    exams = {}
+    finished = set()
+    for raw in lines:
+        line = json.loads(raw)
+        if type(line) is list:
+            exams.setdefault(line[0], []).append((line[1], line[3]))
+        else:
+            finished.add(line["exam"])
+    answers = {}
+    pairs = {}
+    for exam, events in exams.items():
+        total = sum(correct for _, correct in events)
+        for qid, correct in events:
+            answers.setdefault(qid, []).append(correct)
+            if exam in finished:
+                pairs.setdefault(qid, []).append((correct, (total - correct) / (len(events) - 1)))
+    result = {}
+    for qid, values in pairs.items():
+        xs = [x for x, _ in values]
+        ys = [y for _, y in values]
+        result[qid] = (statistics.mean(answers[qid]), statistics.correlation(xs, ys))
+    return result
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.item_statistics")
+    parser.add_argument("--exams", type=int, default=EXAMS)
+    args = parser.parse_args(argv[1:])
+    rng = random.Random(25)
+    lines, qids, broken = simulate(rng, args.exams)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = os.path.join(tmp, "answers.jsonl")
+        stats = os.path.join(tmp, "item_stats.json")
+        with open(log, "wb") as f:
+            f.writelines(lines)
+        size = os.path.getsize(log)
+        answers = sum(line.startswith(b"[") for line in lines)
+        print(f"{args.exams} sınav, {answers} cevap: günlük {size / 2**20:.1f} MB "
+              f"({size / answers:.0f} B/cevap, bitiş satırları dahil)")
+
+        started = time.perf_counter()
+        analysis = ItemAnalysis()
+        analysis.consume(log)
+        save_item_stats(analysis, stats)
+        full = time.perf_counter() - started
+
+        started = time.perf_counter()
+        reference = batch(lines)
+        batch_time = time.perf_counter() - started
+
+        # Artımlı: yeni sınavlar eklenir, kayıtlı durumdan devam edilir.
+        extra, _, _ = simulate(random.Random(26), INCREMENT)
+        with open(log, "ab") as f:
+            f.writelines(extra)
+            f.write(b'["yar')  # yazılmakta olan satır atlanmalı
+        started = time.perf_counter()
+        resumed = load_item_stats(stats)
+        consumed = resumed.consume(log)
+        save_item_stats(resumed, stats)
+        incremental = time.perf_counter() - started
+        print(f"baştan kurulum : {full:6.2f} sn   toplu yeniden hesap: {batch_time:6.2f} sn")
+        print(f"artımlı ({consumed} yeni satır, kayıttan devam): {incremental * 1000:6.1f} ms")
+        print(f"bitmiş sınav {analysis.exams}, süren/yarım kalan {len(analysis.open)}")
+        ok = consumed == len(extra) and resumed.answers == analysis.answers + sum(line.startswith(b"[") for line in extra)
+
+    worst = 0.0
+    for qid, (p, r) in reference.items():
+        stat = analysis.item(qid)
+        worst = max(worst, abs(stat.p_value - p), abs(stat.discrimination - r))
+    print(f"toplu hesaba göre en büyük fark (p, r): {worst:.2e}")
+    ok = ok and worst < 1e-9
+
+    flagged = {i for i, qid in enumerate(qids) if any("ters" in flag for flag in analysis.item(qid).flags(0))}
+    print(f"bozuk maddeler: {len(broken & flagged)}/{len(broken)} işaretlendi, "
+          f"{len(flagged - broken)} sağlam madde yanlışlıkla işaretlendi")
+    r_broken = statistics.mean(analysis.item(qids[i]).discrimination for i in broken)
+    r_good = statistics.mean(analysis.item(qids[i]).discrimination for i in range(ITEMS) if i not in broken)
+    print(f"ortalama ayırt edicilik: sağlam {r_good:.2f}, bozuk {r_broken:.2f}")
+    ok = ok and broken <= flagged
+    print("Sonuç:", "doğru" if ok else "HATALI")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,60 @@
+import sys
+import time
+import statistics
+
+from PyQt6.QtWidgets import QApplication
+
+from oop_Uygulama import MainWindow, LoginWindow, ExamSetupWindow, TeacherRegisterWindow
+
+# Bir ekran geçişi için hedef gecikme (ms).
+TRANSITION_TARGET_MS = 16
+ROUNDS = 50
+
+def timed(app: QApplication, action) -> float:
+    started = time.perf_counter()
+    action()
+    app.processEvents()
+    return (time.perf_counter() - started) * 1000
+
+def show_and_discard(widget) -> None:
+    # Eski akış: her geçişte yeni bir üst düzey pencere kurulup gösteriliyordu.
+    widget.show()
+    QApplication.processEvents()
+    widget.close()
+    widget.deleteLater()
+
+def main() -> int:
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = MainWindow({})
+    window.show()
+    app.processEvents()
+    transitions = {
+        "mod -> öğrenci girişi": lambda: window.show_login("student"),
+        "öğrenci girişi -> sınav ayarları": lambda: window.show_exam_setup("bench", "Admin"),
+        "sınav ayarları -> öğrenci girişi": lambda: window.show_login("student"),
+        "öğrenci girişi -> mod": window.show_mode,
+        "mod -> öğretmen kaydı": window.show_register,
+        "öğretmen kaydı -> mod": window.show_mode,
+    }
+    samples = {name: [] for name in transitions}
+    for _ in range(ROUNDS):
+        for name, action in transitions.items():
+            samples[name].append(timed(app, action))
+    rebuild = {
+        "LoginWindow yeniden kurulum": lambda: LoginWindow(window, "student"),
+        "ExamSetupWindow yeniden kurulum": lambda: ExamSetupWindow(window),
+        "TeacherRegisterWindow yeniden kurulum": lambda: TeacherRegisterWindow(window),
+    }
+    for name, factory in rebuild.items():
+        samples[name] = [timed(app, lambda: show_and_discard(factory())) for _ in range(ROUNDS)]
+    over_budget = False
+    for name, values in samples.items():
+        median = statistics.median(values)
+        print(f"{name:<40} medyan: {median:6.2f} ms  en kötü: {max(values):6.2f} ms")
+        if name in transitions and median > TRANSITION_TARGET_MS:
+            over_budget = True
+    print(f"Hedef: ekran geçişi başına {TRANSITION_TARGET_MS} ms")
+    return 1 if over_budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
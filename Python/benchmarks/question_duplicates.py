@@ -0,0 +1,122 @@
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from quiz_core.duplicates import SHINGLE_SIZE, SIMILARITY_THRESHOLD, QuestionIndex, _content
+from quiz_core.questions import build_builtin_questions
+
+QUESTIONS = 100_000
+QUERIES = 2000
+BRUTE_FORCE_QUERIES = 20
+MEMORY_SAMPLE = 20_000
+
+def vocabulary() -> list:
+    words = set()
+    for pool in build_builtin_questions():
+        for q in pool:
+            words.update(q.text.split())
+            for choice in q.choices:
+                words.update(choice.split())
+    return sorted(words)
+
+def synthetic_question(rng: random.Random, words: list):
+    text = " ".join(rng.choice(words) for _ in range(rng.randint(6, 14))) + "?"
+    choices = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 3))) for _ in range(4)]
+    return text, choices
+
+def near_duplicate(rng: random.Random, text: str, choices: list):
+    # Öğretmenin yeniden yazdığı soru: büyük/küçük harf, boşluk, şık sırası
+    # ve bir kelimelik değişiklik.
+    words = text.split()
+    words[rng.randrange(len(words))] = words[rng.randrange(len(words))]
+    edited = "  ".join(words).upper() if rng.random() < 0.5 else " ".join(words)
+    shuffled = list(choices)
+    rng.shuffle(shuffled)
+    return edited, shuffled
+
+def shingles(text: str, choices: list) -> set:
+    data = _content(text, choices)
+    return {data[i:i + SHINGLE_SIZE] for i in range(max(1, len(data) - SHINGLE_SIZE + 1))}
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b)
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.question_duplicates")
+    parser.add_argument("--questions", type=int, default=QUESTIONS)
+    args = parser.parse_args(argv[1:])
+    rng = random.Random(9)
+    words = vocabulary()
+    bank = [synthetic_question(rng, words) for _ in range(args.questions)]
+
+    def build(questions: list) -> QuestionIndex:
+        index = QuestionIndex()
+        for i, (text, choices) in enumerate(questions):
+            index.add(i, text, choices)
+        return index
+
+    started = time.perf_counter()
+    index = build(bank)
+    build_time = time.perf_counter() - started
+    # tracemalloc kurulumu çok yavaşlattığı için bellek bir örnekle ölçülür.
+    sample = bank[:MEMORY_SAMPLE]
+    tracemalloc.start()
+    sample_index = build(sample)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sample_index
+    print(f"{len(index)} soru: dizin kurulumu {build_time:5.2f} sn ({build_time / len(index) * 1e6:.0f} µs/soru), "
+          f"bellek {memory / len(sample):.0f} B/soru")
+
+    samples = rng.sample(range(len(bank)), QUERIES)
+    kinds = {
+        "birebir": [(i, bank[i][0], bank[i][1]) for i in samples],
+        "yakın": [(i, *near_duplicate(rng, *bank[i])) for i in samples],
+        "yeni": [(None, *synthetic_question(rng, words)) for _ in range(QUERIES)],
+    }
+    for kind, queries in kinds.items():
+        timings = []
+        hits = 0
+        for expected, text, choices in queries:
+            started = time.perf_counter()
+            found = index.similar(text, choices)
+            timings.append(time.perf_counter() - started)
+            ids = [qid for qid, _ in found]
+            hits += (expected in ids) if expected is not None else not ids
+        label = "doğru bulunan" if kind != "yeni" else "boş dönen"
+        print(f"{kind:<8}: medyan {statistics.median(timings) * 1e6:6.1f} µs  p99 {percentile(timings, 0.99) * 1e6:6.1f} µs  "
+              f"{label} {hits / len(queries) * 100:5.1f}%")
+
+    # Gerçek Jaccard'a göre: yakın kopyalardan eşiği geçenlerin kaçı bulundu,
+    # bulunanlardan kaçı gerçekten eşiğin 0.1 altından benzer.
+    caught = relevant = reported = false = 0
+    for expected, text, choices in kinds["yakın"]:
+        query = shingles(text, choices)
+        found = index.similar(text, choices)
+        if jaccard(query, shingles(*bank[expected])) >= SIMILARITY_THRESHOLD:
+            relevant += 1
+            caught += any(qid == expected for qid, _ in found)
+        for qid, _ in found:
+            reported += 1
+            false += jaccard(query, shingles(*bank[qid])) < SIMILARITY_THRESHOLD - 0.1
+    print(f"geri çağırma (gerçek Jaccard ≥ {SIMILARITY_THRESHOLD}): {caught}/{relevant}  "
+          f"yanlış pozitif (Jaccard < {SIMILARITY_THRESHOLD - 0.1:.1f}): {false}/{reported}")
+
+    bank_shingles = [shingles(text, choices) for text, choices in bank]
+    started = time.perf_counter()
+    for _, text, choices in kinds["yakın"][:BRUTE_FORCE_QUERIES]:
+        query = shingles(text, choices)
+        [i for i, s in enumerate(bank_shingles) if jaccard(query, s) >= SIMILARITY_THRESHOLD]
+    brute = (time.perf_counter() - started) / BRUTE_FORCE_QUERIES
+    print(f"kaba kuvvet (tam Jaccard taraması): {brute * 1000:6.1f} ms/sorgu")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
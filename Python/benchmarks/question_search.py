@@ -0,0 +1,120 @@
+import argparse
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+from benchmarks.question_duplicates import vocabulary
+from quiz_core.quiz import LEVELS
+from quiz_core.search import QuestionSearchIndex, search_terms
+
+QUESTIONS = 100_000
+QUERIES = 500
+MEMORY_SAMPLE = 20_000
+EXTRA_WORDS = 20_000
+SYLLABLES = ("ka", "le", "mi", "do", "su", "ra", "ti", "nö", "şe", "gü", "ba", "lı", "ya", "çi", "ze", "ko")
+
+def zipf_vocabulary(rng: random.Random) -> tuple:
+    # Yerleşik soruların kelimeleri + uydurma kelimeler; sıklık Zipf dağılımlı.
+    words = vocabulary() + [
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(EXTRA_WORDS)
+    ]
+    rng.shuffle(words)
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    total = 0.0
+    cumulative = []
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+    return words, cumulative
+
+def synthetic_question(rng: random.Random, vocab: tuple):
+    words, cumulative = vocab
+    def pick(count: int) -> str:
+        return " ".join(rng.choices(words, cum_weights=cumulative, k=count))
+    return f"{pick(rng.randint(6, 14))}?", [pick(rng.randint(1, 3)) for _ in range(4)]
+
+def build(bank: list) -> QuestionSearchIndex:
+    index = QuestionSearchIndex()
+    for doc, (level, text, choices) in enumerate(bank):
+        index.add(doc, level, text, choices)
+    return index
+
+def scan(folded: list, bank: list, query: str, level) -> list:
+    # Dizinsiz tarama: her sorunun katlanmış terimlerinde önek araması.
+    tokens = search_terms(query)
+    return [
+        doc for doc, terms in enumerate(folded)
+        if (level is None or bank[doc][0] == level) and all(any(t.startswith(q) for t in terms) for q in tokens)
+    ]
+
+def timed_queries(action, queries: list) -> list:
+    timings = []
+    for query, level in queries:
+        started = time.perf_counter()
+        action(query, level)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.question_search")
+    parser.add_argument("--questions", type=int, default=QUESTIONS)
+    args = parser.parse_args(argv[1:])
+    rng = random.Random(12)
+    vocab = zipf_vocabulary(rng)
+    bank = [(rng.choice(LEVELS), *synthetic_question(rng, vocab)) for _ in range(args.questions)]
+
+    started = time.perf_counter()
+    index = build(bank)
+    build_time = time.perf_counter() - started
+    tracemalloc.start()
+    sample = build(bank[:MEMORY_SAMPLE])
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sample
+    print(f"{len(index)} soru, {len(index.terms)} terim: kurulum {build_time:5.2f} sn, bellek ~{memory / MEMORY_SAMPLE:.0f} B/soru")
+
+    terms = sorted(index.postings, key=lambda term: len(index.postings[term]))
+    rare = terms[: len(terms) // 2]
+    def word() -> str:
+        # Sorgu kelimeleri de bankadaki sıklığa göre seçilir.
+        return synthetic_question(rng, vocab)[0].split()[0].rstrip("?")
+
+    kinds = {
+        "tek kelime": [(word(), None) for _ in range(QUERIES)],
+        "iki kelime": [(f"{word()} {word()}", None) for _ in range(QUERIES)],
+        "iki kelime + seviye": [(f"{word()} {word()}", rng.choice(LEVELS)) for _ in range(QUERIES)],
+        "3 harf önek": [(rng.choice(rare)[:3], None) for _ in range(QUERIES)],
+        "seyrek terim": [(rng.choice(rare), None) for _ in range(QUERIES)],
+    }
+    folded = [
+        tuple(set(search_terms(text)).union(*(search_terms(c) for c in choices)))
+        for _, text, choices in bank
+    ]
+    same = True
+    for kind, queries in kinds.items():
+        timings = timed_queries(index.search, queries)
+        sizes = [len(index.search(query, level)) for query, level in queries[:50]]
+        scan_timings = timed_queries(lambda q, lv: scan(folded, bank, q, lv), queries[:5])
+        same = same and all(
+            sorted(index.search(query, level)) == scan(folded, bank, query, level) for query, level in queries[:5]
+        )
+        print(f"{kind:<20}: medyan {statistics.median(timings) * 1000:7.2f} ms  en kötü {max(timings) * 1000:7.2f} ms  "
+              f"ort. sonuç {statistics.mean(sizes):8.0f}  tarama {statistics.median(scan_timings) * 1000:7.1f} ms")
+
+    started = time.perf_counter()
+    for doc in range(len(bank), len(bank) + 1000):
+        level, text, choices = rng.choice(LEVELS), *synthetic_question(rng, vocab)
+        index.add(doc, level, text, choices)
+    add_time = (time.perf_counter() - started) / 1000
+    started = time.perf_counter()
+    for doc in range(len(bank), len(bank) + 1000):
+        index.remove(doc)
+    remove_time = (time.perf_counter() - started) / 1000
+    print(f"artımlı   : ekleme {add_time * 1e6:6.1f} µs/soru  silme {remove_time * 1e6:6.1f} µs/soru")
+    print("Tarama ile eşitlik:", "aynı" if same else "FARKLI")
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,57 @@
+import random
+import sys
+import time
+
+from quiz_core.ranking import RANKING_METRICS
+from quiz_core.reports import LEADERBOARD_SIZE, ResultStats
+
+STUDENTS = 100_000
+UPDATES = 10_000
+
+def synthetic_results(count: int) -> dict:
+    rng = random.Random(7)
+    results = {}
+    for i in range(count):
+        results[f"Öğrenci {i}"] = [
+            {"points": rng.randint(0, 45), "percent": rng.randint(0, 15) * 100 / 15, "datetime": "2025-01-01 10:00:00"}
+            for _ in range(rng.randint(1, 3))
+        ]
+    return results
+
+def timed(action) -> float:
+    started = time.perf_counter()
+    action()
+    return (time.perf_counter() - started) * 1000
+
+def full_sort_rankings(students: list) -> None:
+    # Eski rapor: her metrik için tüm öğrenci listesinin tam sıralaması.
+    for value in RANKING_METRICS.values():
+        sorted(students, key=value, reverse=True)
+
+def main() -> int:
+    results = synthetic_results(STUDENTS)
+    stats = ResultStats(results)
+    students = list(stats.students.values())
+    print(f"{STUDENTS} öğrenci")
+    print(f"ResultStats kurulumu                        : {timed(lambda: ResultStats(results)):8.1f} ms")
+    print(f"Üç metrikte tam sıralama (eski)             : {timed(lambda: full_sort_rankings(students)):8.1f} ms")
+    top = timed(lambda: [stats.top(metric, LEADERBOARD_SIZE) for metric in RANKING_METRICS])
+    print(f"Üç metrikte ilk {LEADERBOARD_SIZE} (yığın)                 : {top:8.1f} ms")
+    print(f"Sıralama ağaçlarının kurulumu               : {timed(stats.build_rankings):8.1f} ms")
+    top = timed(lambda: [stats.top(metric, LEADERBOARD_SIZE) for metric in RANKING_METRICS])
+    print(f"Üç metrikte ilk {LEADERBOARD_SIZE} (ağaç)                  : {top:8.3f} ms")
+    print(f"Tam rapor metni (eski)                      : {timed(lambda: stats.general_report(None)):8.1f} ms"
+          f"  {len(stats.general_report(None)) / 1e6:.1f} MB")
+    print(f"İlk {LEADERBOARD_SIZE} raporu                              : {timed(stats.general_report):8.1f} ms"
+          f"  {len(stats.general_report(LEADERBOARD_SIZE)) / 1e6:.1f} MB")
+    rng = random.Random(11)
+    names = [rng.choice(students).name for _ in range(UPDATES)]
+    records = [{"points": rng.randint(0, 45), "percent": 50.0} for _ in range(UPDATES)]
+    elapsed = timed(lambda: [stats.add_record(name, record) for name, record in zip(names, records)])
+    print(f"Kayıt başına güncelleme                     : {elapsed * 1000 / UPDATES:8.1f} µs")
+    elapsed = timed(lambda: [stats.rank_of("avg_percent", name) for name in names])
+    print(f"rank_of sorgusu                             : {elapsed * 1000 / UPDATES:8.1f} µs")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+import argparse
+import gc
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from quiz_core.analysis import build_study_suggestions
+from quiz_core.quiz import LEVELS
+from quiz_core.records import decode_results, dump_results
+
+STUDENTS = 20_000
+RECORDS_PER_STUDENT = 5
+TEACHERS = ("Admin", "Ayşe Hoca", "Mehmet Hoca", "Zeynep Hoca")
+
+def synthetic_results(students: int, per_student: int) -> dict:
+    # build_exam_record ile aynı alanlar ve gerçek öneri listeleri.
+    rng = random.Random(7)
+    results = {}
+    for s in range(students):
+        records = []
+        for _ in range(per_student):
+            level_stats = {level: {"correct": rng.randint(0, 5), "wrong": rng.randint(0, 5)} for level in LEVELS}
+            correct = sum(stats["correct"] for stats in level_stats.values())
+            wrong = sum(stats["wrong"] for stats in level_stats.values())
+            answered = correct + wrong
+            points = rng.randint(0, 30)
+            point_percent = points / 30 * 100
+            level_label = "Beginner" if point_percent < 40 else "Intermediate" if point_percent < 70 else "Advanced"
+            records.append({
+                "datetime": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} {rng.randint(8, 18):02d}:{rng.randint(0, 59):02d}:00",
+                "correct": correct,
+                "wrong": wrong,
+                "percent": correct / answered * 100 if answered else 0,
+                "answered": answered,
+                "total_questions": 30,
+                "early_terminated": answered < 30,
+                "points": points,
+                "max_points": 30,
+                "point_percent": point_percent,
+                "level_label": level_label,
+                "level_stats": level_stats,
+                "study_suggestions": build_study_suggestions(level_label, level_stats),
+                "teacher": rng.choice(TEACHERS),
+            })
+        results[f"Öğrenci {s}"] = records
+    return results
+
+def measure_load(text: str, decode: bool):
+    # Yüklenen verinin kalıcı bellek kullanımı (tracemalloc) ve izlemesiz yükleme süresi.
+    def load():
+        data = json.loads(text)
+        return decode_results(data) if decode else data
+
+    gc.collect()
+    started = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    tracemalloc.start()
+    data = load()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, current, peak, elapsed
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.record_encoding")
+    parser.add_argument("--students", type=int, default=STUDENTS)
+    parser.add_argument("--per-student", type=int, default=RECORDS_PER_STUDENT)
+    args = parser.parse_args(argv[1:])
+    results = synthetic_results(args.students, args.per_student)
+    records = args.students * args.per_student
+
+    old_text = json.dumps(results, ensure_ascii=False, indent=2)
+    buffer = io.StringIO()
+    dump_results(results, buffer)
+    new_text = buffer.getvalue()
+    old_size = len(old_text.encode("utf-8"))
+    new_size = len(new_text.encode("utf-8"))
+    print(f"{records} kayıt ({args.students} öğrenci)")
+    print(f"dosya   : eski {old_size / 1e6:7.2f} MB  yeni {new_size / 1e6:7.2f} MB  ({new_size / old_size * 100:.1f}%)")
+
+    del results
+    old_data, old_mem, old_peak, old_time = measure_load(old_text, decode=False)
+    del old_data
+    new_data, new_mem, new_peak, new_time = measure_load(new_text, decode=True)
+    print(
+        f"bellek  : eski {old_mem / 1e6:7.2f} MB  yeni {new_mem / 1e6:7.2f} MB  ({new_mem / old_mem * 100:.1f}%)"
+        f"  tepe: {old_peak / 1e6:.1f} -> {new_peak / 1e6:.1f} MB"
+    )
+    print(f"yükleme : eski {old_time * 1000:7.0f} ms  yeni {new_time * 1000:7.0f} ms")
+    print(f"kayıt başına: eski {old_mem / records:.0f} B  yeni {new_mem / records:.0f} B")
+
+    original = json.loads(old_text)
+    same = all(
+        [record.to_dict() for record in new_data[name]] == expected
+        for name, expected in original.items()
+    )
+    print("Gidiş-dönüş:", "aynı" if same else "FARKLI")
+    return 0 if same else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
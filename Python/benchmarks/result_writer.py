@@ -0,0 +1,122 @@
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from quiz_core import storage
+from quiz_core.writer import ResultWriter
+
+FINISHES = 400
+SEATS = 8
+SLOW_DISK_MS = 20.0
+
+class SlowDisk:
+    # Ağ paylaşımı / yavaş disk benzetimi: her yazım çağrısına sabit gecikme.
+    def __init__(self, backend, delay_ms: float) -> None:
+        self.backend = backend
+        self.delay = delay_ms / 1000
+
+    def append_results(self, entries: list, sync: bool = False) -> None:
+        time.sleep(self.delay)
+        self.backend.append_results(entries, sync)
+
+    def sync_results(self) -> None:
+        time.sleep(self.delay)
+        self.backend.sync_results()
+
+def record(seat: int, i: int) -> dict:
+    return {"seat": seat, "i": i, "correct": i % 15, "wrong": 15 - i % 15, "teacher": "Admin"}
+
+def run_seats(finish, seats: int, count: int) -> list:
+    # Her koltuk kendi iş parçacığında ardışık sınav bitirir; çağrı süresi ölçülür.
+    samples = []
+    lock = threading.Lock()
+    start = threading.Event()
+
+    def seat(index: int) -> None:
+        local = []
+        start.wait()
+        for i in range(count):
+            started = time.perf_counter()
+            finish(index, i)
+            local.append((time.perf_counter() - started) * 1000)
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=seat, args=(index,)) for index in range(seats)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+    return samples
+
+def describe(label: str, samples: list, elapsed: float) -> None:
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"{label:<34} bitiş çağrısı ort: {statistics.mean(ordered):7.3f} ms  p95: {p95:7.3f} ms  "
+        f"en kötü: {ordered[-1]:7.3f} ms  toplam: {elapsed:5.2f} sn"
+    )
+
+def verify(seats: int, count: int) -> bool:
+    results = storage.JsonStorage().load_results()
+    expected = {(seat, i) for seat in range(seats) for i in range(count)}
+    found = [(r["seat"], r["i"]) for records in results.values() for r in records]
+    return len(found) == len(expected) and set(found) == expected
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.result_writer")
+    parser.add_argument("--finishes", type=int, default=FINISHES, help="koltuk başına")
+    parser.add_argument("--seats", type=int, default=SEATS)
+    parser.add_argument("--slow-ms", type=float, default=SLOW_DISK_MS)
+    args = parser.parse_args(argv[1:])
+    cwd = os.getcwd()
+    ok = True
+    for policy in ("always", "interval", "never"):
+        directory = tempfile.mkdtemp(prefix="sinav-writer-")
+        os.chdir(directory)
+        try:
+            slow = SlowDisk(storage.JsonStorage(), args.slow_ms)
+            sync = policy == "always"
+            direct_lock = threading.Lock()
+
+            def direct(seat: int, i: int) -> None:
+                with direct_lock:
+                    slow.append_results([(f"Öğrenci {seat}", record(seat, i))], sync)
+
+            count = max(1, args.finishes // 10)
+            started = time.perf_counter()
+            samples = run_seats(direct, args.seats, count)
+            describe(f"eşzamanlı yazım ({policy}, {count}/koltuk)", samples, time.perf_counter() - started)
+            ok = verify(args.seats, count) and ok
+            storage.wait_for_compaction()
+            for path in os.listdir(directory):
+                os.remove(path)
+
+            writer = ResultWriter(slow, fsync_policy=policy).start()
+            started = time.perf_counter()
+            samples = run_seats(lambda seat, i: writer.submit(f"Öğrenci {seat}", record(seat, i)), args.seats, args.finishes)
+            writer.close()
+            elapsed = time.perf_counter() - started
+            describe(f"grup kesinleştirme ({policy}, {args.finishes}/koltuk)", samples, elapsed)
+            metrics = writer.metrics()
+            print(
+                f"{'':<34} toplu yazım: {metrics['batches']}  kayıt/yazım: {metrics['records_per_batch']:.1f}  "
+                f"en derin kuyruk: {metrics['max_queue_depth']}  yazım ort/p95: "
+                f"{metrics['flush_ms_avg']:.1f}/{metrics['flush_ms_p95']:.1f} ms  hata: {metrics['errors']}"
+            )
+            storage.wait_for_compaction()
+            ok = verify(args.seats, args.finishes) and metrics["written"] == metrics["submitted"] and ok
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(directory, ignore_errors=True)
+    print("Doğrulama:", "tamam" if ok else "HATA (eksik ya da fazla kayıt)")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,57 @@
+import sys
+import time
+import statistics
+
+from PyQt6.QtWidgets import QApplication
+
+from oop_Uygulama import (
+    MainWindow,
+    ModeWindow,
+    TeacherRegisterWindow,
+    PasswordChangeWindow,
+    LoginWindow,
+    ExamSetupWindow,
+    QuizWindow,
+    ResultWindow,
+    TeacherMainWindow,
+)
+from theme import apply_theme
+
+ROUNDS = 30
+
+def construct_and_show(factory) -> float:
+    started = time.perf_counter()
+    widget = factory()
+    widget.show()
+    QApplication.processEvents()
+    elapsed = (time.perf_counter() - started) * 1000
+    widget.close()
+    widget.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+def main() -> int:
+    app = QApplication.instance() or QApplication(sys.argv)
+    apply_theme(app)
+    main_window = MainWindow({})
+    factories = {
+        "ModeWindow": lambda: ModeWindow(main_window),
+        "TeacherRegisterWindow": lambda: TeacherRegisterWindow(main_window),
+        "PasswordChangeWindow": lambda: PasswordChangeWindow("student", "bench"),
+        "LoginWindow": lambda: LoginWindow(main_window, "student"),
+        "ExamSetupWindow": lambda: ExamSetupWindow(main_window),
+        "QuizWindow": lambda: QuizWindow(main_window),
+        "ResultWindow": lambda: ResultWindow(main_window),
+        "TeacherMainWindow": lambda: TeacherMainWindow(main_window),
+    }
+    total = 0.0
+    for name, factory in factories.items():
+        samples = [construct_and_show(factory) for _ in range(ROUNDS)]
+        median = statistics.median(samples)
+        total += median
+        print(f"{name:<24} medyan: {median:6.2f} ms")
+    print(f"{'Toplam':<24} medyan: {total:6.2f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,382 @@
+import sys
+import time
+import json
+import random
+import asyncio
+import argparse
+import secrets
+import traceback
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional
+
+from quiz_core import (
+    Quiz,
+    AdaptiveQuiz,
+    analyze_weak_areas,
+    build_exam_record,
+    get_question_bank,
+    append_result,
+    get_storage,
+)
+from quiz_core.forms import draw_exam_questions
+from quiz_core.items import log_exam_end, start_answer_log
+from quiz_core.writer import get_result_writer, start_result_writer, stop_result_writer
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+SESSION_IDLE_TIMEOUT = 2 * 60 * 60
+LATENCY_SAMPLES = 10000
+MAX_BODY_SIZE = 64 * 1024
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+class LatencyRecorder:
+    def __init__(self, max_samples: int = LATENCY_SAMPLES) -> None:
+        self.samples: Dict[str, deque] = {}
+        self.counts: Dict[str, int] = {}
+        self.max_samples = max_samples
+
+    def add(self, endpoint: str, seconds: float) -> None:
+        samples = self.samples.get(endpoint)
+        if samples is None:
+            samples = deque(maxlen=self.max_samples)
+            self.samples[endpoint] = samples
+            self.counts[endpoint] = 0
+        samples.append(seconds)
+        self.counts[endpoint] += 1
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for endpoint, samples in self.samples.items():
+            ordered = sorted(samples)
+            summary[endpoint] = {
+                "count": self.counts[endpoint],
+                "p50_ms": percentile(ordered, 50) * 1000,
+                "p99_ms": percentile(ordered, 99) * 1000,
+            }
+        return summary
+
+def percentile(ordered: list, p: float) -> float:
+    if not ordered:
+        return 0.0
+    k = min(len(ordered) - 1, max(0, int(round(p / 100 * (len(ordered) - 1)))))
+    return ordered[k]
+
+class ExamSession:
+    def __init__(self, token: str, student_name: str, teacher_name: str, quiz: Quiz) -> None:
+        self.token = token
+        self.student_name = student_name
+        self.teacher_name = teacher_name
+        self.quiz = quiz
+        self.last_seen = time.monotonic()
+
+def question_payload(quiz: Quiz) -> Optional[Dict[str, Any]]:
+    if not quiz.has_more_questions():
+        return None
+    soru = quiz.get_current_question()
+    return {
+        "number": quiz.index + 1,
+        "total": quiz.planned_total(),
+        "level": soru.level,
+        "text": soru.text,
+        "choices": list(soru.choices),
+    }
+
+class SessionManager:
+    def __init__(self, results: Dict[str, Any], idle_timeout: float = SESSION_IDLE_TIMEOUT) -> None:
+        self.results = results
+        self.sessions: Dict[str, ExamSession] = {}
+        self.idle_timeout = idle_timeout
+
+    def start(
+        self, student_name: str, teacher_name: str, minutes: Optional[int] = None, adaptive: bool = False
+    ) -> ExamSession:
+        exam_end_time = None
+        if minutes:
+            exam_end_time = datetime.now() + timedelta(minutes=minutes)
+        easy, medium, hard = get_question_bank().pools()
+        if adaptive:
+            quiz = AdaptiveQuiz((easy, medium, hard), exam_end_time=exam_end_time)
+        else:
+            quiz = Quiz(draw_exam_questions(easy, medium, hard, per_level=5), exam_end_time=exam_end_time)
+        start_answer_log(quiz)
+        token = secrets.token_urlsafe(16)
+        session = ExamSession(token, student_name, teacher_name, quiz)
+        self.sessions[token] = session
+        return session
+
+    def get(self, token: str) -> ExamSession:
+        session = self.sessions.get(token)
+        if session is None:
+            raise ApiError(404, "Oturum bulunamadı.")
+        session.last_seen = time.monotonic()
+        return session
+
+    def answer(self, token: str, choice_index: int) -> Dict[str, Any]:
+        session = self.get(token)
+        quiz = session.quiz
+        if not quiz.has_more_questions() or quiz.time_over():
+            return {"correct": None, "finished": True, "question": None}
+        soru = quiz.get_current_question()
+        if not 0 <= choice_index < len(soru.choices):
+            raise ApiError(400, "Geçersiz şık numarası.")
+        correct = quiz.answer_current(choice_index)
+        return {
+            "correct": correct,
+            "answer": soru.answer,
+            "finished": not quiz.has_more_questions(),
+            "question": question_payload(quiz),
+        }
+
+    def finish(self, token: str) -> Dict[str, Any]:
+        session = self.get(token)
+        quiz = session.quiz
+        if quiz.has_more_questions():
+            quiz.early_terminated = True
+            quiz.index = len(quiz.questions)
+        record = build_exam_record(quiz, session.teacher_name)
+        append_result(self.results, session.student_name, record)
+        # Sunucu geçmiş kayıtları okumaz; kayıt yazıcıya verildikten sonra
+        # bellekte tutulmaz, sözlük sunucu açık kaldıkça büyümez.
+        self.results.pop(session.student_name, None)
+        log_exam_end(session.student_name, record, quiz)
+        del self.sessions[token]
+        return {"record": record, "weak_info": analyze_weak_areas(record["level_stats"])}
+
+    def expire_idle(self) -> int:
+        limit = time.monotonic() - self.idle_timeout
+        expired = [token for token, s in self.sessions.items() if s.last_seen < limit]
+        for token in expired:
+            del self.sessions[token]
+        return len(expired)
+
+class ExamServer:
+    def __init__(self, manager: SessionManager) -> None:
+        self.manager = manager
+        self.latency = LatencyRecorder()
+        self.routes = {
+            ("POST", "/start"): self.handle_start,
+            ("POST", "/answer"): self.handle_answer,
+            ("POST", "/finish"): self.handle_finish,
+            ("GET", "/stats"): self.handle_stats,
+        }
+
+    def handle_start(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        student_name = str(body.get("name", "")).strip()
+        teacher_name = str(body.get("teacher", "")).strip()
+        if not student_name or not teacher_name:
+            raise ApiError(400, "İsim ve öğretmen alanları zorunludur.")
+        minutes = body.get("minutes")
+        if minutes is not None and (not isinstance(minutes, int) or isinstance(minutes, bool) or minutes <= 0):
+            raise ApiError(400, "Geçerli bir dakika değeri girin.")
+        session = self.manager.start(student_name, teacher_name, minutes, bool(body.get("adaptive")))
+        return {"token": session.token, "question": question_payload(session.quiz)}
+
+    def handle_answer(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        choice = body.get("choice")
+        # bool da int'in alt sınıfıdır; true/false şık numarası sayılmaz.
+        if not isinstance(choice, int) or isinstance(choice, bool):
+            raise ApiError(400, "choice alanı tamsayı olmalıdır.")
+        return self.manager.answer(str(body.get("token", "")), choice)
+
+    def handle_finish(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        return self.manager.finish(str(body.get("token", "")))
+
+    def handle_stats(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        stats = {"sessions": len(self.manager.sessions), "latency": self.latency.summary()}
+        writer = get_result_writer()
+        if writer is not None:
+            stats["writer"] = writer.metrics()
+        return stats
+
+    def dispatch(self, method: str, path: str, raw_body: bytes):
+        handler = self.routes.get((method, path))
+        if handler is None:
+            return 404, {"error": "Bulunamadı."}
+        try:
+            body = json.loads(raw_body.decode("utf-8")) if raw_body else {}
+        except ValueError:
+            return 400, {"error": "Geçersiz JSON."}
+        if not isinstance(body, dict):
+            return 400, {"error": "Gövde bir JSON nesnesi olmalıdır."}
+        try:
+            return 200, handler(body)
+        except ApiError as e:
+            return e.status, {"error": e.message}
+        except Exception:
+            # Beklenmeyen hata bağlantıyı düşürmez; ayrıntısı sunucu çıktısına yazılır.
+            print(f"Hata: {method} {path}", file=sys.stderr)
+            traceback.print_exc()
+            return 500, {"error": "Sunucu hatası."}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                parts = request_line.decode("latin-1").split()
+                if len(parts) < 2:
+                    break
+                method, path = parts[0], parts[1].split("?", 1)[0]
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0") or 0)
+                if length > MAX_BODY_SIZE:
+                    break
+                raw_body = await reader.readexactly(length) if length else b""
+                started = time.perf_counter()
+                status, payload = self.dispatch(method, path, raw_body)
+                self.latency.add(path, time.perf_counter() - started)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def expire_loop(self, interval: float = 60) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.manager.expire_idle()
+
+def encode_response(status: int, payload: Dict[str, Any], keep_alive: bool = True) -> bytes:
+    reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {reasons.get(status, 'Error')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    server_state = ExamServer(SessionManager({}))
+    start_result_writer()
+    server = await asyncio.start_server(server_state.handle_connection, host, port)
+    print(f"Sınav sunucusu çalışıyor: http://{host}:{port}")
+    expire_task = asyncio.create_task(server_state.expire_loop())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        expire_task.cancel()
+        stop_result_writer()
+        get_storage().close()
+
+class HttpClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.host = host
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "HttpClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, host)
+
+    async def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None):
+        body = json.dumps(payload or {}, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        )
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+        status_line = await self.reader.readline()
+        status = int(status_line.split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            if key.strip().lower() == "content-length":
+                length = int(value.strip())
+        data = await self.reader.readexactly(length)
+        return status, json.loads(data.decode("utf-8"))
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+async def run_student(host: str, port: int, number: int, latency: LatencyRecorder) -> None:
+    client = await HttpClient.connect(host, port)
+    try:
+        started = time.perf_counter()
+        status, data = await client.request("POST", "/start", {"name": f"yuk-{number}", "teacher": "Admin"})
+        latency.add("/start", time.perf_counter() - started)
+        if status != 200:
+            return
+        token = data["token"]
+        question = data["question"]
+        while question is not None:
+            started = time.perf_counter()
+            status, data = await client.request(
+                "POST", "/answer", {"token": token, "choice": random.randrange(len(question["choices"]))}
+            )
+            latency.add("/answer", time.perf_counter() - started)
+            if status != 200:
+                return
+            question = data["question"]
+        started = time.perf_counter()
+        await client.request("POST", "/finish", {"token": token})
+        latency.add("/finish", time.perf_counter() - started)
+    finally:
+        await client.close()
+
+async def run_load(host: str, port: int, students: int, concurrency: int) -> Dict[str, Dict[str, float]]:
+    latency = LatencyRecorder(max_samples=students * 20)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(number: int) -> None:
+        async with semaphore:
+            await run_student(host, port, number, latency)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(limited(i) for i in range(students)))
+    elapsed = time.perf_counter() - started
+    summary = latency.summary()
+    print(f"{students} öğrenci, eşzamanlılık {concurrency}, süre {elapsed:.2f} sn")
+    for endpoint, stats in summary.items():
+        print(f"{endpoint:<8} adet: {stats['count']:>7}  p50: {stats['p50_ms']:.2f} ms  p99: {stats['p99_ms']:.2f} ms")
+    return summary
+
+def main(argv) -> int:
+    parser = argparse.ArgumentParser(description="Grafik arayüzsüz sınav sunucusu")
+    sub = parser.add_subparsers(dest="command", required=True)
+    serve_parser = sub.add_parser("serve")
+    serve_parser.add_argument("--host", default=DEFAULT_HOST)
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    load_parser = sub.add_parser("loadgen")
+    load_parser.add_argument("--host", default=DEFAULT_HOST)
+    load_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    load_parser.add_argument("--students", type=int, default=1000)
+    load_parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args(argv[1:])
+    try:
+        if args.command == "serve":
+            asyncio.run(serve(args.host, args.port))
+        else:
+            asyncio.run(run_load(args.host, args.port, args.students, args.concurrency))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -1,9 +1,8 @@
 import sys
-import random
-import json
-import os
+from bisect import bisect_right
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import Dict, Any
 from PyQt6.QtWidgets import (
     QApplication,
     QWidget,
@@ -14,735 +13,61 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QPlainTextEdit,
-    QListWidget,
+    QListView,
     QComboBox,
-    QTabWidget
+    QTabWidget,
+    QStackedWidget,
+    QTableView,
+    QHeaderView,
+    QAbstractItemView,
+    QProgressBar,
+    QCheckBox,
 )
-from PyQt6.QtCore import Qt, QTimer
-
-RESULTS_FILE = "results.json"
-QUESTIONS_FILE = "questions.json"
-TEACHERS_FILE = "teachers.json"
-STUDENTS_FILE = "students.json"
-TEACHER_PASSWORD = "Melomonik.21"
-
-LEVEL_POINTS = {
-    "Kolay": 1,
-    "Orta": 2,
-    "Zor": 3,
-}
-
-class Question:
-    def __init__(self, text: str, choices: List[str], answer: str, level: str) -> None:
-        self.text = text
-        self.choices = choices
-        self.answer = answer
-        self.level = level
-
-    def check_answer(self, answer: str) -> bool:
-        return self.answer == answer
-
-class Quiz:
-    def __init__(self, questions: List[Question], exam_end_time: datetime | None = None) -> None:
-        self.questions = questions
-        self.score = 0
-        self.index = 0
-        self.answered = 0
-        self.early_terminated = False
-        self.points = 0
-        self.max_points = 0
-        self.level_stats = {
-            "Kolay": {"correct": 0, "wrong": 0},
-            "Orta": {"correct": 0, "wrong": 0},
-            "Zor": {"correct": 0, "wrong": 0},
-        }
-        self.exam_end_time = exam_end_time
-
-    def has_more_questions(self) -> bool:
-        return self.index < len(self.questions)
-
-    def time_over(self) -> bool:
-        if self.exam_end_time is None:
-            return False
-        now = datetime.now()
-        if now >= self.exam_end_time:
-            self.early_terminated = True
-            self.index = len(self.questions)
-            return True
-        return False
-
-    def get_remaining_time(self) -> int:
-        if self.exam_end_time is None:
-            return -1
-        remaining = self.exam_end_time - datetime.now()
-        total = int(remaining.total_seconds())
-        if total < 0:
-            total = 0
-        return total
-
-    def get_current_question(self) -> "Question":
-        return self.questions[self.index]
-
-    def answer_current(self, choice_index: int) -> bool:
-        if self.time_over():
-            return False
-        soru = self.get_current_question()
-        soru_puan = LEVEL_POINTS.get(soru.level, 1)
-        self.max_points += soru_puan
-        secilen_cevap = soru.choices[choice_index]
-        correct = soru.check_answer(secilen_cevap)
-        if correct:
-            self.score += 1
-            self.points += soru_puan
-            self.level_stats[soru.level]["correct"] += 1
-        else:
-            self.level_stats[soru.level]["wrong"] += 1
-        self.index += 1
-        self.answered += 1
-        return correct
-
-    def get_results(self):
-        total_questions = len(self.questions)
-        total_answered = self.answered
-        correct = self.score
-        wrong = total_answered - correct
-        if total_answered > 0:
-            percent = (correct / total_answered) * 100
-        else:
-            percent = 0
-        if self.max_points > 0:
-            point_percent = (self.points / self.max_points) * 100
-        else:
-            point_percent = 0
-        level_label = get_level_label(point_percent)
-        return (
-            correct,
-            wrong,
-            percent,
-            total_answered,
-            total_questions,
-            self.points,
-            self.max_points,
-            point_percent,
-            level_label,
-            self.level_stats,
-        )
+from PyQt6.QtCore import (
+    Qt,
+    QTimer,
+    QAbstractTableModel,
+    QAbstractListModel,
+    QSortFilterProxyModel,
+    QModelIndex,
+)
+from theme import apply_theme
+from tasks import TaskRunner
+from quiz_core import (
+    Quiz,
+    AdaptiveQuiz,
+    analyze_weak_areas,
+    build_exam_record,
+    get_question_bank,
+    get_result_stats,
+    LEADERBOARD_SIZE,
+    EXAM_HISTORY_COLUMNS,
+    ExamRowCache,
+    load_results,
+    append_result,
+    load_custom_questions,
+    account_key,
+    get_teacher_registry,
+    get_student_registry,
+    get_storage,
+)
+from quiz_core.forms import draw_exam_questions
+from quiz_core.items import format_item_stat, log_exam_end, refresh_item_stats, start_answer_log
+from quiz_core.duplicates import add_to_question_index, duplicate_choices, get_question_index
+from quiz_core.search import QuestionCatalog, get_question_catalog
+from quiz_core.writer import start_result_writer, flush_results, stop_result_writer
 
-def get_level_label(point_percent: float) -> str:
-    if point_percent < 40:
-        return "Beginner"
-    elif point_percent < 70:
-        return "Intermediate"
-    else:
-        return "Advanced"
-
-def analyze_weak_areas(level_stats: dict) -> str:
-    infos = []
-    for level, stats in level_stats.items():
-        total = stats["correct"] + stats["wrong"]
-        if total == 0:
-            continue
-        acc = (stats["correct"] / total) * 100
-        infos.append((level, acc, total))
-    if not infos:
-        return "Bu sınavda soru cevaplanmadığı için seviye analizi yapılamadı."
-    weakest = min(infos, key=lambda x: x[1])
-    level_name, acc, total = weakest
-    if level_name == "Kolay":
-        extra = "Temel konuları biraz daha pekiştirmen iyi olur."
-    elif level_name == "Orta":
-        extra = "Orta seviye konularda (döngüler, fonksiyonlar, koleksiyonlar) biraz daha pratik yapabilirsin."
-    else:
-        extra = "İleri seviye konularda (OOP, generator, async, ileri fonksiyonlar) zorlanman normal; zamanla açılır."
-    return (
-        f"En çok zorlandığın seviye: {level_name} "
-        f"(doğruluk: {acc:.2f}%, toplam {total} soru). {extra}"
-    )
-
-def build_study_suggestions(level_label: str, level_stats: dict):
-    suggestions = []
-    if level_label == "Beginner":
-        suggestions.extend([
-            "Temel veri tipleri: int, float, str, bool",
-            "Karşılaştırma ve mantıksal operatörler",
-            "Koşul ifadeleri: if / elif / else",
-            "Temel döngüler: for ve while",
-            "Liste ve sözlük (list, dict) temelleri",
-        ])
-    elif level_label == "Intermediate":
-        suggestions.extend([
-            "Fonksiyon yazma ve parametreler (varsayılan parametreler dahil)",
-            "List, dict, set ve tuple ile pratik",
-            "List comprehension ve temel lambda kullanımı",
-            "try / except ile hata yönetimi",
-            "Dosya okuma/yazma (file I/O) ve with kullanımı",
-        ])
-    else:
-        suggestions.extend([
-            "Nesne yönelimli programlama: class, __init__, miras (inheritance)",
-            "Generator ve iterator mantığı, yield kullanımı",
-            "Decorators ve ileri fonksiyonel programlama",
-            "Asenkron programlama: async / await",
-            "Sanal ortam (virtualenv) ve paket yönetimi (pip)",
-        ])
-    infos = []
-    for level, stats in level_stats.items():
-        total = stats["correct"] + stats["wrong"]
-        if total == 0:
-            continue
-        acc = (stats["correct"] / total) * 100
-        infos.append((level, acc, total))
-    if infos:
-        weakest = min(infos, key=lambda x: x[1])
-        level_name, acc, total = weakest
-        if level_name == "Kolay":
-            suggestions.extend([
-                "Değişken tanımlama ve isimlendirme kuralları",
-                "Temel aritmetik işlemler ve öncelik kuralları",
-                "Basit döngü örnekleri ile pratik",
-            ])
-        elif level_name == "Orta":
-            suggestions.extend([
-                "List/dict işlemleri (append, pop, insert, keys vs.)",
-                "range, enumerate, map, filter gibi fonksiyonları tekrar et",
-                "String dilimleme ve formatlama (format, f-string)",
-            ])
-        else:
-            suggestions.extend([
-                "Decorator ve context manager örnekleri incele",
-                "PEP 8 stil rehberini gözden geçir",
-                "Gerçek projelerde OOP tasarım örneklerine bak",
-            ])
-    seen = set()
-    unique_suggestions = []
-    for s in suggestions:
-        if s not in seen:
-            seen.add(s)
-            unique_suggestions.append(s)
-    return unique_suggestions
-
-def load_results() -> Dict[str, Any]:
-    if not os.path.exists(RESULTS_FILE):
-        return {}
-    try:
-        with open(RESULTS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
-
-def save_results(data: Dict[str, Any]) -> None:
-    with open(RESULTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def load_custom_questions() -> Dict[str, list]:
-    if not os.path.exists(QUESTIONS_FILE):
-        return {"easy": [], "medium": [], "hard": []}
-    try:
-        with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return {
-            "easy": data.get("easy", []),
-            "medium": data.get("medium", []),
-            "hard": data.get("hard", []),
-        }
-    except Exception:
-        return {"easy": [], "medium": [], "hard": []}
-
-def save_custom_questions(data: Dict[str, list]) -> None:
-    with open(QUESTIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def save_teachers(data: list) -> None:
-    with open(TEACHERS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def load_teachers() -> list:
-    if not os.path.exists(TEACHERS_FILE):
-        data = [{"name": "Admin", "password": TEACHER_PASSWORD}]
-        save_teachers(data)
-        return data
-    try:
-        with open(TEACHERS_FILE, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except Exception:
-        data = [{"name": "Admin", "password": TEACHER_PASSWORD}]
-        save_teachers(data)
-        return data
-    normalized = []
-    if isinstance(raw, list):
-        for item in raw:
-            if isinstance(item, dict):
-                name = item.get("name", "")
-                pwd = item.get("password", TEACHER_PASSWORD)
-                if name:
-                    normalized.append({"name": name, "password": pwd})
-            elif isinstance(item, str):
-                normalized.append({"name": item, "password": TEACHER_PASSWORD})
-    else:
-        normalized = [{"name": "Admin", "password": TEACHER_PASSWORD}]
-    save_teachers(normalized)
-    return normalized
-
-def save_students(data: list) -> None:
-    with open(STUDENTS_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
-def load_students() -> list:
-    if not os.path.exists(STUDENTS_FILE):
-        return []
-    try:
-        with open(STUDENTS_FILE, "r", encoding="utf-8") as f:
-            raw = json.load(f)
-    except Exception:
-        return []
-    students = []
-    if isinstance(raw, list):
-        for item in raw:
-            if isinstance(item, dict):
-                name = item.get("name", "")
-                pwd = item.get("password", "")
-                if name:
-                    students.append({"name": name, "password": pwd})
-            elif isinstance(item, str):
-                students.append({"name": item, "password": ""})
-    save_students(students)
-    return students
-
-def build_question_bank():
-    easy = [
-        Question("Python dosya uzantısı nedir?",
-                 [".pt", ".py", ".python", ".pyt"], ".py", "Kolay"),
-        Question("Python'da ekrana yazdırmak için hangi fonksiyon kullanılır?",
-                 ["echo()", "print()", "write()", "out()"], "print()", "Kolay"),
-        Question("Python'da bir satır yorum nasıl başlar?",
-                 ["//", "#", "/*", "<!--"], "#", "Kolay"),
-        Question("Aşağıdakilerden hangisi geçerli bir değişken adıdır?",
-                 ["1sayi", "sayi_1", "sayi-1", "sayi 1"], "sayi_1", "Kolay"),
-        Question("type(10) ifadesinin sonucu hangi veri tipidir?",
-                 ["int", "float", "str", "bool"], "int", "Kolay"),
-        Question("type(3.14) ifadesinin sonucu hangi veri tipidir?",
-                 ["int", "float", "str", "bool"], "float", "Kolay"),
-        Question("'Merhaba' hangi veri tipidir?",
-                 ["int", "float", "str", "bool"], "str", "Kolay"),
-        Question("True ve False hangi veri tipine aittir?",
-                 ["int", "str", "bool", "float"], "bool", "Kolay"),
-        Question("Aşağıdakilerden hangisi liste tanımıdır?",
-                 ["(1, 2, 3)", "{1, 2, 3}", "[1, 2, 3]", "\"1,2,3\""],
-                 "[1, 2, 3]", "Kolay"),
-        Question("len([10, 20, 30]) sonucu nedir?",
-                 ["2", "3", "4", "Hata verir"], "3", "Kolay"),
-        Question("Python'da atama operatörü hangisidir?",
-                 ["==", "=", ":=", "=>"], "=", "Kolay"),
-        Question("5 + 3 * 2 işleminin sonucu nedir?",
-                 ["16", "11", "13", "10"], "11", "Kolay"),
-        Question("a = 10; b = 3; a % b sonucu nedir?",
-                 ["0", "1", "3", "Hata verir"], "1", "Kolay"),
-        Question("input() fonksiyonu ne yapar?",
-                 ["Ekrana yazar", "Klavye girişini okur", "Dosya açar", "Programı sonlandırır"],
-                 "Klavye girişini okur", "Kolay"),
-        Question("a = 'Python'; a[0] nedir?",
-                 ["'P'", "'y'", "'n'", "Hata verir"], "'P'", "Kolay"),
-        Question("a = [1, 2, 3]; a[1] nedir?",
-                 ["1", "2", "3", "Hata verir"], "2", "Kolay"),
-        Question("Aşağıdakilerden hangisi tuple tanımıdır?",
-                 ["[1, 2, 3]", "(1, 2, 3)", "{1, 2, 3}", "\"1,2,3\""],
-                 "(1, 2, 3)", "Kolay"),
-        Question("Aşağıdakilerden hangisi sözlük (dict) tanımıdır?",
-                 ["[1, 2, 3]", "(1, 2, 3)", "{\"ad\": \"Ali\"}", "{1, 2, 3}"],
-                 "{\"ad\": \"Ali\"}", "Kolay"),
-        Question("3 == 3 ifadesinin sonucu nedir?",
-                 ["True", "False", "3", "Hata verir"], "True", "Kolay"),
-        Question("3 != 5 ifadesinin sonucu nedir?",
-                 ["True", "False", "5", "Hata verir"], "True", "Kolay"),
-        Question("not True ifadesi ne döndürür?",
-                 ["True", "False", "None", "Hata verir"], "False", "Kolay"),
-        Question("a = 5; a += 2 sonrası a nedir?",
-                 ["5", "7", "2", "Hata verir"], "7", "Kolay"),
-        Question("Python'da 've' anlamına gelen mantıksal operatör hangisidir?",
-                 ["and", "or", "not", "&"], "and", "Kolay"),
-        Question("Python'da 'veya' anlamına gelen mantıksal operatör hangisidir?",
-                 ["and", "or", "not", "|"], "or", "Kolay"),
-        Question("Boş liste nasıl tanımlanır?",
-                 ["()", "{}", "[]", "''"], "[]", "Kolay"),
-        Question("Boş string nasıl tanımlanır?",
-                 ["[]", "{}", "''", "None"], "''", "Kolay"),
-        Question("None neyi ifade eder?",
-                 ["0", "Boş string", "Hiçlik/değer yok", "False"],
-                 "Hiçlik/değer yok", "Kolay"),
-        Question("Python'da bloklar nasıl ayrılır?",
-                 ["Parantez ile", "Virgül ile", "Girinti (indent) ile", "Noktalı virgül ile"],
-                 "Girinti (indent) ile", "Kolay"),
-        Question("Aşağıdakilerden hangisi Python anahtar kelimesidir?",
-                 ["number", "value", "if", "string"], "if", "Kolay"),
-        Question("Hangi ifade sözlükteki anahtar sayısını verir?",
-                 ["len(dict)", "size(dict)", "count(dict)", "length(dict)"],
-                 "len(dict)", "Kolay"),
-    ]
-
-    medium = [
-        Question("a = 'Python'; a[1:4] ifadesinin sonucu nedir?",
-                 ["'Pyt'", "'yth'", "'ytho'", "'Pyt'"], "'yth'", "Orta"),
-        Question("range(1, 4) hangi değerleri üretir?",
-                 ["1, 2, 3", "1, 2, 3, 4", "0, 1, 2", "2, 3, 4"], "1, 2, 3", "Orta"),
-        Question("for i in range(3): print(i) çıktısı nedir?",
-                 ["0 1 2", "1 2 3", "0 1 2 3", "1 2"], "0 1 2", "Orta"),
-        Question("while döngüsü için doğru ifade hangisidir?",
-                 ["Koşul sağlandığı sürece döner", "Sadece bir kez çalışır",
-                  "Her zaman sonsuz döngüdür", "For döngüsüyle aynıdır"],
-                 "Koşul sağlandığı sürece döner", "Orta"),
-        Question("break ifadesi ne yapar?",
-                 ["Döngüyü sonlandırır", "Döngüyü atlar", "Değişkeni siler", "Fonksiyonu bitirir"],
-                 "Döngüyü sonlandırır", "Orta"),
-        Question("continue ifadesi ne yapar?",
-                 ["Döngüyü tamamen bitirir", "O turu atlayıp döngüye devam eder",
-                  "Hata fırlatır", "Fonksiyonu sonlandırır"],
-                 "O turu atlayıp döngüye devam eder", "Orta"),
-        Question("def fonksiyon(): tanımında hangi anahtar kelime kullanılır?",
-                 ["function", "def", "fun", "lambda"], "def", "Orta"),
-        Question("return ifadesi ne yapar?",
-                 ["Fonksiyondan değer döndürür", "Döngüyü sonlandırır",
-                  "Değişken tanımlar", "Modül yükler"],
-                 "Fonksiyondan değer döndürür", "Orta"),
-        Question("a = [1, 2, 3]; a.append(4) sonrası a nedir?",
-                 ["[1, 2, 3]", "[1, 2, 3, 4]", "[4, 1, 2, 3]", "[1, 2, 4]"],
-                 "[1, 2, 3, 4]", "Orta"),
-        Question("a = [1, 2, 3]; a.insert(1, 10) sonrası a nedir?",
-                 ["[1, 10, 2, 3]", "[10, 1, 2, 3]", "[1, 2, 10, 3]", "[1, 2, 3, 10]"],
-                 "[1, 10, 2, 3]", "Orta"),
-        Question("a = [1, 2, 3]; a.pop() sonrası a nedir?",
-                 ["[1, 2]", "[2, 3]", "[1, 3]", "[]"], "[1, 2]", "Orta"),
-        Question("a = {\"ad\": \"Ali\", \"yas\": 20}; a[\"ad\"] nedir?",
-                 ["\"Ali\"", "20", "\"ad\"", "Hata verir"], "\"Ali\"", "Orta"),
-        Question("dict.keys() ne döndürür?",
-                 ["Anahtarları", "Değerleri", "Hem anahtar hem değerleri", "Uzunluğu"],
-                 "Anahtarları", "Orta"),
-        Question("set veri tipinin özelliği nedir?",
-                 ["Sıralıdır", "Tekrar eden eleman tutmaz", "İndekslenebilir", "Sadece int tutar"],
-                 "Tekrar eden eleman tutmaz", "Orta"),
-        Question("a = [1, 2, 3]; b = a; b.append(4) sonrası a nedir?",
-                 ["[1, 2, 3]", "[1, 2, 3, 4]", "[4, 1, 2, 3]", "Hata verir"],
-                 "[1, 2, 3, 4]", "Orta"),
-        Question("a = [1, 2, 3]; b = a.copy(); b.append(4) sonrası a nedir?",
-                 ["[1, 2, 3]", "[1, 2, 3, 4]", "[4, 1, 2, 3]", "Hata verir"],
-                 "[1, 2, 3]", "Orta"),
-        Question("Fonksiyon parametresinde varsayılan değer nasıl verilir?",
-                 ["def f(a, b: 0)", "def f(a, b = 0)", "def f(a, b == 0)", "def f(a, b := 0)"],
-                 "def f(a, b = 0)", "Orta"),
-        Question("try/except yapısı ne için kullanılır?",
-                 ["Döngü yazmak için", "Koşul yazmak için", "Hata yakalamak için", "Fonksiyon tanımlamak için"],
-                 "Hata yakalamak için", "Orta"),
-        Question("open('dosya.txt', 'r') ne yapar?",
-                 ["Dosyayı okuma modunda açar", "Dosyayı yazma modunda açar",
-                  "Dosyayı siler", "Hiçbir şey yapmaz"],
-                 "Dosyayı okuma modunda açar", "Orta"),
-        Question("with open('dosya.txt', 'r') as f: yapısı ne sağlar?",
-                 ["Otomatik dosya kapatma", "Dosyanın kopyasını oluşturma",
-                  "Dosyayı şifreleme", "Hiçbir şey"],
-                 "Otomatik dosya kapatma", "Orta"),
-        Question("modül içe aktarmak için hangi ifade kullanılır?",
-                 ["include math", "using math", "import math", "require math"],
-                 "import math", "Orta"),
-        Question("Aşağıdakilerden hangisi gömülü bir Python fonksiyonudur?",
-                 ["len()", "size()", "length()", "count()"],
-                 "len()", "Orta"),
-        Question("map(f, liste) ifadesi ne döndürür?",
-                 ["Liste", "Iterator", "Set", "Sözlük"],
-                 "Iterator", "Orta"),
-        Question("filter(f, liste) ne yapar?",
-                 ["Listeyi sıralar", "Listeyi ters çevirir", "Şarta uyanları süzer", "Listeyi kopyalar"],
-                 "Şarta uyanları süzer", "Orta"),
-        Question("sorted([3, 1, 2]) sonucu nedir?",
-                 ["[3, 2, 1]", "[1, 2, 3]", "[2, 1, 3]", "Hata verir"],
-                 "[1, 2, 3]", "Orta"),
-        Question("join() hangi veri tipiyle kullanılır?",
-                 ["int", "list of int", "list of str", "dict"],
-                 "list of str", "Orta"),
-        Question("'-'.join(['a', 'b', 'c']) sonucu nedir?",
-                 ["'abc'", "'a-b-c'", "'a-bc'", "'ab-c'"],
-                 "'a-b-c'", "Orta"),
-        Question("formatlama için doğru ifade hangisidir?",
-                 ["'Merhaba {}'.format('Ali')", "'Merhaba'.format('Ali')",
-                  "format('Merhaba', 'Ali')", "'Merhaba' + format('Ali')"],
-                 "'Merhaba {}'.format('Ali')", "Orta"),
-        Question("f-string kullanımına örnek hangisidir?",
-                 ["'Merhaba {isim}'", "f'Merhaba {isim}'",
-                  "f('Merhaba {isim}')", "format('Merhaba {isim}')"],
-                 "f'Merhaba {isim}'", "Orta"),
-        Question(
-            "enumerate(liste) ne sağlar?",
-            ["Sadece indeksleri verir", "Sadece değerleri verir",
-             "Hem indeks hem değeri verir", "Hiçbir şey"],
-            "Hem indeks hem değeri verir", "Orta"),
-    ]
-
-    hard = [
-        Question("[x for x in range(5) if x % 2 == 0] sonucu nedir?",
-                 ["[0, 1, 2, 3, 4]", "[1, 3]", "[0, 2, 4]", "[2, 4]"],
-                 "[0, 2, 4]", "Zor"),
-        Question("lambda x: x * 2 ifadesi neyi temsil eder?",
-                 ["Sınıf", "Anonim fonksiyon", "Modül", "Paket"],
-                 "Anonim fonksiyon", "Zor"),
-        Question("def f(*args) ifadesinde *args ne işe yarar?",
-                 ["İstenilen sayıda konumsal argüman alır",
-                  "İstenilen sayıda anahtar argüman alır",
-                  "Hiç argüman almaz", "Sadece bir argüman alır"],
-                 "İstenilen sayıda konumsal argüman alır", "Zor"),
-        Question("def f(**kwargs) ifadesi ne işe yarar?",
-                 ["İstenilen sayıda konumsal argüman alır",
-                  "İstenilen sayıda anahtar argüman alır",
-                  "Liste döndürür", "Set döndürür"],
-                 "İstenilen sayıda anahtar argüman alır", "Zor"),
-        Question("Generator fonksiyon oluşturmak için hangi anahtar kelime kullanılır?",
-                 ["yield", "return", "generate", "async"],
-                 "yield", "Zor"),
-        Question("class A:\n    def __init__(self):\n        self.x = 10\n__init__ ne işe yarar?",
-                 ["Modül yükler", "Yapıcı metoddur, nesneyi başlatır",
-                  "Sınıfı siler", "Hiçbir özel anlamı yoktur"],
-                 "Yapıcı metoddur, nesneyi başlatır", "Zor"),
-        Question("Miras alma (inheritance) için hangi söz dizimi kullanılır?",
-                 ["class B -> A:", "class B(A):", "class B:A", "class B = A:"],
-                 "class B(A):", "Zor"),
-        Question("raise ValueError('hata') ne yapar?",
-                 ["Hata mesajını ekrana yazar", "ValueError istisnası fırlatır",
-                  "Programı kapatır", "Hiçbir şey"],
-                 "ValueError istisnası fırlatır", "Zor"),
-        Question("try/except/finally yapısında finally ne zaman çalışır?",
-                 ["Sadece hata olunca", "Sadece hata olmayınca",
-                  "Her durumda", "Hiç çalışmaz"],
-                 "Her durumda", "Zor"),
-        Question("Decorator ne için kullanılır?",
-                 ["Fonksiyonu silmek için", "Fonksiyona ekstra davranış eklemek için",
-                  "Modül oluşturmak için", "Değişken tanımlamak için"],
-                 "Fonksiyona ekstra davranış eklemek için", "Zor"),
-        Question("@decorator ifadesi neyi temsil eder?",
-                 ["Sınıf tanımı", "Decorator uygulaması",
-                  "Modül importu", "Generator"],
-                 "Decorator uygulaması", "Zor"),
-        Question("__str__ metodu ne zaman çağrılır?",
-                 ["Nesne oluşturulurken", "Nesne silinirken",
-                  "str(nesne) veya print(nesne) çağrıldığında", "Hiç çağrılmaz"],
-                 "str(nesne) veya print(nesne) çağrıldığında", "Zor"),
-        Question("__len__ metodu ne işe yarar?",
-                 ["Toplama yapar", "Uzunluk döndürür", "Karşılaştırma yapar", "Hata fırlatır"],
-                 "Uzunluk döndürür", "Zor"),
-        Question("İteratör protokolü hangi metodları gerektirir?",
-                 ["__iter__ ve __next__", "__add__ ve __sub__",
-                  "__init__ ve __del__", "__get__ ve __set__"],
-                 "__iter__ ve __next__", "Zor"),
-        Question("list(map(lambda x: x*2, [1, 2, 3])) sonucu nedir?",
-                 ["[1, 2, 3]", "[2, 4, 6]", "[0, 1, 2]", "[1, 4, 9]"],
-                 "[2, 4, 6]", "Zor"),
-        Question("list(filter(lambda x: x % 2 == 0, [1, 2, 3, 4])) sonucu nedir?",
-                 ["[1, 3]", "[2, 4]", "[1, 2, 3, 4]", "[]"],
-                 "[2, 4]", "Zor"),
-        Question("list comprehension ile kareler listesi nasıl oluşturulur?",
-                 ["[x**2 for x in liste]", "[x for x**2 in liste]",
-                  "x**2 in liste", "map(x**2, liste)"],
-                 "[x**2 for x in liste]", "Zor"),
-        Question("from modul import * ifadesinin sakıncası nedir?",
-                 ["Hiçbir sakıncası yoktur", "İsim çakışmalarına yol açabilir",
-                  "Modülü siler", "Performansı her zaman düşürür"],
-                 "İsim çakışmalarına yol açabilir", "Zor"),
-        Question("virtual environment (sanal ortam) ne için kullanılır?",
-                 ["İşletim sistemini değiştirmek için",
-                  "Projeye özel bağımlılık yönetimi için",
-                  "Dosya silmek için", "Python sürümünü silmek için"],
-                 "Projeye özel bağımlılık yönetimi için", "Zor"),
-        Question("JSON verisi Python'da hangi tipe dönüştürülür?",
-                 ["Her zaman list", "Her zaman dict",
-                  "JSON içeriğine göre list/dict", "Her zaman str"],
-                 "JSON içeriğine göre list/dict", "Zor"),
-        Question("open('dosya.txt', 'wb') modu ne yapar?",
-                 ["Metin okur", "Metin yazar", "Binary yazar", "Binary okur"],
-                 "Binary yazar", "Zor"),
-        Question("async/await yapısı ne için kullanılır?",
-                 ["Çoklu miras için", "Asenkron programlama için",
-                  "Dosya yönetimi için", "Dekorator tanımı için"],
-                 "Asenkron programlama için", "Zor"),
-        Question("list(set([1, 1, 2, 2, 3])) sonucu nedir?",
-                 ["[1, 1, 2, 2, 3]", "[1, 2, 3]", "[3, 2, 1]", "Sırasız bir liste, tekrar yok"],
-                 "Sırasız bir liste, tekrar yok", "Zor"),
-        Question("a = {1, 2, 3}; b = {3, 4, 5}; a & b nedir?",
-                 ["{1, 2, 3, 4, 5}", "{1, 2}", "{3}", "Boş küme"],
-                 "{3}", "Zor"),
-        Question("a = {1, 2, 3}; b = {3, 4, 5}; a | b nedir?",
-                 ["{1, 2, 3, 4, 5}", "{1, 2}", "{3}", "Boş küme"],
-                 "{1, 2, 3, 4, 5}", "Zor"),
-        Question("context manager ne sağlar?",
-                 ["Bellek yönetimi yapar",
-                  "Kaynağın güvenli açılıp kapatılmasını sağlar",
-                  "Değişkenleri siler", "Sadece dosya okur"],
-                 "Kaynağın güvenli açılıp kapatılmasını sağlar", "Zor"),
-        Question("__name__ == '__main__' kontrolü ne için kullanılır?",
-                 ["Modülü silmek için",
-                  "Dosya direkt çalıştırıldığında kod bloğunu çalıştırmak için",
-                  "Her zaman import etmek için", "Hiçbir şey için"],
-                 "Dosya direkt çalıştırıldığında kod bloğunu çalıştırmak için", "Zor"),
-        Question("logging modülü ne için kullanılır?",
-                 ["Rastgele sayı üretmek için",
-                  "Loglama ve kayıt tutmak için",
-                  "Şifreleme için", "Dosya silmek için"],
-                 "Loglama ve kayıt tutmak için", "Zor"),
-        Question("pip ne için kullanılır?",
-                 ["Python sürümünü güncellemek için",
-                  "Python paketlerini yönetmek için",
-                  "İşletim sistemi kurmak için", "Veritabanı yönetmek için"],
-                 "Python paketlerini yönetmek için", "Zor"),
-        Question("PEP 8 neyi ifade eder?",
-                 ["Standart kütüphane", "Python stil rehberi",
-                  "Paket yöneticisi", "Veritabanı arayüzü"],
-                 "Python stil rehberi", "Zor"),
-    ]
-
-    extra = load_custom_questions()
-    for qd in extra["easy"]:
-        easy.append(Question(qd["text"], qd["choices"], qd["answer"], "Kolay"))
-    for qd in extra["medium"]:
-        medium.append(Question(qd["text"], qd["choices"], qd["answer"], "Orta"))
-    for qd in extra["hard"]:
-        hard.append(Question(qd["text"], qd["choices"], qd["answer"], "Zor"))
-    return easy, medium, hard
-
-def build_exam_questions(easy, medium, hard, per_level=5):
-    if len(easy) < per_level or len(medium) < per_level or len(hard) < per_level:
-        raise ValueError("Her seviye için yeterli sayıda soru yok.")
-    selected_easy = random.sample(easy, per_level)
-    selected_medium = random.sample(medium, per_level)
-    selected_hard = random.sample(hard, per_level)
-    questions = selected_easy + selected_medium + selected_hard
-    random.shuffle(questions)
-    return questions
-
-def build_teacher_general_report(results: Dict[str, Any]) -> str:
-    if not results:
-        return "Kayıtlı hiçbir öğrenci bulunamadı."
-    lines = []
-    lines.append("ÖĞRETMEN PANELİ - GENEL RAPOR")
-    lines.append("")
-    students_stats = []
-    for name, records in results.items():
-        if not records:
-            continue
-        total_exams = len(records)
-        last_exam = records[-1]
-        best_points = max((r.get("points", 0) for r in records), default=0)
-        avg_percent = sum(r.get("percent", 0) for r in records) / total_exams
-        last_date = last_exam.get("datetime", "?")
-        last_level = last_exam.get("level_label", "?")
-        students_stats.append({
-            "name": name,
-            "total_exams": total_exams,
-            "last_date": last_date,
-            "best_points": best_points,
-            "avg_percent": avg_percent,
-            "last_level": last_level,
-        })
-    lines.append("[Öğrenci Bazlı Özet]")
-    lines.append("-" * 60)
-    for s in students_stats:
-        lines.append(
-            f"Öğrenci : {s['name']}\n"
-            f"  Toplam Sınav   : {s['total_exams']}\n"
-            f"  Son Sınav      : {s['last_date']}\n"
-            f"  En Yüksek Puan : {s['best_points']}\n"
-            f"  Ortalama Yüzde : {s['avg_percent']:.2f}%\n"
-            f"  Son Seviye     : {s['last_level']}\n"
-            + "-" * 60
-        )
-    by_best_points = sorted(
-        students_stats, key=lambda x: x["best_points"], reverse=True
-    )
-    by_avg_percent = sorted(
-        students_stats, key=lambda x: x["avg_percent"], reverse=True
-    )
-    by_total_exams = sorted(
-        students_stats, key=lambda x: x["total_exams"], reverse=True
-    )
-    lines.append("")
-    lines.append("[En Yüksek Puan Sıralaması]")
-    lines.append("-" * 60)
-    for i, s in enumerate(by_best_points, start=1):
-        lines.append(f"{i:>2}) {s['name']:<20}  En Yüksek Puan: {s['best_points']}  | Son Seviye: {s['last_level']}")
-    lines.append("")
-    lines.append("[Ortalama Başarı Yüzdesi Sıralaması]")
-    lines.append("-" * 60)
-    for i, s in enumerate(by_avg_percent, start=1):
-        lines.append(f"{i:>2}) {s['name']:<20}  Ortalama: {s['avg_percent']:.2f}%  | Son Seviye: {s['last_level']}")
-    lines.append("")
-    lines.append("[En Çok Sınava Giren Öğrenciler]")
-    lines.append("-" * 60)
-    for i, s in enumerate(by_total_exams, start=1):
-        lines.append(f"{i:>2}) {s['name']:<20}  Sınav Sayısı: {s['total_exams']}  | Son Seviye: {s['last_level']}")
-    level_counts = {"Beginner": 0, "Intermediate": 0, "Advanced": 0, "Diğer": 0}
-    for s in students_stats:
-        lvl = s["last_level"]
-        if lvl in level_counts:
-            level_counts[lvl] += 1
-        else:
-            level_counts["Diğer"] += 1
-    lines.append("")
-    lines.append("[Son Sınavlara Göre Seviye Dağılımı]")
-    lines.append("-" * 60)
-    for lvl, count in level_counts.items():
-        lines.append(f"{lvl:<12}: {count} öğrenci")
-    return "\n".join(lines)
-
-def build_teacher_student_detail_text(results: Dict[str, Any], name: str) -> str:
-    records = results.get(name, [])
-    if not records:
-        return "Bu öğrencinin kayıtlı sınavı yok."
-    lines = []
-    lines.append(f"ÖĞRENCİ DETAY RAPORU - {name}")
-    lines.append("=" * 50)
-    for i, rec in enumerate(records, start=1):
-        lines.append(f"\n--- Sınav #{i} ---")
-        lines.append(f"Tarih          : {rec.get('datetime', '?')}")
-        lines.append(f"Doğru / Yanlış : {rec.get('correct', '?')} / {rec.get('wrong', '?')}")
-        lines.append(f"Cevaplanan     : {rec.get('answered', '?')} / {rec.get('total_questions', '?')}")
-        lines.append(f"Yüzde          : {rec.get('percent', 0):.2f}%")
-        if "points" in rec and "max_points" in rec:
-            lines.append(
-                f"Puan           : {rec['points']}/{rec['max_points']} "
-                f"({rec.get('point_percent', 0):.2f}%)"
-            )
-        if "level_label" in rec:
-            lines.append(f"Seviye etiketi : {rec['level_label']}")
-        if rec.get("early_terminated"):
-            lines.append("Not            : Bu sınav erken sonlandırılmış.")
-        teacher_name = rec.get("teacher", None)
-        if teacher_name:
-            lines.append(f"Öğretmen       : {teacher_name}")
-        lines.append("-" * 50)
-    return "\n".join(lines)
+# Çıkışta bekleyen sonuç yazımları için üst sınır (sn).
+RESULT_FLUSH_TIMEOUT = 10.0
 
 class ModeWindow(QWidget):
-    def __init__(self, results: Dict[str, Any], teachers: list):
+    def __init__(self, main_window: "MainWindow"):
         super().__init__()
-        self.results = results
-        self.teachers = teachers
+        self.main_window = main_window
         self.setWindowTitle("Python Sınav Sistemi")
-        self.setFixedSize(650, 500)
-        self.setStyleSheet(
-            "QWidget {"
-            "  background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1,"
-            "    stop:0 #020617, stop:1 #0b1120);"
-            "  color: white;"
-            "}"
-            "QPushButton {"
-            "  background-color: #2563eb;"
-            "  color: white;"
-            "  border-radius: 12px;"
-            "  padding: 10px;"
-            "  font-size: 16px;"
-            "  font-weight: 500;"
-            "}"
-            "QPushButton:hover {"
-            "  background-color: #3b82f6;"
-            "}"
-            "QLabel {"
-            "  font-size: 14px;"
-            "}"
-        )
+        self.page_size = (650, 500)
+        self.setObjectName("modePage")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(40, 30, 40, 30)
         main_layout.setSpacing(15)
@@ -750,38 +75,32 @@ class ModeWindow(QWidget):
         header_layout.setSpacing(4)
         logo_label = QLabel("🐍")
         logo_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        logo_label.setStyleSheet("font-size: 44px;")
+        logo_label.setObjectName("logoLabel")
         header_layout.addWidget(logo_label)
         title_label = QLabel("Python Sınav Sistemi")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold;")
+        title_label.setObjectName("heroTitle")
         header_layout.addWidget(title_label)
         subtitle = QLabel("Seviyene göre Python testleri, detaylı analiz ve öğretmen paneli")
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: #9ca3af; font-size: 13px;")
+        subtitle.setObjectName("mutedLabel")
         subtitle.setWordWrap(True)
         header_layout.addWidget(subtitle)
         main_layout.addLayout(header_layout)
         main_layout.addStretch()
         card = QWidget()
-        card.setStyleSheet(
-            "QWidget {"
-            "  background-color: rgba(15, 23, 42, 0.9);"
-            "  border-radius: 18px;"
-            "  border: 1px solid #1d4ed8;"
-            "}"
-        )
+        card.setObjectName("modeCard")
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(24, 22, 24, 22)
         card_layout.setSpacing(16)
         card_title = QLabel("Giriş Modu Seçimi")
         card_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        card_title.setStyleSheet("font-size: 16px; font-weight: bold;")
+        card_title.setObjectName("cardTitle")
         card_layout.addWidget(card_title)
         card_desc = QLabel("Öğrenci olarak sınava girebilir veya öğretmen paneline erişebilirsin.")
         card_desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
         card_desc.setWordWrap(True)
-        card_desc.setStyleSheet("color: #9ca3af; font-size: 13px;")
+        card_desc.setObjectName("mutedLabel")
         card_layout.addWidget(card_desc)
         card_layout.addSpacing(8)
         btn_col_layout = QVBoxLayout()
@@ -797,7 +116,7 @@ class ModeWindow(QWidget):
         card_layout.addLayout(btn_col_layout)
         hint_label = QLabel("İpucu: Öğrenciler önce öğretmenini seçerek sınava girer.")
         hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        hint_label.setStyleSheet("color: #6b7280; font-size: 12px; margin-top: 4px;")
+        hint_label.setObjectName("hintLabel")
         card_layout.addWidget(hint_label)
         main_layout.addWidget(card)
         main_layout.addStretch()
@@ -807,43 +126,30 @@ class ModeWindow(QWidget):
         self.register_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
         self.register_label.setOpenExternalLinks(False)
         self.register_label.linkActivated.connect(self.open_teacher_register)
-        self.register_label.setStyleSheet("font-size: 13px;")
+        self.register_label.setObjectName("linkLabel")
         main_layout.addWidget(self.register_label)
 
     def open_student_login(self):
-        self.login_window = LoginWindow("student", self.results, self.teachers)
-        self.login_window.show()
-        self.close()
+        self.main_window.show_login("student")
 
     def open_teacher_login(self):
-        self.login_window = LoginWindow("teacher", self.results, self.teachers)
-        self.login_window.show()
-        self.close()
+        self.main_window.show_login("teacher")
 
     def open_teacher_register(self):
-        self.register_window = TeacherRegisterWindow(self.results, self.teachers)
-        self.register_window.show()
-        self.close()
+        self.main_window.show_register()
 
 class TeacherRegisterWindow(QWidget):
-    def __init__(self, results: Dict[str, Any], teachers: list):
+    def __init__(self, main_window: "MainWindow"):
         super().__init__()
-        self.results = results
-        self.teachers = teachers
+        self.main_window = main_window
         self.setWindowTitle("Öğretmen Kaydı")
-        self.setFixedSize(480, 320)
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 8px; font-size: 14px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLineEdit {background-color: #020617; color: white; padding: 8px; border-radius: 8px; border: 1px solid #1d4ed8;}"
-            "QLabel {font-size: 14px;}"
-        )
+        self.page_size = (480, 320)
+        self.setObjectName("registerPage")
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         title = QLabel("Yeni Öğretmen Kaydı")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         self.name_label = QLabel("Öğretmen Ad Soyad:")
         self.name_edit = QLineEdit()
@@ -863,11 +169,12 @@ class TeacherRegisterWindow(QWidget):
         btn_layout.addWidget(self.save_btn)
         layout.addLayout(btn_layout)
 
+    def activate(self):
+        self.name_edit.clear()
+        self.password_edit.clear()
+
     def go_back(self):
-        teachers = load_teachers()
-        self.mode_window = ModeWindow(self.results, teachers)
-        self.mode_window.show()
-        self.close()
+        self.main_window.show_mode()
 
     def save_teacher(self):
         name = self.name_edit.text().strip()
@@ -875,13 +182,9 @@ class TeacherRegisterWindow(QWidget):
         if not name or not pwd:
             QMessageBox.warning(self, "Hata", "İsim ve şifre boş bırakılamaz.")
             return
-        teachers = load_teachers()
-        for t in teachers:
-            if t.get("name", "").lower() == name.lower():
-                QMessageBox.warning(self, "Hata", "Bu isimde bir öğretmen zaten mevcut.")
-                return
-        teachers.append({"name": name, "password": pwd})
-        save_teachers(teachers)
+        if get_teacher_registry().add(name, pwd) is None:
+            QMessageBox.warning(self, "Hata", "Bu isimde bir öğretmen zaten mevcut.")
+            return
         QMessageBox.information(self, "Başarılı", "Öğretmen kaydı oluşturuldu.")
         self.go_back()
 
@@ -899,15 +202,7 @@ class PasswordChangeWindow(QWidget):
         # YÜKSEKLİĞİ ARTIRDIM (260 → 310)
         self.setFixedSize(420, 310)
 
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; "
-            "border-radius: 10px; padding: 8px; font-size: 14px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLineEdit {background-color: #020617; color: white; padding: 8px; "
-            "border-radius: 8px; border: 1px solid #1d4ed8;}"
-            "QLabel {font-size: 14px;}"
-        )
+        self.setObjectName("passwordPage")
 
         layout = QVBoxLayout(self)
         # Biraz daha sıkı ama taşma olmayacak şekilde ayarladım
@@ -916,7 +211,7 @@ class PasswordChangeWindow(QWidget):
 
         title = QLabel(self.windowTitle())
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
 
         if self.mode == "teacher":
@@ -965,36 +260,26 @@ class PasswordChangeWindow(QWidget):
             return
 
         if self.mode == "teacher":
-            teachers = load_teachers()
-            found = None
-            for t in teachers:
-                if t.get("name", "") == self.name:
-                    found = t
-                    break
+            registry = get_teacher_registry()
+            found = registry.find(self.name)
             if found is None:
                 QMessageBox.warning(self, "Hata", "Öğretmen kaydı bulunamadı.")
                 return
             if found.get("password", "") != old_pwd:
                 QMessageBox.warning(self, "Hata", "Eski şifre hatalı.")
                 return
-            found["password"] = new_pwd
-            save_teachers(teachers)
+            registry.set_password(found, new_pwd)
             QMessageBox.information(self, "Başarılı", "Şifre güncellendi.")
             self.close()
         else:
-            students = load_students()
-            found = None
-            for s in students:
-                if s.get("name", "") == self.name:
-                    found = s
-                    break
+            registry = get_student_registry()
+            found = registry.find(self.name)
 
             if found is None:
                 if old_pwd:
                     QMessageBox.warning(self, "Hata", "Bu isimle kayıtlı öğrenci bulunamadı.")
                     return
-                students.append({"name": self.name, "password": new_pwd})
-                save_students(students)
+                registry.add(self.name, new_pwd)
                 QMessageBox.information(self, "Başarılı", "Şifre oluşturuldu.")
                 self.close()
             else:
@@ -1003,37 +288,30 @@ class PasswordChangeWindow(QWidget):
                     if current_pwd != old_pwd:
                         QMessageBox.warning(self, "Hata", "Eski şifre hatalı.")
                         return
-                found["password"] = new_pwd
-                save_students(students)
+                registry.set_password(found, new_pwd)
                 QMessageBox.information(self, "Başarılı", "Şifre güncellendi.")
                 self.close()
 
 
 class LoginWindow(QWidget):
-    def __init__(self, mode: str, results: Dict[str, Any], teachers: list):
+    def __init__(self, main_window: "MainWindow", mode: str):
         super().__init__()
+        self.main_window = main_window
         self.mode = mode
-        self.results = results
-        self.teachers = teachers
+        self.teachers = []
+        self.shown_teacher_names = None
         self.selected_teacher_name = None
-        self.setFixedSize(500, 460)
+        self.page_size = (500, 460)
         if mode == "student":
             self.setWindowTitle("Öğrenci Girişi")
         else:
             self.setWindowTitle("Öğretmen Girişi")
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 10px; font-size: 15px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLineEdit {background-color: #020617; color: white; padding: 8px; border-radius: 8px; border: 1px solid #1d4ed8;}"
-            "QLabel {font-size: 14px;}"
-            "QComboBox {background-color: #020617; color: white; padding: 6px; border-radius: 8px; border: 1px solid #1d4ed8;}"
-        )
+        self.setObjectName("loginPage")
         layout = QVBoxLayout(self)
         layout.setSpacing(18)
         title = QLabel("Öğrenci Modu" if mode == "student" else "Öğretmen Modu")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 20px; font-weight: bold;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         self.name_label = QLabel("İsim Soyisim:")
         self.name_edit = QLineEdit()
@@ -1042,13 +320,8 @@ class LoginWindow(QWidget):
         if self.mode == "student":
             self.teacher_label = QLabel("Öğretmen Seç:")
             self.teacher_combo = QComboBox()
-            for t in self.teachers:
-                self.teacher_combo.addItem(t.get("name", ""))
             layout.addWidget(self.teacher_label)
             layout.addWidget(self.teacher_combo)
-            if not self.teachers:
-                self.teacher_combo.setEnabled(False)
-                self.teacher_label.setText("Öğretmen bulunamadı, önce öğretmen kaydı oluşturun.")
         self.password_label = QLabel("Şifre:")
         self.password_edit = QLineEdit()
         self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
@@ -1068,11 +341,31 @@ class LoginWindow(QWidget):
         btn_layout.addWidget(self.change_password_btn)
         layout.addLayout(btn_layout)
 
+    def activate(self):
+        self.password_edit.clear()
+        if self.mode == "student":
+            self.refresh_teachers(get_teacher_registry().all())
+
+    def refresh_teachers(self, teachers: list):
+        self.teachers = teachers
+        names = tuple(t.get("name", "") for t in teachers)
+        if names == self.shown_teacher_names:
+            return
+        self.shown_teacher_names = names
+        current = self.teacher_combo.currentText()
+        self.teacher_combo.clear()
+        self.teacher_combo.addItems(names)
+        if current in names:
+            self.teacher_combo.setCurrentText(current)
+        if teachers:
+            self.teacher_combo.setEnabled(True)
+            self.teacher_label.setText("Öğretmen Seç:")
+        else:
+            self.teacher_combo.setEnabled(False)
+            self.teacher_label.setText("Öğretmen bulunamadı, önce öğretmen kaydı oluşturun.")
+
     def go_back(self):
-        teachers = load_teachers()
-        self.mode_window = ModeWindow(self.results, teachers)
-        self.mode_window.show()
-        self.close()
+        self.main_window.show_mode()
 
     def open_password_change(self):
         name = self.name_edit.text().strip()
@@ -1089,18 +382,11 @@ class LoginWindow(QWidget):
             QMessageBox.warning(self, "Uyarı", "İsim Soyisim alanı boş bırakılamaz.")
             return
         if self.mode == "teacher":
-            teachers = load_teachers()
-            matched = None
-            for t in teachers:
-                if t.get("name", "") == name and t.get("password", "") == pwd:
-                    matched = t
-                    break
+            matched = get_teacher_registry().verify(name, pwd)
             if matched is None:
                 QMessageBox.warning(self, "Hata", "Öğretmen adı veya şifre hatalı.")
                 return
-            self.teacher_window = TeacherMainWindow(self.results, name)
-            self.teacher_window.show()
-            self.close()
+            self.main_window.show_teacher_panel(matched["name"])
         else:
             if not self.teachers:
                 QMessageBox.warning(self, "Hata", "Kayıtlı öğretmen bulunamadı. Önce öğretmen kaydı oluşturun.")
@@ -1109,49 +395,41 @@ class LoginWindow(QWidget):
             if not teacher_name:
                 QMessageBox.warning(self, "Hata", "Lütfen bir öğretmen seçin.")
                 return
-            students = load_students()
-            student_record = None
-            for s in students:
-                if s.get("name", "") == name:
-                    student_record = s
-                    break
-            if student_record and student_record.get("password", ""):
-                if not pwd:
-                    QMessageBox.warning(self, "Hata", "Bu öğrenci için şifre tanımlanmış. Lütfen şifrenizi girin.")
-                    return
-                if pwd != student_record.get("password", ""):
-                    QMessageBox.warning(self, "Hata", "Şifre hatalı.")
-                    return
-            self.exam_setup = ExamSetupWindow(self.results, name, teacher_name)
-            self.exam_setup.show()
-            self.close()
+            student_record = get_student_registry().find(name)
+            if student_record:
+                if student_record.get("password", ""):
+                    if not pwd:
+                        QMessageBox.warning(self, "Hata", "Bu öğrenci için şifre tanımlanmış. Lütfen şifrenizi girin.")
+                        return
+                    if pwd != student_record.get("password", ""):
+                        QMessageBox.warning(self, "Hata", "Şifre hatalı.")
+                        return
+                # Kayıtlı öğrenci, sonuçları tek isim altında toplansın diye kayıttaki adıyla girer.
+                name = student_record["name"]
+            self.main_window.show_exam_setup(name, teacher_name)
 
 class ExamSetupWindow(QWidget):
-    def __init__(self, results: Dict[str, Any], student_name: str, teacher_name: str):
+    def __init__(self, main_window: "MainWindow"):
         super().__init__()
-        self.results = results
-        self.student_name = student_name
-        self.teacher_name = teacher_name
+        self.main_window = main_window
+        self.student_name = ""
+        self.teacher_name = ""
         self.setWindowTitle("Sınav Ayarları")
-        self.setFixedSize(420, 260)
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 8px; font-size: 14px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLineEdit {background-color: #020617; color: white; padding: 8px; border-radius: 8px; border: 1px solid #1d4ed8;}"
-            "QLabel {font-size: 14px;}"
-        )
+        self.page_size = (420, 300)
+        self.setObjectName("examSetupPage")
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
         title = QLabel("Sınav Süresi Seçimi")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         info = QLabel("Dakika cinsinden süre girin (boş bırakılırsa sınırsız):")
         layout.addWidget(info)
         self.duration_edit = QLineEdit()
         self.duration_edit.setPlaceholderText("Örn: 15")
         layout.addWidget(self.duration_edit)
+        self.adaptive_check = QCheckBox("Uyarlamalı sınav (seviye belirlenince erken biter)")
+        layout.addWidget(self.adaptive_check)
         btn_layout = QHBoxLayout()
         self.back_btn = QPushButton("Geri")
         self.start_btn = QPushButton("Sınavı Başlat")
@@ -1164,11 +442,13 @@ class ExamSetupWindow(QWidget):
         btn_layout.addWidget(self.change_password_btn)
         layout.addLayout(btn_layout)
 
+    def activate(self, student_name: str, teacher_name: str):
+        self.student_name = student_name
+        self.teacher_name = teacher_name
+        self.duration_edit.clear()
+
     def go_back(self):
-        teachers = load_teachers()
-        self.login = LoginWindow("student", self.results, teachers)
-        self.login.show()
-        self.close()
+        self.main_window.show_login("student")
 
     def start_exam(self):
         text = self.duration_edit.text().strip()
@@ -1179,49 +459,43 @@ class ExamSetupWindow(QWidget):
                 return
             minutes = int(text)
             exam_end_time = datetime.now() + timedelta(minutes=minutes)
-        easy, medium, hard = build_question_bank()
-        questions = build_exam_questions(easy, medium, hard, per_level=5)
-        quiz = Quiz(questions, exam_end_time=exam_end_time)
-        self.quiz_window = QuizWindow(self.results, self.student_name, self.teacher_name, quiz)
-        self.quiz_window.show()
-        self.close()
+        easy, medium, hard = get_question_bank().pools()
+        if self.adaptive_check.isChecked():
+            quiz = AdaptiveQuiz((easy, medium, hard), exam_end_time=exam_end_time)
+        else:
+            questions = draw_exam_questions(easy, medium, hard, per_level=5)
+            quiz = Quiz(questions, exam_end_time=exam_end_time)
+        start_answer_log(quiz)
+        self.main_window.show_quiz(quiz, self.student_name, self.teacher_name)
 
     def change_password(self):
         self.pw_window = PasswordChangeWindow("student", self.student_name)
         self.pw_window.show()
 
 class QuizWindow(QWidget):
-    def __init__(self, results: Dict[str, Any], student_name: str, teacher_name: str, quiz: Quiz):
+    def __init__(self, main_window: "MainWindow"):
         super().__init__()
-        self.results = results
-        self.student_name = student_name
-        self.teacher_name = teacher_name
-        self.quiz = quiz
+        self.main_window = main_window
+        self.student_name = ""
+        self.teacher_name = ""
+        self.quiz = None
         self.setWindowTitle("Sınav")
-        self.setFixedSize(720, 480)
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 8px; font-size: 14px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLabel {font-size: 14px;}"
-        )
+        self.page_size = (720, 480)
+        self.setObjectName("quizPage")
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
         header_layout = QHBoxLayout()
         self.lbl_info = QLabel("")
-        self.lbl_info.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.lbl_info.setObjectName("quizInfo")
         self.lbl_time = QLabel("")
         self.lbl_time.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lbl_time.setStyleSheet(
-            "font-size: 14px; padding: 6px 14px; border-radius: 10px; "
-            "background-color: #020617; border: 1px solid #1d4ed8;"
-        )
+        self.lbl_time.setObjectName("quizTimer")
         header_layout.addWidget(self.lbl_info)
         header_layout.addWidget(self.lbl_time, alignment=Qt.AlignmentFlag.AlignRight)
         layout.addLayout(header_layout)
         self.lbl_question = QLabel("")
         self.lbl_question.setWordWrap(True)
-        self.lbl_question.setStyleSheet("font-size: 16px; margin-top: 10px;")
+        self.lbl_question.setObjectName("quizQuestion")
         layout.addWidget(self.lbl_question)
         self.choice_buttons = []
         for i in range(4):
@@ -1230,7 +504,7 @@ class QuizWindow(QWidget):
             self.choice_buttons.append(btn)
             layout.addWidget(btn)
         self.lbl_feedback = QLabel("")
-        self.lbl_feedback.setStyleSheet("font-size: 14px; margin-top: 8px;")
+        self.lbl_feedback.setObjectName("quizFeedback")
         layout.addWidget(self.lbl_feedback)
         bottom_layout = QHBoxLayout()
         bottom_layout.addStretch()
@@ -1240,6 +514,12 @@ class QuizWindow(QWidget):
         layout.addLayout(bottom_layout)
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_time)
+
+    def start(self, quiz: Quiz, student_name: str, teacher_name: str):
+        self.quiz = quiz
+        self.student_name = student_name
+        self.teacher_name = teacher_name
+        self.lbl_time.setText("")
         if self.quiz.exam_end_time is not None:
             self.timer.start(1000)
         self.load_question()
@@ -1268,7 +548,7 @@ class QuizWindow(QWidget):
             return
         soru = self.quiz.get_current_question()
         current_index = self.quiz.index + 1
-        total = len(self.quiz.questions)
+        total = self.quiz.planned_total()
         self.lbl_info.setText(f"Soru {current_index}/{total} - Seviye: {soru.level}")
         self.lbl_question.setText(soru.text)
         for i, btn in enumerate(self.choice_buttons):
@@ -1303,42 +583,23 @@ class QuizWindow(QWidget):
     def finish_exam(self):
         if self.timer.isActive():
             self.timer.stop()
-        (
-            correct,
-            wrong,
-            percent,
-            answered,
-            total_questions,
-            points,
-            max_points,
-            point_percent,
-            level_label,
-            level_stats,
-        ) = self.quiz.get_results()
-        now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        new_record = build_exam_record(self.quiz, self.teacher_name)
+        now_str = new_record["datetime"]
+        correct = new_record["correct"]
+        wrong = new_record["wrong"]
+        percent = new_record["percent"]
+        answered = new_record["answered"]
+        total_questions = new_record["total_questions"]
+        points = new_record["points"]
+        max_points = new_record["max_points"]
+        point_percent = new_record["point_percent"]
+        level_label = new_record["level_label"]
+        level_stats = new_record["level_stats"]
+        study_suggestions = new_record["study_suggestions"]
         weak_info = analyze_weak_areas(level_stats)
-        study_suggestions = build_study_suggestions(level_label, level_stats)
-        new_record = {
-            "datetime": now_str,
-            "correct": correct,
-            "wrong": wrong,
-            "percent": percent,
-            "answered": answered,
-            "total_questions": total_questions,
-            "early_terminated": self.quiz.early_terminated,
-            "points": points,
-            "max_points": max_points,
-            "point_percent": point_percent,
-            "level_label": level_label,
-            "level_stats": level_stats,
-            "study_suggestions": study_suggestions,
-            "teacher": self.teacher_name,
-        }
-        user_records = self.results.get(self.student_name, [])
-        user_records.append(new_record)
-        self.results[self.student_name] = user_records
-        save_results(self.results)
-        self.result_window = ResultWindow(
+        append_result(self.main_window.results, self.student_name, new_record)
+        log_exam_end(self.student_name, new_record, self.quiz)
+        self.main_window.show_result(
             self.student_name,
             now_str,
             correct,
@@ -1354,11 +615,44 @@ class QuizWindow(QWidget):
             weak_info,
             study_suggestions,
         )
-        self.result_window.show()
-        self.close()
 
 class ResultWindow(QWidget):
-    def __init__(
+    def __init__(self, main_window: "MainWindow"):
+        super().__init__()
+        self.main_window = main_window
+        self.setWindowTitle("Sınav Sonuçları")
+        self.page_size = (720, 520)
+        self.setObjectName("resultPage")
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        title = QLabel("SON SINAV ÖZETİ")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        title.setObjectName("pageTitle")
+        layout.addWidget(title)
+        self.info_label = QLabel("")
+        layout.addWidget(self.info_label)
+        self.stat_label = QLabel("")
+        layout.addWidget(self.stat_label)
+        level_label_widget = QLabel("Seviye bazlı istatistikler:")
+        layout.addWidget(level_label_widget)
+        self.level_box = QPlainTextEdit()
+        self.level_box.setReadOnly(True)
+        layout.addWidget(self.level_box)
+        weak_label = QLabel("Zorlandığın seviye analizi:")
+        layout.addWidget(weak_label)
+        self.weak_box = QPlainTextEdit()
+        self.weak_box.setReadOnly(True)
+        layout.addWidget(self.weak_box)
+        sug_label = QLabel("Önerilen çalışma konuları:")
+        layout.addWidget(sug_label)
+        self.sug_box = QPlainTextEdit()
+        self.sug_box.setReadOnly(True)
+        layout.addWidget(self.sug_box)
+        btn = QPushButton("Kapat")
+        btn.clicked.connect(self.close_app)
+        layout.addWidget(btn)
+
+    def show_result(
         self,
         student_name: str,
         datetime_str: str,
@@ -1375,33 +669,13 @@ class ResultWindow(QWidget):
         weak_info: str,
         study_suggestions: list,
     ):
-        super().__init__()
-        self.setWindowTitle("Sınav Sonuçları")
-        self.setFixedSize(720, 520)
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 8px; font-size: 14px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLabel {font-size: 14px;}"
-            "QPlainTextEdit {background-color: #020617; color: white; border-radius: 8px; padding: 6px; border: 1px solid #1f2937;}"
-        )
-        layout = QVBoxLayout(self)
-        layout.setSpacing(10)
-        title = QLabel("SON SINAV ÖZETİ")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 20px; font-weight: bold;")
-        layout.addWidget(title)
-        info = QLabel(
+        self.info_label.setText(
             f"Ad Soyad: {student_name} | Tarih: {datetime_str} | Seviye: {level_label}"
         )
-        layout.addWidget(info)
-        stat_label = QLabel(
+        self.stat_label.setText(
             f"Sorular: {answered}/{total_questions} | Doğru: {correct} | Yanlış: {wrong} | "
             f"Soru Başarısı: {percent:.2f}% | Puan: {points}/{max_points} ({point_percent:.2f}%)"
         )
-        layout.addWidget(stat_label)
-        level_label_widget = QLabel("Seviye bazlı istatistikler:")
-        layout.addWidget(level_label_widget)
         level_text_lines = []
         for level in ["Kolay", "Orta", "Zor"]:
             stats = level_stats[level]
@@ -1412,52 +686,184 @@ class ResultWindow(QWidget):
             level_text_lines.append(
                 f"{level:<5} -> Doğru: {stats['correct']}, Yanlış: {stats['wrong']} (Başarı: {acc_lv:.2f}%)"
             )
-        level_box = QPlainTextEdit()
-        level_box.setReadOnly(True)
-        level_box.setPlainText("\n".join(level_text_lines) if level_text_lines else "Veri yok.")
-        layout.addWidget(level_box)
-        weak_label = QLabel("Zorlandığın seviye analizi:")
-        layout.addWidget(weak_label)
-        weak_box = QPlainTextEdit()
-        weak_box.setReadOnly(True)
-        weak_box.setPlainText(weak_info)
-        layout.addWidget(weak_box)
-        sug_label = QLabel("Önerilen çalışma konuları:")
-        layout.addWidget(sug_label)
-        sug_box = QPlainTextEdit()
-        sug_box.setReadOnly(True)
-        sug_box.setPlainText("\n".join(f"- {s}" for s in study_suggestions))
-        layout.addWidget(sug_box)
-        btn = QPushButton("Kapat")
-        btn.clicked.connect(self.close_app)
-        layout.addWidget(btn)
+        self.level_box.setPlainText("\n".join(level_text_lines) if level_text_lines else "Veri yok.")
+        self.weak_box.setPlainText(weak_info)
+        self.sug_box.setPlainText("\n".join(f"- {s}" for s in study_suggestions))
 
     def close_app(self):
+        # Yazım takılı kalırsa çıkış sonsuza dek engellenmez: kullanıcı
+        # yeniden denemeyi ya da yazılamayan sonuçları bırakıp çıkmayı seçer.
+        while not flush_results(RESULT_FLUSH_TIMEOUT):
+            answer = QMessageBox.question(
+                self,
+                "Uyarı",
+                "Sonuçlar henüz diske yazılamadı.\n\n"
+                "Yine de çıkılırsa yazılamayan sonuçlar kaybolur. Çıkılsın mı?\n"
+                "(Hayır: yazım yeniden denenir)",
+            )
+            if answer == QMessageBox.StandardButton.Yes:
+                break
         QApplication.instance().quit()
 
-class TeacherMainWindow(QWidget):
-    def __init__(self, results: Dict[str, Any], teacher_name: str):
+class ExamHistoryModel(QAbstractTableModel):
+    # Satırlar yalnızca görünüme geldiklerinde biçimlenir (data çağrısında).
+    def __init__(self, cache: ExamRowCache):
+        super().__init__()
+        self.cache = cache
+        self.name = ""
+        self.records = []
+
+    def set_student(self, name: str, records: list):
+        self.beginResetModel()
+        self.name = name
+        self.records = records
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(EXAM_HISTORY_COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self.cache.row(self.name, self.records, index.row())[index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return EXAM_HISTORY_COLUMNS[section]
+        return None
+
+STUDENT_KEY_ROLE = Qt.ItemDataRole.UserRole
+
+class StudentListModel(QAbstractListModel):
+    # İsimler Türkçe katlanmış anahtara göre sıralı tutulur; proxy'nin her
+    # karşılaştırmada Python'daki data()'yı çağırarak sıralaması çok yavaş.
+    # Sonuç sözlüğüne yalnızca yeni öğrenci eklenir (ekleme sırası korunur),
+    # bu yüzden sync sadece sondaki yeni isimleri yerlerine ekler.
+    def __init__(self, results: Dict[str, Any]):
         super().__init__()
         self.results = results
-        self.teacher_name = teacher_name
+        self.seen = 0
+        self.names = []
+        self.keys = []
+
+    def sync(self):
+        if self.seen == 0 or len(self.results) < self.seen:
+            self.beginResetModel()
+            entries = sorted((account_key(name), name) for name in self.results)
+            self.keys = [key for key, _ in entries]
+            self.names = [name for _, name in entries]
+            self.seen = len(self.results)
+            self.endResetModel()
+            return
+        for name in islice(self.results, self.seen, None):
+            key = account_key(name)
+            row = bisect_right(self.keys, key)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self.keys.insert(row, key)
+            self.names.insert(row, name)
+            self.endInsertRows()
+        self.seen = len(self.results)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.names[index.row()]
+        if role == STUDENT_KEY_ROLE:
+            return self.keys[index.row()]
+        return None
+
+QUESTION_DOC_ROLE = Qt.ItemDataRole.UserRole
+QUESTION_PAGE_SIZE = 100
+QUESTION_ALL_LEVELS = "Tüm seviyeler"
+
+class QuestionSearchModel(QAbstractListModel):
+    # Arama sonucu belge numarası listesidir; görünüm kaydırdıkça fetchMore
+    # ile QUESTION_PAGE_SIZE'lık sayfalar açılır, satır metni data()'da kurulur.
+    def __init__(self, catalog: QuestionCatalog):
+        super().__init__()
+        self.catalog = catalog
+        self.docs = []
+        self.shown = 0
+
+    def set_results(self, docs: list):
+        self.beginResetModel()
+        self.docs = docs
+        self.shown = min(QUESTION_PAGE_SIZE, len(docs))
+        self.endResetModel()
+
+    def row_of(self, doc: int):
+        # Yalnızca açılmış sayfalarda aranır.
+        try:
+            return self.docs.index(doc, 0, self.shown)
+        except ValueError:
+            return None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.shown
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self.shown < len(self.docs)
+
+    def fetchMore(self, parent):
+        if parent.isValid():
+            return
+        count = min(QUESTION_PAGE_SIZE, len(self.docs) - self.shown)
+        self.beginInsertRows(QModelIndex(), self.shown, self.shown + count - 1)
+        self.shown += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        doc = self.docs[index.row()]
+        if role == QUESTION_DOC_ROLE:
+            return doc
+        entry = self.catalog.entry(doc)
+        if role == Qt.ItemDataRole.DisplayRole:
+            kind = ", ekstra" if entry.is_custom else ""
+            return f"[{entry.level}{kind}] {' '.join(entry.text.split())}"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return entry.text
+        return None
+
+REPORT_CHUNK_LINES = 2000
+
+def split_report_chunks(text: str) -> list:
+    lines = text.split("\n")
+    return ["\n".join(lines[i:i + REPORT_CHUNK_LINES]) for i in range(0, len(lines), REPORT_CHUNK_LINES)]
+
+class TeacherMainWindow(QWidget):
+    def __init__(self, main_window: "MainWindow"):
+        super().__init__()
+        self.main_window = main_window
+        self.results = main_window.results
+        self.tasks = main_window.tasks
+        self.teacher_name = ""
+        self.shown_report = None
+        self.report_chunks = []
         self.setWindowTitle("Öğretmen Paneli")
-        self.setFixedSize(800, 550)
-        self.setStyleSheet(
-            "QWidget {background-color: #020617; color: white;}"
-            "QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 8px; font-size: 14px;}"
-            "QPushButton:hover {background-color: #3b82f6;}"
-            "QLabel {font-size: 14px;}"
-            "QPlainTextEdit {background-color: #020617; color: white; border-radius: 8px; padding: 6px; border: 1px solid #1f2937;}"
-            "QListWidget {background-color: #020617; color: white; border-radius: 8px; border: 1px solid #1f2937;}"
-            "QLineEdit {background-color: #020617; color: white; padding: 6px; border-radius: 8px; border: 1px solid #1f2937;}"
-            "QComboBox {background-color: #020617; color: white; padding: 6px; border-radius: 8px; border: 1px solid #1f2937;}"
-        )
+        self.page_size = (800, 550)
+        self.setObjectName("teacherPage")
         layout = QVBoxLayout(self)
         title = QLabel("Öğretmen Paneli")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("font-size: 22px; font-weight: bold;")
+        title.setObjectName("pageTitle")
         layout.addWidget(title)
         header_buttons_layout = QHBoxLayout()
+        self.progress = QProgressBar()
+        self.progress.setRange(0, 0)
+        self.progress.setTextVisible(False)
+        self.progress.setFixedSize(160, 10)
+        self.progress.setVisible(self.tasks.is_busy())
+        self.tasks.busy_changed.connect(self.progress.setVisible)
+        header_buttons_layout.addWidget(self.progress)
         header_buttons_layout.addStretch()
         self.change_password_btn = QPushButton("Şifremi Değiştir")
         self.change_password_btn.clicked.connect(self.open_password_change)
@@ -1474,9 +880,14 @@ class TeacherMainWindow(QWidget):
         self.setup_general_tab()
         self.setup_student_tab()
         self.setup_questions_tab()
+
+    def activate(self, teacher_name: str):
+        self.teacher_name = teacher_name
         self.refresh_general_report()
         self.refresh_student_list()
         self.refresh_question_counts()
+        self.apply_question_search()
+        self.refresh_item_stats()
 
     def open_password_change(self):
         self.pw_window = PasswordChangeWindow("teacher", self.teacher_name)
@@ -1488,6 +899,12 @@ class TeacherMainWindow(QWidget):
         layout.addWidget(label)
         self.general_text = QPlainTextEdit()
         self.general_text.setReadOnly(True)
+        self.general_text.setUndoRedoEnabled(False)
+        # Metin belgeye parça parça eklenir; QTextDocument'e yazma GIL'i
+        # bıraktırmadığı için arka planda yapılamaz, olay döngüsü arada döner.
+        self.report_timer = QTimer(self)
+        self.report_timer.setInterval(0)
+        self.report_timer.timeout.connect(self.append_report_chunk)
         layout.addWidget(self.general_text)
         refresh_btn = QPushButton("Yenile")
         refresh_btn.clicked.connect(self.refresh_general_report)
@@ -1499,22 +916,86 @@ class TeacherMainWindow(QWidget):
         right_layout = QVBoxLayout()
         label = QLabel("Öğrenciler:")
         left_layout.addWidget(label)
-        self.student_list = QListWidget()
-        self.student_list.currentTextChanged.connect(self.show_student_detail)
+        self.student_search = QLineEdit()
+        self.student_search.setPlaceholderText("Öğrenci ara...")
+        self.student_search.textChanged.connect(self.schedule_student_filter)
+        left_layout.addWidget(self.student_search)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150)
+        self.search_timer.timeout.connect(self.apply_student_filter)
+        self.student_model = StudentListModel(self.results)
+        # Arama Türkçe katlanmış isim anahtarı üzerinde alt dize eşleşmesidir.
+        self.student_proxy = QSortFilterProxyModel(self)
+        self.student_proxy.setSourceModel(self.student_model)
+        self.student_proxy.setFilterRole(STUDENT_KEY_ROLE)
+        self.student_list = QListView()
+        self.student_list.setUniformItemSizes(True)
+        self.student_list.setModel(self.student_proxy)
+        self.student_list.selectionModel().currentChanged.connect(self.on_student_changed)
         left_layout.addWidget(self.student_list)
         layout.addLayout(left_layout, 1)
-        detail_label = QLabel("Seçili öğrencinin sınav detayları:")
-        right_layout.addWidget(detail_label)
-        self.student_detail_text = QPlainTextEdit()
-        self.student_detail_text.setReadOnly(True)
-        right_layout.addWidget(self.student_detail_text)
+        self.detail_label = QLabel("Seçili öğrencinin sınav detayları:")
+        self.detail_label.setWordWrap(True)
+        right_layout.addWidget(self.detail_label)
+        self.row_cache = ExamRowCache()
+        self.history_model = ExamHistoryModel(self.row_cache)
+        self.history_view = QTableView()
+        self.history_view.setModel(self.history_model)
+        self.history_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.history_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        # Sabit satır yüksekliği ve sütun genişlikleri: görünüm yalnızca
+        # ekrandaki satırları sorar, içeriğe göre boyutlandırma yapılmaz.
+        vertical = self.history_view.verticalHeader()
+        vertical.setVisible(False)
+        vertical.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical.setDefaultSectionSize(24)
+        horizontal = self.history_view.horizontalHeader()
+        horizontal.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in enumerate((36, 140, 100, 90, 70, 130, 70, 120, 130)):
+            self.history_view.setColumnWidth(column, width)
+        right_layout.addWidget(self.history_view)
         layout.addLayout(right_layout, 2)
 
     def setup_questions_tab(self):
-        layout = QVBoxLayout(self.tab_questions)
-        self.lbl_counts = QLabel("")
-        layout.addWidget(self.lbl_counts)
+        layout = QHBoxLayout(self.tab_questions)
+        browser_layout = QVBoxLayout()
+        search_layout = QHBoxLayout()
+        self.question_search = QLineEdit()
+        self.question_search.setPlaceholderText("Soru ya da şık ara...")
+        self.question_search.textChanged.connect(self.schedule_question_search)
+        search_layout.addWidget(self.question_search, 1)
+        self.search_level_combo = QComboBox()
+        self.search_level_combo.addItems([QUESTION_ALL_LEVELS, "Kolay", "Orta", "Zor"])
+        self.search_level_combo.currentIndexChanged.connect(self.apply_question_search)
+        search_layout.addWidget(self.search_level_combo)
+        browser_layout.addLayout(search_layout)
+        self.question_search_timer = QTimer(self)
+        self.question_search_timer.setSingleShot(True)
+        self.question_search_timer.setInterval(150)
+        self.question_search_timer.timeout.connect(self.apply_question_search)
+        self.lbl_search_count = QLabel("")
+        browser_layout.addWidget(self.lbl_search_count)
+        self.question_catalog = get_question_catalog()
+        self.editing_doc = None
+        self.item_stats = None
+        self.question_model = QuestionSearchModel(self.question_catalog)
+        self.question_list = QListView()
+        self.question_list.setUniformItemSizes(True)
+        self.question_list.setModel(self.question_model)
+        self.question_list.selectionModel().currentChanged.connect(self.on_question_changed)
+        browser_layout.addWidget(self.question_list)
+        layout.addLayout(browser_layout, 1)
+
         form_layout = QVBoxLayout()
+        self.lbl_counts = QLabel("")
+        form_layout.addWidget(self.lbl_counts)
+        self.lbl_editing = QLabel("Yeni soru")
+        self.lbl_editing.setWordWrap(True)
+        form_layout.addWidget(self.lbl_editing)
+        self.lbl_item_stats = QLabel("")
+        self.lbl_item_stats.setWordWrap(True)
+        form_layout.addWidget(self.lbl_item_stats)
         self.level_combo = QComboBox()
         self.level_combo.addItems(["Kolay", "Orta", "Zor"])
         form_layout.addWidget(QLabel("Soru seviyesi:"))
@@ -1532,76 +1013,329 @@ class TeacherMainWindow(QWidget):
         self.correct_combo.addItems(["1", "2", "3", "4"])
         form_layout.addWidget(QLabel("Doğru şık numarası:"))
         form_layout.addWidget(self.correct_combo)
+        buttons_layout = QHBoxLayout()
+        self.new_question_btn = QPushButton("Yeni Soru")
+        self.new_question_btn.clicked.connect(self.clear_question_form)
+        buttons_layout.addWidget(self.new_question_btn)
+        buttons_layout.addStretch()
+        self.save_question_btn = QPushButton("Değişiklikleri Kaydet")
+        self.save_question_btn.setEnabled(False)
+        self.save_question_btn.clicked.connect(self.save_question_edit)
+        buttons_layout.addWidget(self.save_question_btn)
         self.add_question_btn = QPushButton("Soruyu Ekle")
         self.add_question_btn.clicked.connect(self.add_question)
-        form_layout.addWidget(self.add_question_btn, alignment=Qt.AlignmentFlag.AlignRight)
-        layout.addLayout(form_layout)
+        buttons_layout.addWidget(self.add_question_btn)
+        form_layout.addLayout(buttons_layout)
+        layout.addLayout(form_layout, 1)
 
     def refresh_general_report(self):
-        text = build_teacher_general_report(self.results)
-        self.general_text.setPlainText(text)
+        results = self.results
+        shown = self.shown_report
+
+        def build():
+            stats = get_result_stats(results)
+            text = stats.general_report(LEADERBOARD_SIZE)
+            stats.build_rankings()
+            # Rapor sürüm değişmedikçe aynı nesnedir; metin yeniden yüklenmez.
+            if text is shown:
+                return None
+            return text, split_report_chunks(text)
+
+        self.tasks.submit(
+            "general_report",
+            build,
+            on_done=self.show_general_report,
+            on_error=self.show_report_error,
+        )
+
+    def show_report_error(self, message: str):
+        self.report_timer.stop()
+        self.report_chunks = []
+        self.shown_report = None
+        self.general_text.setPlainText(f"Rapor oluşturulamadı: {message}")
+
+    def show_general_report(self, report):
+        if report is None:
+            return
+        self.shown_report, chunks = report
+        self.general_text.setPlainText(chunks[0])
+        self.report_chunks = chunks[:0:-1]
+        if self.report_chunks:
+            self.progress.setVisible(True)
+            self.report_timer.start()
+
+    def append_report_chunk(self):
+        if not self.report_chunks:
+            self.report_timer.stop()
+            self.progress.setVisible(self.tasks.is_busy())
+            return
+        self.general_text.appendPlainText(self.report_chunks.pop())
 
     def refresh_student_list(self):
-        self.student_list.clear()
-        names = sorted(self.results.keys())
-        self.student_list.addItems(names)
+        self.student_model.sync()
+
+    def schedule_student_filter(self):
+        self.search_timer.start()
+
+    def apply_student_filter(self):
+        self.student_proxy.setFilterFixedString(account_key(self.student_search.text()))
+
+    def on_student_changed(self, current, previous):
+        self.show_student_detail(current.data() if current.isValid() else "")
 
     def show_student_detail(self, name: str):
-        if not name:
-            self.student_detail_text.setPlainText("")
-            return
-        text = build_teacher_student_detail_text(self.results, name)
-        self.student_detail_text.setPlainText(text)
+        records = self.results.get(name, []) if name else []
+        if name and not records:
+            self.detail_label.setText("Bu öğrencinin kayıtlı sınavı yok.")
+        elif name:
+            self.detail_label.setText(f"{name} - {len(records)} sınav{self.rank_text(name)}")
+        else:
+            self.detail_label.setText("Seçili öğrencinin sınav detayları:")
+        self.history_model.set_student(name, records)
+
+    def rank_text(self, name: str) -> str:
+        # Sıralama ağaçları rapor işiyle arka planda kurulur; hazır değilse gösterilmez.
+        if self.shown_report is None:
+            return ""
+        stats = get_result_stats(self.results)
+        ranks = [stats.rank_of(metric, name) for metric in ("best_points", "avg_percent", "total_exams")]
+        if None in ranks:
+            return ""
+        return f" | Sıra (puan/ortalama/sınav): {ranks[0]} / {ranks[1]} / {ranks[2]} - {len(stats.students)} öğrenci"
 
     def refresh_question_counts(self):
-        data = load_custom_questions()
+        self.tasks.submit(
+            "question_counts",
+            load_custom_questions,
+            on_done=self.show_question_counts,
+            on_error=lambda message: self.lbl_counts.setText(f"Soru sayıları okunamadı: {message}"),
+        )
+
+    def show_question_counts(self, data: Dict[str, list]):
         self.lbl_counts.setText(
             f"Mevcut ekstra soru sayıları -> Kolay: {len(data['easy'])} | Orta: {len(data['medium'])} | Zor: {len(data['hard'])}"
         )
 
-    def add_question(self):
+    def refresh_item_stats(self):
+        # Cevap günlüğünün yalnızca son kayıttan sonra eklenen kısmı okunur.
+        self.tasks.submit(
+            "item_stats",
+            refresh_item_stats,
+            on_done=self.show_item_stats,
+            on_error=lambda message: self.lbl_item_stats.setText(f"Madde istatistikleri okunamadı: {message}"),
+        )
+
+    def show_item_stats(self, analysis):
+        self.item_stats = analysis
+        current = self.question_list.currentIndex()
+        if current.isValid():
+            entry = self.question_catalog.entry(current.data(QUESTION_DOC_ROLE))
+            self.lbl_item_stats.setText(self.item_stats_text(entry))
+
+    def item_stats_text(self, entry) -> str:
+        if self.item_stats is None:
+            return ""
+        stat = self.item_stats.item(entry.qid)
+        if stat is None:
+            return "Madde istatistiği: bu soru henüz cevaplanmadı."
+        flags = stat.flags(entry.answer_index)
+        return f"Madde istatistiği: {format_item_stat(stat, len(entry.choices))}" + (f"\n⚠ {', '.join(flags)}" if flags else "")
+
+    def read_question_form(self):
+        # Form geçerliyse (seviye, metin, şıklar, cevap), değilse uyarı gösterip None.
         level_label = self.level_combo.currentText()
-        if level_label == "Kolay":
-            level_key = "easy"
-        elif level_label == "Orta":
-            level_key = "medium"
-        else:
-            level_key = "hard"
         text = self.question_edit.toPlainText().strip()
         if not text:
             QMessageBox.warning(self, "Hata", "Soru metni boş olamaz.")
-            return
+            return None
         choices = []
         for le in self.choice_edits:
             c = le.text().strip()
             if not c:
                 QMessageBox.warning(self, "Hata", "Tüm şıklar doldurulmalıdır.")
-                return
+                return None
             choices.append(c)
+        groups = duplicate_choices(choices)
+        if groups:
+            numbers = ", ".join(" ve ".join(str(i + 1) for i in group) for group in groups)
+            QMessageBox.warning(self, "Hata", f"Aynı şık birden fazla kez yazılmış: {numbers}.")
+            return None
         correct_index = int(self.correct_combo.currentText()) - 1
-        answer = choices[correct_index]
-        data = load_custom_questions()
-        qd = {
-            "text": text,
-            "choices": choices,
-            "answer": answer,
-        }
-        data[level_key].append(qd)
-        save_custom_questions(data)
+        return level_label, text, choices, choices[correct_index]
+
+    def add_question(self):
+        form = self.read_question_form()
+        if form is None:
+            return
+        level_label, text, choices, answer = form
+        if not self.confirm_not_duplicate(text, choices):
+            return
+        self.question_catalog.add_custom(level_label, text, choices, answer)
+        add_to_question_index(level_label, text, choices)
+        self.clear_question_form()
+        self.refresh_question_counts()
+        self.apply_question_search()
+        QMessageBox.information(self, "Başarılı", f"Soru eklendi. Seviye: {level_label}")
+
+    def save_question_edit(self):
+        if self.editing_doc is None:
+            return
+        form = self.read_question_form()
+        if form is None:
+            return
+        level_label, text, choices, answer = form
+        if not self.confirm_not_duplicate(text, choices, ignore=self.question_catalog.entry(self.editing_doc)):
+            return
+        try:
+            self.question_catalog.update_custom(self.editing_doc, level_label, text, choices, answer)
+        except ValueError as e:
+            QMessageBox.warning(self, "Hata", str(e))
+            self.clear_question_form()
+            self.apply_question_search()
+            return
+        self.refresh_question_counts()
+        self.apply_question_search()
+        QMessageBox.information(self, "Başarılı", "Soru güncellendi.")
+
+    def confirm_not_duplicate(self, text: str, choices: list, ignore=None) -> bool:
+        # ignore: düzenlenen soru; kendisiyle eşleşmesi sayılmaz.
+        for (level, position), score in get_question_index().similar(text, choices, limit=2):
+            existing = get_question_bank().level_pool(level)[position]
+            if ignore is not None and existing.text == ignore.text and existing.choices == ignore.choices:
+                continue
+            if score >= 1.0:
+                QMessageBox.warning(self, "Hata", f"Bu soru zaten var (Seviye: {level}):\n\n{existing.text}")
+                return False
+            answer = QMessageBox.question(
+                self,
+                "Benzer soru",
+                f"Bankada çok benzer bir soru var (Seviye: {level}, %{score * 100:.0f} benzer):\n\n"
+                f"{existing.text}\n\nYine de kaydedilsin mi?",
+            )
+            return answer == QMessageBox.StandardButton.Yes
+        return True
+
+    def schedule_question_search(self):
+        self.question_search_timer.start()
+
+    def apply_question_search(self):
+        level = self.search_level_combo.currentText()
+        docs = self.question_catalog.search(
+            self.question_search.text(), None if level == QUESTION_ALL_LEVELS else level
+        )
+        self.question_model.set_results(docs)
+        self.lbl_search_count.setText(f"{len(docs)} soru")
+        if self.editing_doc is not None:
+            row = self.question_model.row_of(self.editing_doc)
+            if row is not None:
+                self.question_list.setCurrentIndex(self.question_model.index(row))
+
+    def on_question_changed(self, current, previous):
+        if current.isValid():
+            self.show_question(current.data(QUESTION_DOC_ROLE))
+
+    def show_question(self, doc: int):
+        entry = self.question_catalog.entry(doc)
+        self.editing_doc = doc if entry.is_custom else None
+        self.level_combo.setCurrentText(entry.level)
+        self.question_edit.setPlainText(entry.text)
+        for le, choice in zip(self.choice_edits, entry.choices):
+            le.setText(choice)
+        for le in self.choice_edits[len(entry.choices):]:
+            le.clear()
+        self.correct_combo.setCurrentIndex(min(entry.answer_index, self.correct_combo.count() - 1))
+        self.save_question_btn.setEnabled(entry.is_custom)
+        self.lbl_item_stats.setText(self.item_stats_text(entry))
+        if entry.is_custom:
+            self.lbl_editing.setText("Ekstra soru seçili: değiştirip kaydedebilir ya da yeni soru olarak ekleyebilirsiniz.")
+        else:
+            self.lbl_editing.setText("Yerleşik soru seçili: düzenlenemez, yeni soruya temel olarak kullanılabilir.")
+
+    def clear_question_form(self):
+        self.editing_doc = None
+        self.question_list.clearSelection()
         self.question_edit.clear()
         for le in self.choice_edits:
             le.clear()
         self.correct_combo.setCurrentIndex(0)
-        self.refresh_question_counts()
-        QMessageBox.information(self, "Başarılı", f"Soru eklendi. Seviye: {level_label}")
+        self.save_question_btn.setEnabled(False)
+        self.lbl_item_stats.clear()
+        self.lbl_editing.setText("Yeni soru")
+
+class MainWindow(QWidget):
+    # Tüm ekranlar tek pencerede, QStackedWidget içinde yaşar; ekranlar ilk
+    # kullanımda bir kez kurulur ve geçişlerde yalnızca verileri yenilenir.
+    def __init__(self, results: Dict[str, Any]):
+        super().__init__()
+        self.results = results
+        self.tasks = TaskRunner(self)
+        self.pages = {}
+        self.stack = QStackedWidget()
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.stack)
+        self.show_mode()
+
+    def page(self, key: str, factory):
+        page = self.pages.get(key)
+        if page is None:
+            page = factory()
+            self.pages[key] = page
+            self.stack.addWidget(page)
+        return page
+
+    def switch_to(self, page: QWidget):
+        self.stack.setCurrentWidget(page)
+        self.setWindowTitle(page.windowTitle())
+        self.setFixedSize(*page.page_size)
+
+    def show_mode(self):
+        self.switch_to(self.page("mode", lambda: ModeWindow(self)))
+
+    def show_register(self):
+        page = self.page("register", lambda: TeacherRegisterWindow(self))
+        page.activate()
+        self.switch_to(page)
+
+    def show_login(self, mode: str):
+        page = self.page(f"login_{mode}", lambda: LoginWindow(self, mode))
+        page.activate()
+        self.switch_to(page)
+
+    def show_exam_setup(self, student_name: str, teacher_name: str):
+        page = self.page("exam_setup", lambda: ExamSetupWindow(self))
+        page.activate(student_name, teacher_name)
+        self.switch_to(page)
+
+    def show_quiz(self, quiz: Quiz, student_name: str, teacher_name: str):
+        page = self.page("quiz", lambda: QuizWindow(self))
+        self.switch_to(page)
+        page.start(quiz, student_name, teacher_name)
+
+    def show_result(self, *result_args):
+        page = self.page("result", lambda: ResultWindow(self))
+        page.show_result(*result_args)
+        self.switch_to(page)
+
+    def show_teacher_panel(self, teacher_name: str):
+        page = self.page("teacher", lambda: TeacherMainWindow(self))
+        page.activate(teacher_name)
+        self.switch_to(page)
 
 def main():
     results = load_results()
-    teachers = load_teachers()
+    get_teacher_registry().refresh()
     app = QApplication(sys.argv)
-    window = ModeWindow(results, teachers)
+    apply_theme(app)
+    start_result_writer()
+    window = MainWindow(results)
     window.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    window.tasks.shutdown()
+    if not stop_result_writer(RESULT_FLUSH_TIMEOUT):
+        print("Uyarı: bazı sınav sonuçları diske yazılamadı.", file=sys.stderr)
+    get_storage().close()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,61 @@
+from .quiz import (
+    LEVEL_POINTS,
+    LEVELS,
+    LEVEL_CODES,
+    LEVEL_POINTS_BY_CODE,
+    Question,
+    Quiz,
+    get_level_label,
+)
+from .adaptive import AdaptiveQuiz, LEVEL_DIFFICULTY, label_cuts
+from .analysis import analyze_weak_areas, build_study_suggestions, build_exam_record
+from .questions import (
+    QuestionBank,
+    build_builtin_questions,
+    build_custom_questions,
+    build_exam_questions,
+    build_question_bank,
+    get_question_bank,
+)
+from .records import ExamRecord, as_exam_record, decode_record, encode_record
+from .ranking import RANKING_METRICS, RankingTree, Leaderboard, select_top
+from .reports import (
+    LEADERBOARD_SIZE,
+    StudentStats,
+    ResultStats,
+    get_result_stats,
+    build_teacher_general_report,
+    render_teacher_general_report,
+    build_teacher_student_detail_text,
+    EXAM_HISTORY_COLUMNS,
+    format_exam_row,
+    ExamRowCache,
+)
+from .storage import (
+    JsonStorage,
+    SqliteStorage,
+    create_storage,
+    get_storage,
+    set_storage,
+    load_results,
+    save_results,
+    append_result,
+    add_result_listener,
+    remove_result_listener,
+    load_custom_questions,
+    save_custom_questions,
+    custom_questions_signature,
+    load_teachers,
+    save_teachers,
+    load_students,
+    save_students,
+    accounts_signature,
+    migrate_storage,
+)
+from .accounts import (
+    AccountRegistry,
+    account_key,
+    get_account_registry,
+    get_teacher_registry,
+    get_student_registry,
+)
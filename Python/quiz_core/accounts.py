@@ -0,0 +1,107 @@
+from typing import Dict, Any, Optional
+from .storage import account_lock, get_storage
+
+def account_key(name: str) -> str:
+    # Türkçe harf eşlemesi ("I" -> "ı", "İ" -> "i") ve casefold; isimler
+    # Türkçe klavyesiz de yazılabildiği için noktalı/noktasız i aynı sayılır.
+    name = " ".join(name.split())
+    return name.replace("İ", "i").replace("I", "ı").casefold().replace("ı", "i")
+
+class AccountRegistry:
+    # Hesaplar bir kez okunur ve isim anahtarına göre indekslenir; dosya
+    # yalnızca imzası (mtime/boyut ya da veritabanı sayacı) değişince yeniden
+    # okunur, yalnızca veri gerçekten değiştiğinde yazılır.
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.storage = None
+        self.signature = None
+        self.loaded = False
+        self.accounts = []
+        self.index = {}
+
+    def refresh(self) -> bool:
+        storage = get_storage()
+        signature = storage.accounts_signature(self.kind)
+        if self.loaded and storage is self.storage and signature == self.signature:
+            return False
+        if self.kind == "teachers":
+            accounts = storage.load_teachers()
+        else:
+            accounts = storage.load_students()
+        index = {}
+        for account in accounts:
+            index.setdefault(account_key(account["name"]), account)
+        self.accounts = accounts
+        self.index = index
+        self.storage = storage
+        # Yükleme varsayılan kaydı yazmış olabilir; imza yüklemeden sonra alınır.
+        self.signature = storage.accounts_signature(self.kind)
+        self.loaded = True
+        return True
+
+    def save(self) -> None:
+        if self.kind == "teachers":
+            self.storage.save_teachers(self.accounts)
+        else:
+            self.storage.save_students(self.accounts)
+        self.signature = self.storage.accounts_signature(self.kind)
+
+    def all(self) -> list:
+        self.refresh()
+        return self.accounts
+
+    def find(self, name: str) -> Optional[Dict[str, Any]]:
+        self.refresh()
+        return self.index.get(account_key(name))
+
+    def verify(self, name: str, password: str) -> Optional[Dict[str, Any]]:
+        account = self.find(name)
+        if account is None or account.get("password", "") != password:
+            return None
+        return account
+
+    def add(self, name: str, password: str) -> Optional[Dict[str, Any]]:
+        with account_lock(self.kind):
+            self.refresh()
+            key = account_key(name)
+            if key in self.index:
+                return None
+            account = {"name": name, "password": password}
+            self.accounts.append(account)
+            self.index[key] = account
+            self.save()
+            return account
+
+    def set_password(self, account: Dict[str, Any], password: str) -> None:
+        # Başka bir süreç dosyayı değiştirmişse önce yeniden okunur; değişiklik
+        # güncel listedeki kayda uygulanır, araya giren eklemeler korunur.
+        with account_lock(self.kind):
+            self.refresh()
+            key = account_key(account["name"])
+            current = self.index.get(key)
+            if current is None:
+                # Hesap bu arada dosyadan silinmişse yeniden eklenir.
+                self.accounts.append(account)
+                self.index[key] = account
+            elif current.get("password", "") == password:
+                account["password"] = password
+                return
+            account["password"] = password
+            if current is not None:
+                current["password"] = password
+            self.save()
+
+_registries = {}
+
+def get_account_registry(kind: str) -> AccountRegistry:
+    registry = _registries.get(kind)
+    if registry is None:
+        registry = AccountRegistry(kind)
+        _registries[kind] = registry
+    return registry
+
+def get_teacher_registry() -> AccountRegistry:
+    return get_account_registry("teachers")
+
+def get_student_registry() -> AccountRegistry:
+    return get_account_registry("students")
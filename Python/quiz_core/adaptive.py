@@ -0,0 +1,173 @@
+import math
+import random
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+
+from .quiz import LEVEL_POINTS_BY_CODE, LEVELS, Question, Quiz
+
+# Rasch (1PL) modeli: P(doğru | θ) = 1 / (1 + exp(-(θ - b))). Kalibrasyon
+# verisi yokken madde güçlüğü b seviyeden gelir; item_difficulties ile soru
+# metni bazında kalibre edilmiş değerler verilebilir.
+LEVEL_DIFFICULTY = {"Kolay": -1.0, "Orta": 0.0, "Zor": 1.0}
+ADAPTIVE_CONFIDENCE = 0.75
+ADAPTIVE_MIN_QUESTIONS = 5
+ADAPTIVE_MAX_QUESTIONS = 15
+# get_level_label eşikleri (puan yüzdesi) ve etiketleri.
+LABEL_THRESHOLDS = (40.0, 70.0)
+LABELS = ("Beginner", "Intermediate", "Advanced")
+
+GRID = tuple(-4.0 + 0.1 * i for i in range(81))
+_PRIOR = tuple(math.exp(-0.5 * t * t) for t in GRID)
+
+def p_correct(theta: float, difficulty: float) -> float:
+    return 1.0 / (1.0 + math.exp(difficulty - theta))
+
+def expected_point_percent(theta: float, difficulties: Dict[str, float] = LEVEL_DIFFICULTY) -> float:
+    # Her seviyeden eşit sayıda sorulu standart sınavda beklenen puan yüzdesi.
+    weights = LEVEL_POINTS_BY_CODE
+    earned = sum(w * p_correct(theta, difficulties[level]) for w, level in zip(weights, LEVELS))
+    return earned / sum(weights) * 100
+
+def _ability_for(percent: float, difficulties: Dict[str, float]) -> float:
+    lo, hi = GRID[0] - 4, GRID[-1] + 4
+    for _ in range(60):
+        mid = (lo + hi) / 2
+        if expected_point_percent(mid, difficulties) < percent:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) / 2
+
+def label_cuts(difficulties: Dict[str, float] = LEVEL_DIFFICULTY) -> tuple:
+    # Seviye eşiklerinin yetenek (θ) ölçeğindeki karşılıkları.
+    return tuple(_ability_for(percent, difficulties) for percent in LABEL_THRESHOLDS)
+
+def label_for_ability(theta: float, cuts: Sequence[float]) -> str:
+    for label, cut in zip(LABELS, cuts):
+        if theta < cut:
+            return label
+    return LABELS[-1]
+
+class AdaptiveQuiz(Quiz):
+    # Bilgisayar uyarlamalı sınav: yetenek sonsal dağılımı (EAP, ızgara
+    # üzerinde, standart normal önsel) her cevapta güncellenir; sıradaki soru
+    # tahmine en yakın seviye eşiğinde en çok bilgi veren seviyeden seçilir.
+    # En olası seviyenin sonsal olasılığı `confidence`'a ulaşınca sınav biter.
+    def __init__(
+        self,
+        pools: Sequence[Sequence[Question]],
+        exam_end_time: Optional[datetime] = None,
+        confidence: float = ADAPTIVE_CONFIDENCE,
+        min_questions: int = ADAPTIVE_MIN_QUESTIONS,
+        max_questions: int = ADAPTIVE_MAX_QUESTIONS,
+        item_difficulties: Optional[Dict[str, float]] = None,
+        level_difficulty: Dict[str, float] = LEVEL_DIFFICULTY,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        super().__init__([], exam_end_time=exam_end_time)
+        self.remaining = [list(pool) for pool in pools]
+        self.confidence = confidence
+        self.min_questions = min_questions
+        self.max_questions = max_questions
+        self.item_difficulties = item_difficulties or {}
+        self.level_difficulty = level_difficulty
+        self.rng = rng or random.Random()
+        self.cuts = label_cuts(level_difficulty)
+        self.posterior = list(_PRIOR)
+        self.stopped = False
+        self._normalize()
+        self._serve_next()
+
+    def difficulty(self, question: Question) -> float:
+        value = self.item_difficulties.get(question.text)
+        if value is None:
+            value = self.level_difficulty[question.level]
+        return value
+
+    def _normalize(self) -> None:
+        total = sum(self.posterior)
+        self.posterior = [w / total for w in self.posterior]
+
+    @property
+    def ability(self) -> float:
+        return sum(t * w for t, w in zip(GRID, self.posterior))
+
+    @property
+    def ability_se(self) -> float:
+        mean = self.ability
+        return math.sqrt(sum((t - mean) ** 2 * w for t, w in zip(GRID, self.posterior)))
+
+    def label_probabilities(self) -> Dict[str, float]:
+        probs = dict.fromkeys(LABELS, 0.0)
+        for theta, weight in zip(GRID, self.posterior):
+            probs[label_for_ability(theta, self.cuts)] += weight
+        return probs
+
+    def classification(self) -> tuple:
+        probs = self.label_probabilities()
+        label = max(LABELS, key=probs.__getitem__)
+        return label, probs[label]
+
+    def _target(self) -> float:
+        theta = self.ability
+        return min(self.cuts, key=lambda cut: abs(cut - theta))
+
+    def _serve_next(self) -> None:
+        # Rasch modelinde bilgi p(1-p), güçlük hedefe yaklaştıkça artar.
+        target = self._target()
+        candidates = [code for code, pool in enumerate(self.remaining) if pool]
+        if not candidates:
+            self.stopped = True
+            return
+        code = min(candidates, key=lambda c: abs(self.level_difficulty[LEVELS[c]] - target))
+        pool = self.remaining[code]
+        best = min(abs(self.difficulty(q) - target) for q in pool)
+        choices = [i for i, q in enumerate(pool) if abs(self.difficulty(q) - target) == best]
+        question = pool.pop(self.rng.choice(choices))
+        self.questions.append(question)
+
+    def _should_stop(self) -> bool:
+        if self.answered >= self.max_questions:
+            return True
+        if self.answered < self.min_questions:
+            return False
+        return self.classification()[1] >= self.confidence
+
+    def answer_current(self, choice_index: int) -> bool:
+        # Süre dolduysa time_over index'i soru sayısına çeker; cevap sayılmaz,
+        # sonsal güncellenmez ve yeni soru getirilmez.
+        if self.early_terminated or self.time_over() or not self.has_more_questions():
+            return False
+        question = self.get_current_question()
+        correct = super().answer_current(choice_index)
+        b = self.difficulty(question)
+        self.posterior = [
+            w * (p_correct(t, b) if correct else 1.0 - p_correct(t, b))
+            for t, w in zip(GRID, self.posterior)
+        ]
+        self._normalize()
+        if self._should_stop():
+            self.stopped = True
+        else:
+            self._serve_next()
+        return correct
+
+    def planned_total(self) -> int:
+        return len(self.questions) if self.stopped else self.max_questions
+
+    def get_results(self):
+        results = list(super().get_results())
+        if self.answered:
+            # Uyarlamalı sınavda soru karışımı öğrenciye göre değiştiği için
+            # seviye ham puan yüzdesinden değil sonsal sınıflamadan gelir.
+            results[8] = self.classification()[0]
+        return tuple(results)
+
+    def record_extras(self) -> Dict[str, object]:
+        probability = self.classification()[1]
+        return {
+            "adaptive": True,
+            "ability": round(self.ability, 3),
+            "ability_se": round(self.ability_se, 3),
+            "label_confidence": round(probability, 3),
+        }
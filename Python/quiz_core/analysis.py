@@ -0,0 +1,120 @@
+from datetime import datetime
+from typing import Dict, Any
+
+from .quiz import Quiz
+
+def analyze_weak_areas(level_stats: dict) -> str:
+    infos = []
+    for level, stats in level_stats.items():
+        total = stats["correct"] + stats["wrong"]
+        if total == 0:
+            continue
+        acc = (stats["correct"] / total) * 100
+        infos.append((level, acc, total))
+    if not infos:
+        return "Bu sınavda soru cevaplanmadığı için seviye analizi yapılamadı."
+    weakest = min(infos, key=lambda x: x[1])
+    level_name, acc, total = weakest
+    if level_name == "Kolay":
+        extra = "Temel konuları biraz daha pekiştirmen iyi olur."
+    elif level_name == "Orta":
+        extra = "Orta seviye konularda (döngüler, fonksiyonlar, koleksiyonlar) biraz daha pratik yapabilirsin."
+    else:
+        extra = "İleri seviye konularda (OOP, generator, async, ileri fonksiyonlar) zorlanman normal; zamanla açılır."
+    return (
+        f"En çok zorlandığın seviye: {level_name} "
+        f"(doğruluk: {acc:.2f}%, toplam {total} soru). {extra}"
+    )
+
+# Kayıtlarda öneriler bu tablodaki sıra numaralarıyla saklanır: mevcut
+# cümlelerin yeri değişmemeli, yeni öneriler yalnızca sona eklenmelidir.
+SUGGESTION_TABLE = (
+    "Temel veri tipleri: int, float, str, bool",
+    "Karşılaştırma ve mantıksal operatörler",
+    "Koşul ifadeleri: if / elif / else",
+    "Temel döngüler: for ve while",
+    "Liste ve sözlük (list, dict) temelleri",
+    "Fonksiyon yazma ve parametreler (varsayılan parametreler dahil)",
+    "List, dict, set ve tuple ile pratik",
+    "List comprehension ve temel lambda kullanımı",
+    "try / except ile hata yönetimi",
+    "Dosya okuma/yazma (file I/O) ve with kullanımı",
+    "Nesne yönelimli programlama: class, __init__, miras (inheritance)",
+    "Generator ve iterator mantığı, yield kullanımı",
+    "Decorators ve ileri fonksiyonel programlama",
+    "Asenkron programlama: async / await",
+    "Sanal ortam (virtualenv) ve paket yönetimi (pip)",
+    "Değişken tanımlama ve isimlendirme kuralları",
+    "Temel aritmetik işlemler ve öncelik kuralları",
+    "Basit döngü örnekleri ile pratik",
+    "List/dict işlemleri (append, pop, insert, keys vs.)",
+    "range, enumerate, map, filter gibi fonksiyonları tekrar et",
+    "String dilimleme ve formatlama (format, f-string)",
+    "Decorator ve context manager örnekleri incele",
+    "PEP 8 stil rehberini gözden geçir",
+    "Gerçek projelerde OOP tasarım örneklerine bak",
+)
+SUGGESTION_IDS = {text: i for i, text in enumerate(SUGGESTION_TABLE)}
+LEVEL_LABEL_SUGGESTIONS = {
+    "Beginner": SUGGESTION_TABLE[0:5],
+    "Intermediate": SUGGESTION_TABLE[5:10],
+    "Advanced": SUGGESTION_TABLE[10:15],
+}
+WEAK_LEVEL_SUGGESTIONS = {
+    "Kolay": SUGGESTION_TABLE[15:18],
+    "Orta": SUGGESTION_TABLE[18:21],
+    "Zor": SUGGESTION_TABLE[21:24],
+}
+
+def build_study_suggestions(level_label: str, level_stats: dict):
+    suggestions = list(LEVEL_LABEL_SUGGESTIONS.get(level_label, LEVEL_LABEL_SUGGESTIONS["Advanced"]))
+    infos = []
+    for level, stats in level_stats.items():
+        total = stats["correct"] + stats["wrong"]
+        if total == 0:
+            continue
+        acc = (stats["correct"] / total) * 100
+        infos.append((level, acc, total))
+    if infos:
+        weakest = min(infos, key=lambda x: x[1])
+        level_name, acc, total = weakest
+        suggestions.extend(WEAK_LEVEL_SUGGESTIONS.get(level_name, WEAK_LEVEL_SUGGESTIONS["Zor"]))
+    seen = set()
+    unique_suggestions = []
+    for s in suggestions:
+        if s not in seen:
+            seen.add(s)
+            unique_suggestions.append(s)
+    return unique_suggestions
+
+def build_exam_record(quiz: Quiz, teacher_name: str) -> Dict[str, Any]:
+    (
+        correct,
+        wrong,
+        percent,
+        answered,
+        total_questions,
+        points,
+        max_points,
+        point_percent,
+        level_label,
+        level_stats,
+    ) = quiz.get_results()
+    record = {
+        "datetime": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "correct": correct,
+        "wrong": wrong,
+        "percent": percent,
+        "answered": answered,
+        "total_questions": total_questions,
+        "early_terminated": quiz.early_terminated,
+        "points": points,
+        "max_points": max_points,
+        "point_percent": point_percent,
+        "level_label": level_label,
+        "level_stats": level_stats,
+        "study_suggestions": build_study_suggestions(level_label, level_stats),
+        "teacher": teacher_name,
+    }
+    record.update(quiz.record_extras())
+    return record
@@ -0,0 +1,148 @@
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from .quiz import LEVELS
+from .records import ExamRecord
+from .reports import LEADERBOARD_SIZE, StudentStats, render_teacher_general_report
+from .shards import SHARD_COUNT, SHARD_KEYS, partition_results, read_shard, write_shards
+from .storage import load_results
+
+def _last_record_fields(record: Dict[str, Any]) -> Dict[str, Any]:
+    # Rapor son kayıttan yalnızca tarih ve seviye etiketini kullanır.
+    return {key: record[key] for key in ("datetime", "level_label") if key in record}
+
+def aggregate_shard(entries: list) -> Dict[str, Any]:
+    # Map adımı: bir parçanın öğrenci bazlı kısmi toplamları.
+    # students[isim] = [sıra, sınav sayısı, yüzde toplamı, en yüksek puan, son kayıt no, son kayıt]
+    students = {}
+    level_totals = {level: [0, 0] for level in LEVELS}
+    canonical_totals = [level_totals[level] for level in LEVELS]
+    records_count = 0
+    for name, order, records, seqs in entries:
+        if not records:
+            students.setdefault(name, [order, 0, 0, 0, -1, None])
+            continue
+        percent_sum = 0
+        best_points = 0
+        for index, record in enumerate(records):
+            points = record.get("points") or 0
+            if index == 0 or points > best_points:
+                best_points = points
+            percent_sum += record.get("percent") or 0
+            levels = record.levels if type(record) is ExamRecord else None
+            if levels is not None:
+                for i, totals in enumerate(canonical_totals):
+                    totals[0] += levels[2 * i]
+                    totals[1] += levels[2 * i + 1]
+                continue
+            for level, stats in (record.get("level_stats") or {}).items():
+                totals = level_totals.get(level)
+                if totals is None:
+                    totals = level_totals[level] = [0, 0]
+                totals[0] += stats.get("correct") or 0
+                totals[1] += stats.get("wrong") or 0
+        records_count += len(records)
+        last_seq = seqs[-1] if seqs else len(records) - 1
+        students[name] = [order, len(records), percent_sum, best_points, last_seq, _last_record_fields(records[-1])]
+    return {"students": students, "records": records_count, "level_totals": level_totals}
+
+def aggregate_shard_file(path: str) -> Dict[str, Any]:
+    return aggregate_shard(read_shard(path))
+
+def _aggregate_source(source) -> Dict[str, Any]:
+    if isinstance(source, str):
+        return aggregate_shard_file(source)
+    return aggregate_shard(source)
+
+class AnalyticsSummary:
+    def __init__(self, students: List[StudentStats], names: int, records: int, level_totals: Dict[str, list]) -> None:
+        self.students = students
+        self.names = names
+        self.records = records
+        self.level_totals = level_totals
+
+    def general_report(self, top_n: Optional[int] = None) -> str:
+        if not self.names:
+            return "Kayıtlı hiçbir öğrenci bulunamadı."
+        return render_teacher_general_report(self.students, top_n)
+
+    def level_report(self) -> str:
+        lines = ["[Seviye Bazlı Doğru / Yanlış]", "-" * 60]
+        for level, (correct, wrong) in self.level_totals.items():
+            total = correct + wrong
+            accuracy = (correct / total) * 100 if total else 0
+            lines.append(f"{level:<6}: {correct} doğru / {wrong} yanlış  (doğruluk: {accuracy:.2f}%)")
+        return "\n".join(lines)
+
+def merge_partials(partials: List[Dict[str, Any]]) -> AnalyticsSummary:
+    # Reduce adımı: sayılar ve toplamlar toplanır, en yüksek puan için max
+    # alınır, son kayıt en büyük kayıt numarasına sahip olandır.
+    merged = {}
+    level_totals = {level: [0, 0] for level in LEVELS}
+    records = 0
+    for partial in partials:
+        records += partial["records"]
+        for level, (correct, wrong) in partial["level_totals"].items():
+            totals = level_totals.setdefault(level, [0, 0])
+            totals[0] += correct
+            totals[1] += wrong
+        for name, row in partial["students"].items():
+            current = merged.get(name)
+            if current is None:
+                merged[name] = list(row)
+                continue
+            if row[1] == 0:
+                continue
+            if current[1] == 0 or row[3] > current[3]:
+                current[3] = row[3]
+            current[1] += row[1]
+            current[2] += row[2]
+            if row[4] > current[4]:
+                current[4] = row[4]
+                current[5] = row[5]
+    students = []
+    for name, (order, total, percent_sum, best_points, _, last_record) in sorted(merged.items(), key=lambda item: item[1][0]):
+        if total == 0:
+            continue
+        stats = StudentStats(name)
+        stats.total_exams = total
+        stats.percent_sum = percent_sum
+        stats.best_points = best_points
+        stats.last_record = last_record
+        students.append(stats)
+    return AnalyticsSummary(students, len(merged), records, level_totals)
+
+def run_analytics(sources: list, workers: Optional[int] = None) -> AnalyticsSummary:
+    # Kaynaklar parça dosyası yolları ya da partition_results çıktısıdır.
+    # Yollar verildiğinde her süreç kendi parçasını kendisi okur; bellekteki
+    # parçalar ise süreçlere pickle ile kopyalanır.
+    if workers == 1 or len(sources) <= 1:
+        partials = [_aggregate_source(source) for source in sources]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(_aggregate_source, sources))
+    return merge_partials(partials)
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m quiz_core.analytics")
+    parser.add_argument("--shards", type=int, default=SHARD_COUNT)
+    parser.add_argument("--by", choices=SHARD_KEYS, default="student")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dir", help="Parça dosyalarının yazılacağı klasör")
+    parser.add_argument("--top", type=int, default=LEADERBOARD_SIZE)
+    args = parser.parse_args(argv[1:])
+    results = load_results()
+    if args.dir:
+        sources = write_shards(results, args.dir, args.shards, args.by)
+    else:
+        sources = partition_results(results, args.shards, args.by)
+    summary = run_analytics(sources, args.workers)
+    print(summary.general_report(args.top))
+    print()
+    print(summary.level_report())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,92 @@
+from typing import List
+
+import numpy as np
+
+from .quiz import LEVELS, LEVEL_POINTS_BY_CODE, Question
+
+UNANSWERED = -1
+LEVEL_LABELS = ("Beginner", "Intermediate", "Advanced")
+
+class BatchResults:
+    # Her alan öğrenci sayısı uzunluğunda bir dizidir; result(i) Quiz.get_results()
+    # ile aynı tuple'ı döndürür.
+    def __init__(
+        self,
+        total_questions: int,
+        correct: np.ndarray,
+        answered: np.ndarray,
+        points: np.ndarray,
+        max_points: np.ndarray,
+        level_correct: np.ndarray,
+        level_wrong: np.ndarray,
+    ) -> None:
+        self.total_questions = total_questions
+        self.correct = correct
+        self.answered = answered
+        self.wrong = answered - correct
+        self.points = points
+        self.max_points = max_points
+        self.level_correct = level_correct
+        self.level_wrong = level_wrong
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.percent = np.where(answered > 0, correct / answered * 100, 0.0)
+            self.point_percent = np.where(max_points > 0, points / max_points * 100, 0.0)
+        # get_level_label ile aynı eşikler: <40 Beginner, <70 Intermediate, diğerleri Advanced
+        self.level_code = np.searchsorted(np.array([40.0, 70.0]), self.point_percent, side="right")
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+    def level_stats(self, i: int) -> dict:
+        return {
+            level: {
+                "correct": int(self.level_correct[i, code]),
+                "wrong": int(self.level_wrong[i, code]),
+            }
+            for code, level in enumerate(LEVELS)
+        }
+
+    def result(self, i: int):
+        answered = int(self.answered[i])
+        max_points = int(self.max_points[i])
+        return (
+            int(self.correct[i]),
+            int(self.wrong[i]),
+            float(self.percent[i]) if answered > 0 else 0,
+            answered,
+            self.total_questions,
+            int(self.points[i]),
+            max_points,
+            float(self.point_percent[i]) if max_points > 0 else 0,
+            LEVEL_LABELS[int(self.level_code[i])],
+            self.level_stats(i),
+        )
+
+    def results(self):
+        return [self.result(i) for i in range(len(self))]
+
+def grade_answer_sheets(questions: List[Question], choices) -> BatchResults:
+    # choices: (öğrenci x soru) seçilen şık indeksleri; UNANSWERED (-1) cevapsız demektir.
+    sheet = np.asarray(choices, dtype=np.int64)
+    if sheet.ndim != 2 or sheet.shape[1] != len(questions):
+        raise ValueError("Cevap matrisi (öğrenci sayısı, soru sayısı) boyutunda olmalı.")
+    answer_index = np.fromiter((q.answer_index for q in questions), dtype=np.int64, count=len(questions))
+    level_code = np.fromiter((q.level_code for q in questions), dtype=np.int64, count=len(questions))
+    weights = np.asarray(LEVEL_POINTS_BY_CODE, dtype=np.int64)[level_code]
+    level_onehot = (level_code[:, None] == np.arange(len(LEVELS))[None, :]).astype(np.int64)
+
+    answered_mask = sheet != UNANSWERED
+    correct_mask = answered_mask & (sheet == answer_index[None, :])
+    wrong_mask = answered_mask & ~correct_mask
+    correct_int = correct_mask.astype(np.int64)
+    answered_int = answered_mask.astype(np.int64)
+
+    return BatchResults(
+        total_questions=len(questions),
+        correct=correct_int.sum(axis=1),
+        answered=answered_int.sum(axis=1),
+        points=correct_int @ weights,
+        max_points=answered_int @ weights,
+        level_correct=correct_int @ level_onehot,
+        level_wrong=wrong_mask.astype(np.int64) @ level_onehot,
+    )
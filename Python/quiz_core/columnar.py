@@ -0,0 +1,280 @@
+import argparse
+import glob
+import json
+import os
+import sys
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from .analytics import AnalyticsSummary
+from .quiz import LEVELS
+from .reports import LEADERBOARD_SIZE, StudentStats
+from .storage import load_results
+
+COLUMNAR_DIR = "results.columns"
+COLUMNAR_META = "meta.json"
+NO_CODE = -1
+NULL_CODE = -2
+NO_TIME = np.iinfo(np.int64).min
+NULL_TIME = NO_TIME + 1
+
+# Sütun adı -> (dtype, satır başına eleman). Eksik ya da null sayısal alanlar
+# 0 yazılır (raporlar da öyle sayar); eksik kodlar NO_CODE, kayıtta açıkça
+# null olanlar NULL_CODE / NULL_TIME'dır: rapor bunları "None" diye gösterir.
+COLUMNS = {
+    "student": (np.int32, 1),
+    "seq": (np.int32, 1),
+    "teacher": (np.int32, 1),
+    "level_label": (np.int16, 1),
+    "timestamp": (np.int64, 1),
+    "points": (np.int32, 1),
+    "max_points": (np.int32, 1),
+    "percent": (np.float64, 1),
+    "point_percent": (np.float64, 1),
+    "correct": (np.int32, 1),
+    "wrong": (np.int32, 1),
+    "answered": (np.int32, 1),
+    "early_terminated": (np.int8, 1),
+    "level_counts": (np.int32, 2 * len(LEVELS)),
+}
+
+def _column_file(directory: str, name: str, generation: int) -> str:
+    return os.path.join(directory, f"{name}.{generation}.bin")
+
+def _read_meta(directory: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(directory, COLUMNAR_META), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_meta(directory: str, meta: Dict[str, Any]) -> None:
+    # Satır sayısı meta ile yayımlanır: okuyucular yalnızca meta'daki kadar satırı görür.
+    path = os.path.join(directory, COLUMNAR_META)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _timestamps(values: list) -> np.ndarray:
+    # "YYYY-MM-DD HH:MM:SS" -> epoch saniye (saat dilimsiz); okunamayan tarih NO_TIME.
+    try:
+        return np.array(values, dtype="datetime64[s]").astype(np.int64)
+    except (ValueError, TypeError):
+        out = np.empty(len(values), dtype=np.int64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = np.datetime64(value, "s").astype(np.int64)
+            except (ValueError, TypeError):
+                out[i] = NO_TIME
+        return out
+
+def format_timestamps(values: np.ndarray) -> List[str]:
+    times = np.asarray(values, dtype=np.int64)
+    text = np.datetime_as_string(times.astype("datetime64[s]"), unit="s")
+    return ["?" if t <= NULL_TIME else s.replace("T", " ") for t, s in zip(times.tolist(), text.tolist())]
+
+class _Encoder:
+    # Yeni kayıtları sütun listelerine ve sözlük kodlarına çevirir.
+    def __init__(self, meta: Dict[str, Any]) -> None:
+        self.meta = meta
+        self.codes = {
+            key: {value: code for code, value in enumerate(meta[key])}
+            for key in ("students", "teachers", "level_labels")
+        }
+        self.columns = {name: [] for name in COLUMNS}
+        self.dates = []
+        self.null_dates = []
+
+    def code(self, key: str, value, present: bool = False) -> int:
+        if value is None:
+            return NULL_CODE if present else NO_CODE
+        codes = self.codes[key]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self.meta[key].append(value)
+        return code
+
+    def add(self, student: int, seq: int, record) -> None:
+        columns = self.columns
+        get = record.get
+        columns["student"].append(student)
+        columns["seq"].append(seq)
+        columns["teacher"].append(self.code("teachers", get("teacher")))
+        columns["level_label"].append(self.code("level_labels", get("level_label"), "level_label" in record))
+        date = get("datetime")
+        if date is None and "datetime" in record:
+            self.null_dates.append(len(self.dates))
+        self.dates.append(date)
+        columns["points"].append(get("points") or 0)
+        columns["max_points"].append(get("max_points") or 0)
+        columns["percent"].append(get("percent") or 0)
+        columns["point_percent"].append(get("point_percent") or 0)
+        columns["correct"].append(get("correct") or 0)
+        columns["wrong"].append(get("wrong") or 0)
+        columns["answered"].append(get("answered") or 0)
+        early = get("early_terminated")
+        columns["early_terminated"].append(NO_CODE if early is None else int(bool(early)))
+        levels = getattr(record, "levels", None)
+        if levels is None:
+            level_stats = get("level_stats") or {}
+            levels = []
+            for level in LEVELS:
+                stats = level_stats.get(level) or {}
+                levels.append(stats.get("correct") or 0)
+                levels.append(stats.get("wrong") or 0)
+        columns["level_counts"].extend(levels)
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        timestamps = _timestamps(self.dates)
+        timestamps[self.null_dates] = NULL_TIME
+        self.columns["timestamp"] = timestamps
+        return {name: np.asarray(values, dtype=COLUMNS[name][0]) for name, values in self.columns.items()}
+
+def _empty_meta(generation: int) -> Dict[str, Any]:
+    return {"generation": generation, "rows": 0, "students": [], "teachers": [], "level_labels": []}
+
+def refresh_snapshot(results: Dict[str, Any], directory: str = COLUMNAR_DIR) -> Dict[str, int]:
+    # Kayıtlar öğrenci başına yalnızca sona eklenir; bu yüzden her öğrencinin
+    # sütunlardaki kayıt sayısından sonrası yenidir. Bir öğrencinin kaydı
+    # azalmışsa (sonuçlar değiştirilmiş) görüntü baştan kurulur.
+    os.makedirs(directory, exist_ok=True)
+    meta = _read_meta(directory)
+    rebuild = meta is None
+    exported = None
+    if not rebuild:
+        rows = meta["rows"]
+        path = _column_file(directory, "student", meta["generation"])
+        students = np.memmap(path, dtype=np.int32, mode="r", shape=(rows,)) if rows else np.empty(0, np.int32)
+        exported = np.bincount(students, minlength=len(meta["students"]))
+        del students
+        known = {name: code for code, name in enumerate(meta["students"])}
+        for name, code in known.items():
+            if len(results.get(name, ())) < exported[code]:
+                rebuild = True
+                break
+    if rebuild:
+        old_generation = meta["generation"] if meta else 0
+        meta = _empty_meta(old_generation + 1)
+        exported = np.zeros(0, dtype=np.int64)
+    encoder = _Encoder(meta)
+    for name, records in results.items():
+        student = encoder.code("students", name)
+        start = int(exported[student]) if student < len(exported) else 0
+        for seq in range(start, len(records)):
+            encoder.add(student, seq, records[seq])
+    arrays = encoder.arrays()
+    added = len(arrays["student"])
+    generation = meta["generation"]
+    rows = meta["rows"]
+    for name, (dtype, width) in COLUMNS.items():
+        path = _column_file(directory, name, generation)
+        # Yarıda kalmış önceki bir yazımın meta'da yayımlanmamış kuyruğu atılır.
+        with open(path, "ab") as f:
+            f.truncate(rows * width * np.dtype(dtype).itemsize)
+            f.write(arrays[name].tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+    meta["rows"] = rows + added
+    _write_meta(directory, meta)
+    if rebuild:
+        for path in glob.glob(os.path.join(directory, "*.bin")):
+            if not path.endswith(f".{generation}.bin"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    return {"added": added, "rows": meta["rows"], "rebuilt": int(rebuild)}
+
+class ColumnarSnapshot:
+    # Sütunlar np.memmap ile açılır; yalnızca kullanılan sütunlar sayfalanır.
+    def __init__(self, directory: str = COLUMNAR_DIR) -> None:
+        meta = _read_meta(directory)
+        if meta is None:
+            raise FileNotFoundError(f"Sütunlu görüntü bulunamadı: {directory}")
+        self.directory = directory
+        self.meta = meta
+        self.rows = meta["rows"]
+        self.students = meta["students"]
+        self.teachers = meta["teachers"]
+        self.level_labels = meta["level_labels"]
+        self._columns = {}
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def column(self, name: str) -> np.ndarray:
+        array = self._columns.get(name)
+        if array is None:
+            dtype, width = COLUMNS[name]
+            shape = (self.rows,) if width == 1 else (self.rows, width)
+            if self.rows:
+                path = _column_file(self.directory, name, self.meta["generation"])
+                array = np.memmap(path, dtype=dtype, mode="r", shape=shape)
+            else:
+                array = np.empty(shape, dtype=dtype)
+            self._columns[name] = array
+        return array
+
+    def level_totals(self) -> Dict[str, list]:
+        sums = self.column("level_counts").sum(axis=0, dtype=np.int64)
+        return {level: [int(sums[2 * i]), int(sums[2 * i + 1])] for i, level in enumerate(LEVELS)}
+
+    def summary(self) -> AnalyticsSummary:
+        # AnalyticsSummary ile aynı öğrenci istatistikleri; öğrenci sırası
+        # sözlükteki ilk görülme sırasıdır (results sözlüğünün sırası).
+        count = len(self.students)
+        student = self.column("student")
+        exams = np.bincount(student, minlength=count)
+        percent_sum = np.bincount(student, weights=self.column("percent"), minlength=count)
+        best = np.full(count, np.iinfo(np.int64).min, dtype=np.int64)
+        np.maximum.at(best, student, self.column("points"))
+        # Bir öğrencinin kayıtları satırlara hep sırayla eklenir: son kayıt en büyük satırdır.
+        last = np.full(count, -1, dtype=np.int64)
+        np.maximum.at(last, student, np.arange(self.rows, dtype=np.int64))
+        present = np.flatnonzero(exams)
+        last_rows = last[present]
+        times = self.column("timestamp")[last_rows]
+        dates = format_timestamps(times)
+        null_dates = (times == NULL_TIME).tolist()
+        labels = self.column("level_label")[last_rows].tolist()
+        students = []
+        for i, code in enumerate(present.tolist()):
+            stats = StudentStats(self.students[code])
+            stats.total_exams = int(exams[code])
+            stats.percent_sum = float(percent_sum[code])
+            stats.best_points = int(best[code])
+            last_record = {}
+            if null_dates[i]:
+                last_record["datetime"] = None
+            elif dates[i] != "?":
+                last_record["datetime"] = dates[i]
+            if labels[i] == NULL_CODE:
+                last_record["level_label"] = None
+            elif labels[i] != NO_CODE:
+                last_record["level_label"] = self.level_labels[labels[i]]
+            stats.last_record = last_record
+            students.append(stats)
+        return AnalyticsSummary(students, count, self.rows, self.level_totals())
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m quiz_core.columnar")
+    parser.add_argument("--dir", default=COLUMNAR_DIR)
+    parser.add_argument("--top", type=int, default=LEADERBOARD_SIZE)
+    parser.add_argument("--no-refresh", action="store_true", help="Görüntüyü güncellemeden yalnızca oku")
+    args = parser.parse_args(argv[1:])
+    if not args.no_refresh:
+        info = refresh_snapshot(load_results(), args.dir)
+        print(f"Görüntü güncellendi: +{info['added']} kayıt, toplam {info['rows']}", file=sys.stderr)
+    summary = ColumnarSnapshot(args.dir).summary()
+    print(summary.general_report(args.top))
+    print()
+    print(summary.level_report())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,232 @@
+import argparse
+import sys
+import unicodedata
+import zlib
+from array import array
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from .accounts import account_key
+from .quiz import LEVEL_CODES, Question
+from .questions import get_question_bank
+
+# Benzerlik, soru metni ve sıralanmış şıklardan oluşan içeriğin 4 baytlık
+# parçalarının (shingle) Jaccard benzerliğidir. İmza tek geçişli MinHash'tir
+# (one permutation hashing): her parça bir kez crc32 ile özetlenir, özetin
+# düşük bitleri bölmeyi, kalanı bölmedeki değeri belirler; boş bölmeler
+# yandaki bölmeden doldurulur. İmzalar LSH bantlarına bölünerek sözlüklere
+# konur; aday sayısı banka büyüdükçe artmaz.
+SHINGLE_SIZE = 4
+SIGNATURE_BITS = 5
+SIGNATURE_SIZE = 1 << SIGNATURE_BITS
+LSH_BANDS = 8
+LSH_ROWS = SIGNATURE_SIZE // LSH_BANDS
+SIMILARITY_THRESHOLD = 0.8
+_BIN_MASK = SIGNATURE_SIZE - 1
+_EMPTY = 0xFFFFFFFF
+_ROTATION = 0x9E3779B1
+
+def normalize_text(text: str) -> str:
+    # Türkçe büyük/küçük harf katlaması ve boşluklar isim anahtarıyla aynıdır
+    # (account_key); ayrık yazılmış "İ"nin birleşen noktası önce atılır.
+    return account_key(unicodedata.normalize("NFKC", text).replace("\u0307", ""))
+
+def _content(text: str, choices: Sequence[str]) -> bytes:
+    # Şıkların sırası farklı olsa da aynı soru aynı içeriği verir.
+    return "\x1e".join([normalize_text(text)] + sorted(normalize_text(c) for c in choices)).encode("utf-8")
+
+def _content_key(data: bytes) -> int:
+    return zlib.crc32(data) << 32 | zlib.adler32(data)
+
+def content_key(text: str, choices: Sequence[str]) -> int:
+    return _content_key(_content(text, choices))
+
+def duplicate_choices(choices: Sequence[str]) -> List[Tuple[int, ...]]:
+    # Normalize edilince aynı olan şıkların (0 tabanlı) indeks grupları.
+    groups: Dict[str, List[int]] = {}
+    for i, choice in enumerate(choices):
+        groups.setdefault(normalize_text(choice), []).append(i)
+    return [tuple(group) for group in groups.values() if len(group) > 1]
+
+def minhash_signature(text: str, choices: Sequence[str]) -> List[int]:
+    return _signature(_content(text, choices))
+
+def _signature(data: bytes) -> List[int]:
+    crc32 = zlib.crc32
+    signature = [_EMPTY] * SIGNATURE_SIZE
+    for i in range(max(1, len(data) - SHINGLE_SIZE + 1)):
+        h = crc32(data[i:i + SHINGLE_SIZE])
+        b = h & _BIN_MASK
+        value = h >> SIGNATURE_BITS
+        if value < signature[b]:
+            signature[b] = value
+    if _EMPTY in signature:
+        # Yoğunlaştırma: boş bölme, sağındaki ilk dolu bölmenin değerini
+        # uzaklığa göre kaydırılmış olarak alır (iki soruda da aynı kural).
+        filled = [value for value in signature if value != _EMPTY]
+        if filled:
+            for b in range(SIGNATURE_SIZE):
+                if signature[b] == _EMPTY:
+                    step = 1
+                    while signature[(b + step) & _BIN_MASK] == _EMPTY:
+                        step += 1
+                    source = signature[(b + step) & _BIN_MASK]
+                    signature[b] = (source + step * _ROTATION) & 0x07FFFFFF | 0x08000000
+    return signature
+
+def estimate_similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    return sum(x == y for x, y in zip(a, b)) / SIGNATURE_SIZE
+
+class QuestionIndex:
+    # Kimlik (id) çağıranındır; ör. (seviye, sıra) ya da soru nesnesi.
+    # İmzalar tek bir array('I') içinde tutulur: soru başına 128 bayt.
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.ids: List[Any] = []
+        self.signatures = array("I")
+        self.exact: Dict[int, int] = {}
+        # Bant anahtarı -> tek kayıt (int) ya da kayıt listesi.
+        self.bands: List[Dict[int, Any]] = [{} for _ in range(LSH_BANDS)]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, qid: Any, text: str, choices: Sequence[str]) -> None:
+        row = len(self.ids)
+        self.ids.append(qid)
+        data = _content(text, choices)
+        self.exact.setdefault(_content_key(data), row)
+        signature = _signature(data)
+        self.signatures.extend(signature)
+        for band, key in zip(self.bands, self._band_keys(signature)):
+            bucket = band.get(key)
+            if bucket is None:
+                band[key] = row
+            elif isinstance(bucket, list):
+                bucket.append(row)
+            else:
+                band[key] = [bucket, row]
+
+    def add_question(self, qid: Any, question: Question) -> None:
+        self.add(qid, question.text, question.choices)
+
+    @staticmethod
+    def _band_keys(signature: Sequence[int]) -> List[int]:
+        return [hash(tuple(signature[i:i + LSH_ROWS])) for i in range(0, SIGNATURE_SIZE, LSH_ROWS)]
+
+    def _row_signature(self, row: int) -> array:
+        start = row * SIGNATURE_SIZE
+        return self.signatures[start:start + SIGNATURE_SIZE]
+
+    def find_exact(self, text: str, choices: Sequence[str]) -> Optional[Any]:
+        row = self.exact.get(content_key(text, choices))
+        return None if row is None else self.ids[row]
+
+    def similar(
+        self,
+        text: str,
+        choices: Sequence[str],
+        threshold: Optional[float] = None,
+        limit: int = 5,
+    ) -> List[Tuple[Any, float]]:
+        # Tahmini benzerliği eşiği geçen sorular, en benzer önce. Birebir
+        # aynısı (normalize edilmiş metin ve şıklar) 1.0 ile başa gelir.
+        threshold = self.threshold if threshold is None else threshold
+        found: Dict[int, float] = {}
+        data = _content(text, choices)
+        exact = self.exact.get(_content_key(data))
+        if exact is not None:
+            found[exact] = 1.0
+        signature = _signature(data)
+        candidates = set()
+        for band, key in zip(self.bands, self._band_keys(signature)):
+            bucket = band.get(key)
+            if bucket is None:
+                continue
+            if isinstance(bucket, list):
+                candidates.update(bucket)
+            else:
+                candidates.add(bucket)
+        for row in candidates:
+            if row in found:
+                continue
+            score = estimate_similarity(signature, self._row_signature(row))
+            if score >= threshold:
+                found[row] = score
+        ranked = sorted(found.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [(self.ids[row], score) for row, score in ranked]
+
+    def duplicate_pairs(self, threshold: Optional[float] = None) -> List[Tuple[Any, Any, float]]:
+        # Dizindeki tüm benzer çiftler (her çift bir kez).
+        threshold = self.threshold if threshold is None else threshold
+        pairs = []
+        seen = set()
+        for band in self.bands:
+            for bucket in band.values():
+                if not isinstance(bucket, list):
+                    continue
+                for i, a in enumerate(bucket):
+                    for b in bucket[i + 1:]:
+                        if (a, b) in seen:
+                            continue
+                        seen.add((a, b))
+                        score = estimate_similarity(self._row_signature(a), self._row_signature(b))
+                        if score >= threshold:
+                            pairs.append((self.ids[a], self.ids[b], score))
+        pairs.sort(key=lambda pair: -pair[2])
+        return pairs
+
+def build_question_index(pools: Sequence[Sequence[Question]], threshold: float = SIMILARITY_THRESHOLD) -> QuestionIndex:
+    # Kimlik (seviye, havuzdaki sıra) olur.
+    index = QuestionIndex(threshold)
+    for pool in pools:
+        for position, question in enumerate(pool):
+            index.add_question((question.level, position), question)
+    return index
+
+_question_index = None
+_question_index_pools = ()
+
+def get_question_index() -> QuestionIndex:
+    # QuestionBank havuzları yenilenince (yeni tuple nesneleri) dizin yeniden kurulur.
+    global _question_index, _question_index_pools
+    pools = get_question_bank().pools()
+    if _question_index is None or any(a is not b for a, b in zip(_question_index_pools, pools)):
+        _question_index = build_question_index(pools)
+        _question_index_pools = pools
+    return _question_index
+
+def add_to_question_index(level: str, text: str, choices: Sequence[str]) -> None:
+    # Öğretmenin az önce kaydettiği soru dizine eklenir. Havuzlar yalnızca bu
+    # soru kadar büyümüşse dizin baştan kurulmaz; başka bir değişiklik varsa
+    # dizin bir sonraki get_question_index çağrısında yeniden kurulur.
+    global _question_index_pools
+    if _question_index is None:
+        return
+    pools = get_question_bank().pools()
+    code = LEVEL_CODES[level]
+    grown = [len(new) - len(old) for old, new in zip(_question_index_pools, pools)]
+    if grown == [int(i == code) for i in range(len(pools))]:
+        _question_index.add((level, len(pools[code]) - 1), text, choices)
+        _question_index_pools = pools
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m quiz_core.duplicates")
+    parser.add_argument("--threshold", type=float, default=SIMILARITY_THRESHOLD)
+    args = parser.parse_args(argv[1:])
+    pools = get_question_bank().pools()
+    index = build_question_index(pools, args.threshold)
+    by_id = {(q.level, i): q for pool in pools for i, q in enumerate(pool)}
+    problems = 0
+    for qid, question in by_id.items():
+        for group in duplicate_choices(question.choices):
+            problems += 1
+            numbers = ", ".join(str(i + 1) for i in group)
+            print(f"Tekrar eden şık ({numbers}) [{qid[0]}]: {question.text}")
+    for a, b, score in index.duplicate_pairs():
+        problems += 1
+        print(f"Benzer sorular (%{score * 100:.0f}) [{a[0]}] {by_id[a].text!r} ~ [{b[0]}] {by_id[b].text!r}")
+    print(f"{len(index)} soru tarandı, {problems} sorun bulundu.")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
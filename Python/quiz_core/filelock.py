@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+class FileLock:
+    # Süreçler arası tavsiye niteliğinde kilit (POSIX: flock, Windows:
+    # msvcrt.locking). Aynı süreçteki iş parçacıkları için RLock gibi davranır.
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.thread_lock = threading.RLock()
+        self.fd = None
+        self.depth = 0
+
+    def _lock_fd(self, fd: int, blocking: bool) -> bool:
+        if fcntl is not None:
+            if blocking:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                return True
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                return True
+            except OSError:
+                if not blocking:
+                    return False
+                # LK_LOCK yalnızca ~10 sn dener; beklemeyi kendimiz sürdürürüz.
+                time.sleep(0.05)
+
+    def acquire(self, blocking: bool = True) -> bool:
+        if not self.thread_lock.acquire(blocking):
+            return False
+        if self.depth:
+            self.depth += 1
+            return True
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        except BaseException:
+            self.thread_lock.release()
+            raise
+        locked = False
+        try:
+            locked = self._lock_fd(fd, blocking)
+        finally:
+            if not locked:
+                os.close(fd)
+                self.thread_lock.release()
+        if not locked:
+            return False
+        self.fd = fd
+        self.depth = 1
+        return True
+
+    def release(self) -> None:
+        self.depth -= 1
+        if self.depth == 0:
+            fd, self.fd = self.fd, None
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                else:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            finally:
+                os.close(fd)
+        self.thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
@@ -0,0 +1,286 @@
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import mmap
+import os
+import random
+import sys
+from array import array
+from typing import Dict, Any, List, Optional, Sequence
+
+from .quiz import LEVELS, Question
+from .questions import build_exam_questions, get_question_bank
+
+EXAM_FORMS_FILE = "exam_forms.bin"
+FORMS_VERSION = 1
+
+# Dosya düzeni: tek satırlık JSON başlık, ardından satır başına bir form olacak
+# şekilde uint16 (little-endian) soru numaraları. Soru numarası seviye
+# havuzlarının art arda eklenmiş hâlindeki sıradır (Kolay, Orta, Zor); form
+# satırı soruların sunum sırasını da tutar.
+
+def pools_fingerprint(pools: Sequence[Sequence[Question]]) -> str:
+    # Formlar havuzdaki sıra numaralarını tuttuğu için soru ekleme/silme
+    # sonrası eski formlar geçersizdir; parmak izi bunu yakalar.
+    digest = hashlib.sha1()
+    for pool in pools:
+        digest.update(f"{len(pool)}\x1e".encode("utf-8"))
+        for q in pool:
+            parts = [q.text, *q.choices, str(q.answer_index), q.level]
+            digest.update(("\x1f".join(parts) + "\x1e").encode("utf-8"))
+    return digest.hexdigest()
+
+def max_distinct_forms(pool_sizes: Sequence[int], per_level: int) -> int:
+    return math.prod(math.comb(n, per_level) for n in pool_sizes)
+
+def _deal(rng, n: int, count: int, per_level: int):
+    # Karıştırılmış desteler art arda dağıtılır: her soru bir destede bir kez
+    # geçer, bu yüzden kullanım sayıları (ve ardışık her form aralığında)
+    # en fazla bir farklıdır. Bir formun iki desteye bölündüğü sınırda tekrar
+    # eden soru, yeni destenin o formdan sonraki bir sorusuyla yer değiştirir.
+    import numpy as np
+
+    total = count * per_level
+    decks = -(-total // n)
+    flat = rng.permuted(np.tile(np.arange(n, dtype=np.int32), (decks, 1)), axis=1).reshape(-1)
+    for deck in range(1, decks):
+        start = deck * n
+        form_start = start - start % per_level
+        if form_start == start:
+            continue
+        form_end = min(form_start + per_level, total)
+        tail = set(flat[form_start:start].tolist())
+        head = flat[start:form_end].tolist()
+        for pos, value in enumerate(head, start):
+            if value not in tail:
+                continue
+            for j in range(form_start + per_level, start + n):
+                candidate = int(flat[j])
+                if candidate not in tail and candidate not in head:
+                    flat[pos], flat[j] = candidate, value
+                    head[pos - start] = candidate
+                    break
+    return flat[:total].reshape(count, per_level)
+
+DISTINCT_ATTEMPTS = 10_000
+
+def _make_distinct(blocks: list, rng) -> int:
+    # Aynı soru kümesine düşen formlar, aynı seviyeden başka bir formla birer
+    # soru takas ederek ayrıştırılır; takas kullanım sayılarını değiştirmez.
+    # Havuz neredeyse tükenmişse takas bulunamayabilir: ValueError.
+    import numpy as np
+
+    count = len(blocks[0])
+    # Anahtar, seviye blokları ayrı ayrı sıralanıp yan yana konmuş satırdır.
+    keys = np.concatenate([np.sort(block, axis=1) for block in blocks], axis=1)
+    _, first = np.unique(keys, axis=0, return_index=True)
+    if len(first) == count:
+        return 0
+    seen = {}
+    for row in first.tolist():
+        seen[tuple(keys[row].tolist())] = row
+    duplicates = sorted(set(range(count)) - set(first.tolist()))
+
+    def key_of(row: int) -> tuple:
+        return tuple(itertools.chain.from_iterable(sorted(block[row].tolist()) for block in blocks))
+
+    swaps = 0
+    for row in duplicates:
+        for _ in range(DISTINCT_ATTEMPTS):
+            block = blocks[int(rng.integers(len(blocks)))]
+            other = int(rng.integers(count))
+            i = int(rng.integers(block.shape[1]))
+            j = int(rng.integers(block.shape[1]))
+            x, y = int(block[row, i]), int(block[other, j])
+            if other == row or y in block[row] or x in block[other]:
+                continue
+            old_other = key_of(other)
+            block[row, i], block[other, j] = y, x
+            new_row, new_other = key_of(row), key_of(other)
+            if new_row not in seen and (new_other not in seen or seen[new_other] == other) and new_row != new_other:
+                if seen.get(old_other) == other:
+                    del seen[old_other]
+                seen[new_row] = row
+                seen[new_other] = other
+                swaps += 1
+                break
+            block[row, i], block[other, j] = x, y
+        else:
+            raise ValueError(f"Bu havuzdan {count} farklı form dengeli üretilemedi; form sayısını azaltın.")
+    return swaps
+
+def generate_forms(
+    pools: Sequence[Sequence[Question]],
+    count: int,
+    per_level: int = 5,
+    seed: int = 0,
+):
+    # Aynı havuz ve tohumla her çağrı aynı formları üretir. Dönen dizi
+    # (count, seviye sayısı * per_level) boyutunda uint16 soru numaralarıdır.
+    import numpy as np
+
+    sizes = [len(pool) for pool in pools]
+    if min(sizes) < per_level:
+        raise ValueError("Her seviye için yeterli sayıda soru yok.")
+    if sum(sizes) > np.iinfo(np.uint16).max:
+        raise ValueError("Soru havuzu form dosyası için fazla büyük.")
+    limit = max_distinct_forms(sizes, per_level)
+    if count > limit:
+        raise ValueError(f"Bu havuzdan en fazla {limit} farklı form üretilebilir.")
+    rng = np.random.default_rng(seed)
+    blocks = [_deal(rng, n, count, per_level) for n in sizes]
+    _make_distinct(blocks, rng)
+    offsets = np.cumsum([0] + sizes[:-1])
+    forms = np.concatenate([block + offset for block, offset in zip(blocks, offsets)], axis=1)
+    return rng.permuted(forms, axis=1).astype("<u2")
+
+def write_forms(
+    forms,
+    pools: Sequence[Sequence[Question]],
+    per_level: int,
+    seed: int,
+    path: str = EXAM_FORMS_FILE,
+) -> Dict[str, Any]:
+    header = {
+        "version": FORMS_VERSION,
+        "count": int(forms.shape[0]),
+        "width": int(forms.shape[1]),
+        "per_level": per_level,
+        "seed": seed,
+        "pool_sizes": [len(pool) for pool in pools],
+        "fingerprint": pools_fingerprint(pools),
+    }
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        f.write(forms.astype("<u2").tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    return header
+
+class ExamForms:
+    # Form dosyası mmap ile açılır; bir formu okumak tek bir dilim kopyasıdır.
+    # Dağıtım rastgele bir formdan başlayıp sırayla ilerler: ardışık formların
+    # kullanım sayıları dengeli olduğu için sunucu yeniden başlasa da denge korunur.
+    def __init__(self, path: str = EXAM_FORMS_FILE) -> None:
+        with open(path, "rb") as f:
+            header = json.loads(f.readline().decode("utf-8"))
+            self.offset = f.tell()
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if header.get("version") != FORMS_VERSION:
+            raise ValueError(f"Desteklenmeyen form dosyası sürümü: {header.get('version')}")
+        self.path = path
+        self.header = header
+        self.count = header["count"]
+        self.width = header["width"]
+        self.per_level = header["per_level"]
+        self.seed = header["seed"]
+        self.fingerprint = header["fingerprint"]
+        self.row_bytes = self.width * 2
+        if len(self._map) - self.offset != self.count * self.row_bytes:
+            raise ValueError("Form dosyası eksik ya da bozuk.")
+        self._cursor = itertools.count(random.randrange(self.count)) if self.count else None
+        self._checked_pools = None
+        self._bank_pools = None
+        self._bank = ()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._map.close()
+
+    @staticmethod
+    def _same_pools(cached, pools: Sequence[Sequence[Question]]) -> bool:
+        return cached is not None and len(cached) == len(pools) and all(a is b for a, b in zip(cached, pools))
+
+    def matches(self, pools: Sequence[Sequence[Question]]) -> bool:
+        # QuestionBank havuzları değişene kadar aynı tuple nesneleridir; parmak
+        # izi yalnızca yeni havuzlar için hesaplanır.
+        if self._same_pools(self._checked_pools, pools):
+            return True
+        if pools_fingerprint(pools) != self.fingerprint:
+            return False
+        self._checked_pools = tuple(pools)
+        return True
+
+    def form(self, number: int) -> List[int]:
+        start = self.offset + number * self.row_bytes
+        row = array("H", self._map[start:start + self.row_bytes])
+        if sys.byteorder == "big":
+            row.byteswap()
+        return row.tolist()
+
+    def questions(self, number: int, pools: Sequence[Sequence[Question]]) -> List[Question]:
+        # Düzleştirilmiş banka havuzlar değişene kadar bir kez kurulur.
+        if not self._same_pools(self._bank_pools, pools):
+            self._bank = tuple(itertools.chain.from_iterable(pools))
+            self._bank_pools = tuple(pools)
+        bank = self._bank
+        return [bank[i] for i in self.form(number)]
+
+    def next_number(self) -> int:
+        return next(self._cursor) % self.count
+
+    def next_questions(self, pools: Sequence[Sequence[Question]]) -> List[Question]:
+        return self.questions(self.next_number(), pools)
+
+_exam_forms = None
+_exam_forms_key = None
+
+def get_exam_forms(path: str = EXAM_FORMS_FILE) -> Optional[ExamForms]:
+    # Dosya yoksa ya da okunamıyorsa None; dosya değişince yeniden açılır.
+    global _exam_forms, _exam_forms_key
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    if key != _exam_forms_key:
+        try:
+            forms = ExamForms(path)
+        except (OSError, ValueError, KeyError):
+            forms = None
+        _exam_forms, _exam_forms_key = forms, key
+    return _exam_forms
+
+def draw_exam_questions(easy, medium, hard, per_level: int = 5) -> List[Question]:
+    # Güncel bir form dosyası varsa sınav bir form okumasıdır; yoksa ya da soru
+    # havuzu değişmişse eskisi gibi rastgele seçilir.
+    pools = (easy, medium, hard)
+    forms = get_exam_forms()
+    if forms is not None and forms.count and forms.per_level == per_level and forms.matches(pools):
+        return forms.next_questions(pools)
+    return build_exam_questions(easy, medium, hard, per_level=per_level)
+
+def exposure_counts(forms, pool_sizes: Sequence[int]) -> List[list]:
+    import numpy as np
+
+    counts = np.bincount(np.asarray(forms, dtype=np.int64).reshape(-1), minlength=sum(pool_sizes))
+    bounds = np.cumsum([0] + list(pool_sizes))
+    return [counts[a:b].tolist() for a, b in zip(bounds[:-1], bounds[1:])]
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m quiz_core.forms")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--per-level", type=int, default=5)
+    parser.add_argument("--out", default=EXAM_FORMS_FILE)
+    args = parser.parse_args(argv[1:])
+    pools = get_question_bank().pools()
+    try:
+        forms = generate_forms(pools, args.count, args.per_level, args.seed)
+    except ValueError as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    header = write_forms(forms, pools, args.per_level, args.seed, args.out)
+    print(f"{header['count']} form yazıldı: {args.out} ({os.path.getsize(args.out) / 1e6:.2f} MB)")
+    for level, counts in zip(LEVELS, exposure_counts(forms, header["pool_sizes"])):
+        print(f"{level:<6}: soru başına kullanım {min(counts)}-{max(counts)}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,285 @@
+import argparse
+import json
+import math
+import os
+import secrets
+import sys
+from typing import Dict, Any, List, Optional
+
+from .storage import ANSWER_EVENTS_FILE, append_answer_events
+
+ITEM_STATS_FILE = "item_stats.json"
+ITEM_STATS_VERSION = 2
+# Bayrak eşikleri: yeterli cevap yoksa madde değerlendirilmez.
+MIN_RESPONSES = 20
+EASY_P_VALUE = 0.9
+HARD_P_VALUE = 0.2
+LOW_DISCRIMINATION = 0.1
+# Bitiş satırı gelmeyen (yarıda bırakılmış) sınav, kendisinden sonra bu kadar
+# cevap yazıldıysa bekleyenlerden düşülür.
+OPEN_EXAM_WINDOW = 100_000
+
+# Günlükte her cevap oluştuğu anda bir satırdır: ["sınav", "soru kimliği", şık, doğru(0/1), ms].
+# Sınav bitince bir bitiş satırı eklenir: {"exam": ..., "student": ..., "datetime": ..., "adaptive": 0/1}.
+
+def answer_event_line(exam: str, event: tuple) -> bytes:
+    qid, choice, correct, ms = event
+    return f'["{exam}","{qid}",{choice},{int(correct)},{ms}]\n'.encode("ascii")
+
+def exam_end_line(exam: str, student: str, record: Dict[str, Any]) -> bytes:
+    line = {
+        "exam": exam,
+        "student": student,
+        "datetime": record.get("datetime"),
+        "adaptive": int(bool(record.get("adaptive"))),
+    }
+    return (json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+class AnswerLog:
+    # Quiz.on_answer olarak bağlanır; yazım sonuç yazıcısının kuyruğundan yapılır.
+    __slots__ = ("exam",)
+
+    def __init__(self) -> None:
+        self.exam = secrets.token_hex(8)
+
+    def __call__(self, event: tuple) -> None:
+        append_answer_events(answer_event_line(self.exam, event))
+
+    def finish(self, student: str, record: Dict[str, Any]) -> None:
+        append_answer_events(exam_end_line(self.exam, student, record))
+
+def start_answer_log(quiz) -> AnswerLog:
+    log = AnswerLog()
+    quiz.on_answer = log
+    return log
+
+def log_exam_end(student: str, record: Dict[str, Any], quiz) -> None:
+    log = quiz.on_answer
+    if isinstance(log, AnswerLog) and quiz.events:
+        log.finish(student, record)
+
+class ItemStat:
+    # Akan toplamlar; p değeri ve şık sıklıkları her cevapta güncellenir.
+    # Ayırt edicilik (nokta-çift serili korelasyon) maddenin kendisi hariç
+    # sınav puanıyla (diğer cevapların doğru oranı), sınav bitince ve
+    # yalnızca sabit formlu sınavlardan hesaplanır: uyarlamalı sınavda soru
+    # seçimi yeteneğe bağlı olduğu için korelasyonu bozar.
+    __slots__ = ("responses", "correct", "time_ms", "choices", "m", "sum_x", "sum_y", "sum_yy", "sum_xy")
+
+    def __init__(self) -> None:
+        self.responses = 0
+        self.correct = 0
+        self.time_ms = 0
+        self.choices = []
+        self.m = 0
+        self.sum_x = 0
+        self.sum_y = 0.0
+        self.sum_yy = 0.0
+        self.sum_xy = 0.0
+
+    def add(self, choice: int, correct: int, ms: int) -> None:
+        self.responses += 1
+        self.correct += correct
+        self.time_ms += ms
+        if choice >= len(self.choices):
+            self.choices.extend([0] * (choice + 1 - len(self.choices)))
+        self.choices[choice] += 1
+
+    def add_pair(self, correct: int, rest: float) -> None:
+        self.m += 1
+        self.sum_x += correct
+        self.sum_y += rest
+        self.sum_yy += rest * rest
+        self.sum_xy += correct * rest
+
+    @property
+    def p_value(self) -> Optional[float]:
+        return self.correct / self.responses if self.responses else None
+
+    @property
+    def discrimination(self) -> Optional[float]:
+        m = self.m
+        var_x = m * self.sum_x - self.sum_x * self.sum_x
+        var_y = m * self.sum_yy - self.sum_y * self.sum_y
+        if m < 2 or var_x <= 0 or var_y <= 1e-12:
+            return None
+        return (m * self.sum_xy - self.sum_x * self.sum_y) / math.sqrt(var_x * var_y)
+
+    @property
+    def mean_time_ms(self) -> Optional[float]:
+        return self.time_ms / self.responses if self.responses else None
+
+    def to_list(self) -> list:
+        return [self.responses, self.correct, self.time_ms, self.choices,
+                self.m, self.sum_x, self.sum_y, self.sum_yy, self.sum_xy]
+
+    @classmethod
+    def from_list(cls, values: list) -> "ItemStat":
+        stat = cls()
+        (stat.responses, stat.correct, stat.time_ms, stat.choices,
+         stat.m, stat.sum_x, stat.sum_y, stat.sum_yy, stat.sum_xy) = values
+        return stat
+
+    def flags(self, answer_index: Optional[int] = None) -> List[str]:
+        if self.responses < MIN_RESPONSES:
+            return []
+        flags = []
+        p = self.p_value
+        if p >= EASY_P_VALUE:
+            flags.append("çok kolay")
+        elif p <= HARD_P_VALUE:
+            flags.append("çok zor")
+        r = self.discrimination
+        if r is not None and self.m >= MIN_RESPONSES and r < LOW_DISCRIMINATION:
+            flags.append("ayırt etmiyor" if r >= 0 else "ters ayırt ediyor (cevap anahtarı?)")
+        if answer_index is not None:
+            best = max(range(len(self.choices)), key=self.choices.__getitem__)
+            key_count = self.choices[answer_index] if answer_index < len(self.choices) else 0
+            if best != answer_index and self.choices[best] > key_count:
+                flags.append(f"en çok seçilen şık {best + 1}")
+        return flags
+
+class ItemAnalysis:
+    # Günlük baştan taranmaz: işlenen bayt konumu istatistiklerle (ve henüz
+    # bitmemiş sınavların cevaplarıyla) birlikte kaydedilir, consume yalnızca
+    # yeni (tamamlanmış) satırları okur.
+    def __init__(self) -> None:
+        self.items: Dict[str, ItemStat] = {}
+        self.exams = 0
+        self.answers = 0
+        self.offset = 0
+        self.open: Dict[str, list] = {}
+
+    def add_answer(self, exam: str, qid: str, choice: int, correct: int, ms: int) -> None:
+        stat = self.items.get(qid)
+        if stat is None:
+            stat = self.items[qid] = ItemStat()
+        stat.add(choice, correct, ms)
+        pending = self.open.get(exam)
+        if pending is None:
+            pending = self.open[exam] = [self.answers, []]
+        pending[1].append((qid, correct))
+        self.answers += 1
+
+    def finish_exam(self, exam: str, adaptive: bool = False) -> None:
+        pending = self.open.pop(exam, None)
+        if pending is None:
+            return
+        answers = pending[1]
+        self.exams += 1
+        if adaptive or len(answers) < 2:
+            return
+        total = sum(correct for _, correct in answers)
+        for qid, correct in answers:
+            self.items[qid].add_pair(correct, (total - correct) / (len(answers) - 1))
+
+    def _drop_abandoned(self) -> None:
+        limit = self.answers - OPEN_EXAM_WINDOW
+        for exam in [exam for exam, pending in self.open.items() if pending[0] < limit]:
+            del self.open[exam]
+
+    def consume(self, path: str = ANSWER_EVENTS_FILE) -> int:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return 0
+        if size < self.offset:
+            # Günlük silinmiş ya da değiştirilmiş: baştan kurulur.
+            self.__init__()
+        with open(path, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        end = data.rfind(b"\n") + 1
+        count = 0
+        for raw in data[:end].splitlines():
+            try:
+                line = json.loads(raw.decode("utf-8"))
+                if type(line) is list:
+                    exam, qid, choice, correct, ms = line
+                    self.add_answer(exam, qid, choice, int(correct), ms)
+                else:
+                    self.finish_exam(line["exam"], bool(line.get("adaptive")))
+            except (ValueError, KeyError, TypeError, IndexError):
+                continue
+            count += 1
+        self.offset += end
+        self._drop_abandoned()
+        return count
+
+    def item(self, qid: str) -> Optional[ItemStat]:
+        return self.items.get(qid)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "version": ITEM_STATS_VERSION,
+            "offset": self.offset,
+            "exams": self.exams,
+            "answers": self.answers,
+            "items": {qid: stat.to_list() for qid, stat in self.items.items()},
+            "open": self.open,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "ItemAnalysis":
+        if data.get("version") != ITEM_STATS_VERSION:
+            raise ValueError("Desteklenmeyen madde istatistiği sürümü.")
+        analysis = cls()
+        analysis.offset = data["offset"]
+        analysis.exams = data["exams"]
+        analysis.answers = data["answers"]
+        analysis.items = {qid: ItemStat.from_list(values) for qid, values in data["items"].items()}
+        analysis.open = {
+            exam: [start, [tuple(answer) for answer in answers]] for exam, (start, answers) in data["open"].items()
+        }
+        return analysis
+
+def load_item_stats(path: str = ITEM_STATS_FILE) -> ItemAnalysis:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return ItemAnalysis.from_json(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return ItemAnalysis()
+
+def save_item_stats(analysis: ItemAnalysis, path: str = ITEM_STATS_FILE) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(analysis.to_json(), f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+def refresh_item_stats(events_path: str = ANSWER_EVENTS_FILE, path: str = ITEM_STATS_FILE) -> ItemAnalysis:
+    analysis = load_item_stats(path)
+    if analysis.consume(events_path):
+        save_item_stats(analysis, path)
+    return analysis
+
+def format_item_stat(stat: ItemStat, choice_count: int = 0) -> str:
+    # Şık sıklıkları soru şık sayısına tamamlanır (hiç seçilmeyen son şıklar 0).
+    r = stat.discrimination
+    counts = stat.choices + [0] * (choice_count - len(stat.choices))
+    choices = "/".join(str(count) for count in counts)
+    return (
+        f"p={stat.p_value:.2f}  r={'-' if r is None else f'{r:.2f}'}  n={stat.responses}  "
+        f"şıklar={choices}  ort. süre={stat.mean_time_ms / 1000:.1f} sn"
+    )
+
+def main(argv: List[str]) -> int:
+    from .questions import get_question_bank
+
+    parser = argparse.ArgumentParser(prog="python -m quiz_core.items")
+    parser.add_argument("--all", action="store_true", help="Bayraksız maddeleri de listele")
+    args = parser.parse_args(argv[1:])
+    analysis = refresh_item_stats()
+    questions = {q.qid: q for pool in get_question_bank().pools() for q in pool}
+    print(f"{analysis.exams} sınav ({len(analysis.open)} süren), {analysis.answers} cevap, {len(analysis.items)} madde")
+    for qid, stat in sorted(analysis.items.items(), key=lambda item: -item[1].responses):
+        question = questions.get(qid)
+        flags = stat.flags(question.answer_index if question else None)
+        if not flags and not args.all:
+            continue
+        title = question.text.split("\n")[0] if question else f"(bankada yok: {qid})"
+        print(f"[{question.level if question else '?'}] {title}")
+        print(f"    {format_item_stat(stat, len(question.choices) if question else 0)}" + (f"  ⚠ {', '.join(flags)}" if flags else ""))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
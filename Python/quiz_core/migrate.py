@@ -0,0 +1,24 @@
+import sys
+from typing import List
+
+from .storage import create_storage, migrate_storage
+
+def main(argv: List[str]) -> int:
+    if len(argv) != 3 or argv[1] not in ("json", "sqlite") or argv[2] not in ("json", "sqlite") or argv[1] == argv[2]:
+        print("Kullanım: python -m quiz_core.migrate <json|sqlite> <json|sqlite>")
+        return 2
+    source = create_storage(argv[1])
+    target = create_storage(argv[2])
+    try:
+        counts = migrate_storage(source, target)
+    finally:
+        source.close()
+        target.close()
+    print(
+        f"Taşındı -> Sonuç: {counts['results']} | Öğrenci: {counts['students']} | "
+        f"Öğretmen: {counts['teachers']} | Soru: {counts['questions']}"
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
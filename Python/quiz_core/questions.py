@@ -0,0 +1,364 @@
+import random
+from typing import List
+
+from .quiz import Question
+from .storage import load_custom_questions, custom_questions_signature
+
+def build_builtin_questions():
+    easy = [
+        Question("Python dosya uzantısı nedir?",
+                 [".pt", ".py", ".python", ".pyt"], ".py", "Kolay"),
+        Question("Python'da ekrana yazdırmak için hangi fonksiyon kullanılır?",
+                 ["echo()", "print()", "write()", "out()"], "print()", "Kolay"),
+        Question("Python'da bir satır yorum nasıl başlar?",
+                 ["//", "#", "/*", "<!--"], "#", "Kolay"),
+        Question("Aşağıdakilerden hangisi geçerli bir değişken adıdır?",
+                 ["1sayi", "sayi_1", "sayi-1", "sayi 1"], "sayi_1", "Kolay"),
+        Question("type(10) ifadesinin sonucu hangi veri tipidir?",
+                 ["int", "float", "str", "bool"], "int", "Kolay"),
+        Question("type(3.14) ifadesinin sonucu hangi veri tipidir?",
+                 ["int", "float", "str", "bool"], "float", "Kolay"),
+        Question("'Merhaba' hangi veri tipidir?",
+                 ["int", "float", "str", "bool"], "str", "Kolay"),
+        Question("True ve False hangi veri tipine aittir?",
+                 ["int", "str", "bool", "float"], "bool", "Kolay"),
+        Question("Aşağıdakilerden hangisi liste tanımıdır?",
+                 ["(1, 2, 3)", "{1, 2, 3}", "[1, 2, 3]", "\"1,2,3\""],
+                 "[1, 2, 3]", "Kolay"),
+        Question("len([10, 20, 30]) sonucu nedir?",
+                 ["2", "3", "4", "Hata verir"], "3", "Kolay"),
+        Question("Python'da atama operatörü hangisidir?",
+                 ["==", "=", ":=", "=>"], "=", "Kolay"),
+        Question("5 + 3 * 2 işleminin sonucu nedir?",
+                 ["16", "11", "13", "10"], "11", "Kolay"),
+        Question("a = 10; b = 3; a % b sonucu nedir?",
+                 ["0", "1", "3", "Hata verir"], "1", "Kolay"),
+        Question("input() fonksiyonu ne yapar?",
+                 ["Ekrana yazar", "Klavye girişini okur", "Dosya açar", "Programı sonlandırır"],
+                 "Klavye girişini okur", "Kolay"),
+        Question("a = 'Python'; a[0] nedir?",
+                 ["'P'", "'y'", "'n'", "Hata verir"], "'P'", "Kolay"),
+        Question("a = [1, 2, 3]; a[1] nedir?",
+                 ["1", "2", "3", "Hata verir"], "2", "Kolay"),
+        Question("Aşağıdakilerden hangisi tuple tanımıdır?",
+                 ["[1, 2, 3]", "(1, 2, 3)", "{1, 2, 3}", "\"1,2,3\""],
+                 "(1, 2, 3)", "Kolay"),
+        Question("Aşağıdakilerden hangisi sözlük (dict) tanımıdır?",
+                 ["[1, 2, 3]", "(1, 2, 3)", "{\"ad\": \"Ali\"}", "{1, 2, 3}"],
+                 "{\"ad\": \"Ali\"}", "Kolay"),
+        Question("3 == 3 ifadesinin sonucu nedir?",
+                 ["True", "False", "3", "Hata verir"], "True", "Kolay"),
+        Question("3 != 5 ifadesinin sonucu nedir?",
+                 ["True", "False", "5", "Hata verir"], "True", "Kolay"),
+        Question("not True ifadesi ne döndürür?",
+                 ["True", "False", "None", "Hata verir"], "False", "Kolay"),
+        Question("a = 5; a += 2 sonrası a nedir?",
+                 ["5", "7", "2", "Hata verir"], "7", "Kolay"),
+        Question("Python'da 've' anlamına gelen mantıksal operatör hangisidir?",
+                 ["and", "or", "not", "&"], "and", "Kolay"),
+        Question("Python'da 'veya' anlamına gelen mantıksal operatör hangisidir?",
+                 ["and", "or", "not", "|"], "or", "Kolay"),
+        Question("Boş liste nasıl tanımlanır?",
+                 ["()", "{}", "[]", "''"], "[]", "Kolay"),
+        Question("Boş string nasıl tanımlanır?",
+                 ["[]", "{}", "''", "None"], "''", "Kolay"),
+        Question("None neyi ifade eder?",
+                 ["0", "Boş string", "Hiçlik/değer yok", "False"],
+                 "Hiçlik/değer yok", "Kolay"),
+        Question("Python'da bloklar nasıl ayrılır?",
+                 ["Parantez ile", "Virgül ile", "Girinti (indent) ile", "Noktalı virgül ile"],
+                 "Girinti (indent) ile", "Kolay"),
+        Question("Aşağıdakilerden hangisi Python anahtar kelimesidir?",
+                 ["number", "value", "if", "string"], "if", "Kolay"),
+        Question("Hangi ifade sözlükteki anahtar sayısını verir?",
+                 ["len(dict)", "size(dict)", "count(dict)", "length(dict)"],
+                 "len(dict)", "Kolay"),
+    ]
+
+    medium = [
+        Question("a = 'Python'; a[1:4] ifadesinin sonucu nedir?",
+                 ["'Pyt'", "'yth'", "'ytho'", "'Pyth'"], "'yth'", "Orta"),
+        Question("range(1, 4) hangi değerleri üretir?",
+                 ["1, 2, 3", "1, 2, 3, 4", "0, 1, 2", "2, 3, 4"], "1, 2, 3", "Orta"),
+        Question("for i in range(3): print(i) çıktısı nedir?",
+                 ["0 1 2", "1 2 3", "0 1 2 3", "1 2"], "0 1 2", "Orta"),
+        Question("while döngüsü için doğru ifade hangisidir?",
+                 ["Koşul sağlandığı sürece döner", "Sadece bir kez çalışır",
+                  "Her zaman sonsuz döngüdür", "For döngüsüyle aynıdır"],
+                 "Koşul sağlandığı sürece döner", "Orta"),
+        Question("break ifadesi ne yapar?",
+                 ["Döngüyü sonlandırır", "Döngüyü atlar", "Değişkeni siler", "Fonksiyonu bitirir"],
+                 "Döngüyü sonlandırır", "Orta"),
+        Question("continue ifadesi ne yapar?",
+                 ["Döngüyü tamamen bitirir", "O turu atlayıp döngüye devam eder",
+                  "Hata fırlatır", "Fonksiyonu sonlandırır"],
+                 "O turu atlayıp döngüye devam eder", "Orta"),
+        Question("def fonksiyon(): tanımında hangi anahtar kelime kullanılır?",
+                 ["function", "def", "fun", "lambda"], "def", "Orta"),
+        Question("return ifadesi ne yapar?",
+                 ["Fonksiyondan değer döndürür", "Döngüyü sonlandırır",
+                  "Değişken tanımlar", "Modül yükler"],
+                 "Fonksiyondan değer döndürür", "Orta"),
+        Question("a = [1, 2, 3]; a.append(4) sonrası a nedir?",
+                 ["[1, 2, 3]", "[1, 2, 3, 4]", "[4, 1, 2, 3]", "[1, 2, 4]"],
+                 "[1, 2, 3, 4]", "Orta"),
+        Question("a = [1, 2, 3]; a.insert(1, 10) sonrası a nedir?",
+                 ["[1, 10, 2, 3]", "[10, 1, 2, 3]", "[1, 2, 10, 3]", "[1, 2, 3, 10]"],
+                 "[1, 10, 2, 3]", "Orta"),
+        Question("a = [1, 2, 3]; a.pop() sonrası a nedir?",
+                 ["[1, 2]", "[2, 3]", "[1, 3]", "[]"], "[1, 2]", "Orta"),
+        Question("a = {\"ad\": \"Ali\", \"yas\": 20}; a[\"ad\"] nedir?",
+                 ["\"Ali\"", "20", "\"ad\"", "Hata verir"], "\"Ali\"", "Orta"),
+        Question("dict.keys() ne döndürür?",
+                 ["Anahtarları", "Değerleri", "Hem anahtar hem değerleri", "Uzunluğu"],
+                 "Anahtarları", "Orta"),
+        Question("set veri tipinin özelliği nedir?",
+                 ["Sıralıdır", "Tekrar eden eleman tutmaz", "İndekslenebilir", "Sadece int tutar"],
+                 "Tekrar eden eleman tutmaz", "Orta"),
+        Question("a = [1, 2, 3]; b = a; b.append(4) sonrası a nedir?",
+                 ["[1, 2, 3]", "[1, 2, 3, 4]", "[4, 1, 2, 3]", "Hata verir"],
+                 "[1, 2, 3, 4]", "Orta"),
+        Question("a = [1, 2, 3]; b = a.copy(); b.append(4) sonrası a nedir?",
+                 ["[1, 2, 3]", "[1, 2, 3, 4]", "[4, 1, 2, 3]", "Hata verir"],
+                 "[1, 2, 3]", "Orta"),
+        Question("Fonksiyon parametresinde varsayılan değer nasıl verilir?",
+                 ["def f(a, b: 0)", "def f(a, b = 0)", "def f(a, b == 0)", "def f(a, b := 0)"],
+                 "def f(a, b = 0)", "Orta"),
+        Question("try/except yapısı ne için kullanılır?",
+                 ["Döngü yazmak için", "Koşul yazmak için", "Hata yakalamak için", "Fonksiyon tanımlamak için"],
+                 "Hata yakalamak için", "Orta"),
+        Question("open('dosya.txt', 'r') ne yapar?",
+                 ["Dosyayı okuma modunda açar", "Dosyayı yazma modunda açar",
+                  "Dosyayı siler", "Hiçbir şey yapmaz"],
+                 "Dosyayı okuma modunda açar", "Orta"),
+        Question("with open('dosya.txt', 'r') as f: yapısı ne sağlar?",
+                 ["Otomatik dosya kapatma", "Dosyanın kopyasını oluşturma",
+                  "Dosyayı şifreleme", "Hiçbir şey"],
+                 "Otomatik dosya kapatma", "Orta"),
+        Question("modül içe aktarmak için hangi ifade kullanılır?",
+                 ["include math", "using math", "import math", "require math"],
+                 "import math", "Orta"),
+        Question("Aşağıdakilerden hangisi gömülü bir Python fonksiyonudur?",
+                 ["len()", "size()", "length()", "count()"],
+                 "len()", "Orta"),
+        Question("map(f, liste) ifadesi ne döndürür?",
+                 ["Liste", "Iterator", "Set", "Sözlük"],
+                 "Iterator", "Orta"),
+        Question("filter(f, liste) ne yapar?",
+                 ["Listeyi sıralar", "Listeyi ters çevirir", "Şarta uyanları süzer", "Listeyi kopyalar"],
+                 "Şarta uyanları süzer", "Orta"),
+        Question("sorted([3, 1, 2]) sonucu nedir?",
+                 ["[3, 2, 1]", "[1, 2, 3]", "[2, 1, 3]", "Hata verir"],
+                 "[1, 2, 3]", "Orta"),
+        Question("join() hangi veri tipiyle kullanılır?",
+                 ["int", "list of int", "list of str", "dict"],
+                 "list of str", "Orta"),
+        Question("'-'.join(['a', 'b', 'c']) sonucu nedir?",
+                 ["'abc'", "'a-b-c'", "'a-bc'", "'ab-c'"],
+                 "'a-b-c'", "Orta"),
+        Question("formatlama için doğru ifade hangisidir?",
+                 ["'Merhaba {}'.format('Ali')", "'Merhaba'.format('Ali')",
+                  "format('Merhaba', 'Ali')", "'Merhaba' + format('Ali')"],
+                 "'Merhaba {}'.format('Ali')", "Orta"),
+        Question("f-string kullanımına örnek hangisidir?",
+                 ["'Merhaba {isim}'", "f'Merhaba {isim}'",
+                  "f('Merhaba {isim}')", "format('Merhaba {isim}')"],
+                 "f'Merhaba {isim}'", "Orta"),
+        Question(
+            "enumerate(liste) ne sağlar?",
+            ["Sadece indeksleri verir", "Sadece değerleri verir",
+             "Hem indeks hem değeri verir", "Hiçbir şey"],
+            "Hem indeks hem değeri verir", "Orta"),
+    ]
+
+    hard = [
+        Question("[x for x in range(5) if x % 2 == 0] sonucu nedir?",
+                 ["[0, 1, 2, 3, 4]", "[1, 3]", "[0, 2, 4]", "[2, 4]"],
+                 "[0, 2, 4]", "Zor"),
+        Question("lambda x: x * 2 ifadesi neyi temsil eder?",
+                 ["Sınıf", "Anonim fonksiyon", "Modül", "Paket"],
+                 "Anonim fonksiyon", "Zor"),
+        Question("def f(*args) ifadesinde *args ne işe yarar?",
+                 ["İstenilen sayıda konumsal argüman alır",
+                  "İstenilen sayıda anahtar argüman alır",
+                  "Hiç argüman almaz", "Sadece bir argüman alır"],
+                 "İstenilen sayıda konumsal argüman alır", "Zor"),
+        Question("def f(**kwargs) ifadesi ne işe yarar?",
+                 ["İstenilen sayıda konumsal argüman alır",
+                  "İstenilen sayıda anahtar argüman alır",
+                  "Liste döndürür", "Set döndürür"],
+                 "İstenilen sayıda anahtar argüman alır", "Zor"),
+        Question("Generator fonksiyon oluşturmak için hangi anahtar kelime kullanılır?",
+                 ["yield", "return", "generate", "async"],
+                 "yield", "Zor"),
+        Question("class A:\n    def __init__(self):\n        self.x = 10\n__init__ ne işe yarar?",
+                 ["Modül yükler", "Yapıcı metoddur, nesneyi başlatır",
+                  "Sınıfı siler", "Hiçbir özel anlamı yoktur"],
+                 "Yapıcı metoddur, nesneyi başlatır", "Zor"),
+        Question("Miras alma (inheritance) için hangi söz dizimi kullanılır?",
+                 ["class B -> A:", "class B(A):", "class B:A", "class B = A:"],
+                 "class B(A):", "Zor"),
+        Question("raise ValueError('hata') ne yapar?",
+                 ["Hata mesajını ekrana yazar", "ValueError istisnası fırlatır",
+                  "Programı kapatır", "Hiçbir şey"],
+                 "ValueError istisnası fırlatır", "Zor"),
+        Question("try/except/finally yapısında finally ne zaman çalışır?",
+                 ["Sadece hata olunca", "Sadece hata olmayınca",
+                  "Her durumda", "Hiç çalışmaz"],
+                 "Her durumda", "Zor"),
+        Question("Decorator ne için kullanılır?",
+                 ["Fonksiyonu silmek için", "Fonksiyona ekstra davranış eklemek için",
+                  "Modül oluşturmak için", "Değişken tanımlamak için"],
+                 "Fonksiyona ekstra davranış eklemek için", "Zor"),
+        Question("@decorator ifadesi neyi temsil eder?",
+                 ["Sınıf tanımı", "Decorator uygulaması",
+                  "Modül importu", "Generator"],
+                 "Decorator uygulaması", "Zor"),
+        Question("__str__ metodu ne zaman çağrılır?",
+                 ["Nesne oluşturulurken", "Nesne silinirken",
+                  "str(nesne) veya print(nesne) çağrıldığında", "Hiç çağrılmaz"],
+                 "str(nesne) veya print(nesne) çağrıldığında", "Zor"),
+        Question("__len__ metodu ne işe yarar?",
+                 ["Toplama yapar", "Uzunluk döndürür", "Karşılaştırma yapar", "Hata fırlatır"],
+                 "Uzunluk döndürür", "Zor"),
+        Question("İteratör protokolü hangi metodları gerektirir?",
+                 ["__iter__ ve __next__", "__add__ ve __sub__",
+                  "__init__ ve __del__", "__get__ ve __set__"],
+                 "__iter__ ve __next__", "Zor"),
+        Question("list(map(lambda x: x*2, [1, 2, 3])) sonucu nedir?",
+                 ["[1, 2, 3]", "[2, 4, 6]", "[0, 1, 2]", "[1, 4, 9]"],
+                 "[2, 4, 6]", "Zor"),
+        Question("list(filter(lambda x: x % 2 == 0, [1, 2, 3, 4])) sonucu nedir?",
+                 ["[1, 3]", "[2, 4]", "[1, 2, 3, 4]", "[]"],
+                 "[2, 4]", "Zor"),
+        Question("list comprehension ile kareler listesi nasıl oluşturulur?",
+                 ["[x**2 for x in liste]", "[x for x**2 in liste]",
+                  "x**2 in liste", "map(x**2, liste)"],
+                 "[x**2 for x in liste]", "Zor"),
+        Question("from modul import * ifadesinin sakıncası nedir?",
+                 ["Hiçbir sakıncası yoktur", "İsim çakışmalarına yol açabilir",
+                  "Modülü siler", "Performansı her zaman düşürür"],
+                 "İsim çakışmalarına yol açabilir", "Zor"),
+        Question("virtual environment (sanal ortam) ne için kullanılır?",
+                 ["İşletim sistemini değiştirmek için",
+                  "Projeye özel bağımlılık yönetimi için",
+                  "Dosya silmek için", "Python sürümünü silmek için"],
+                 "Projeye özel bağımlılık yönetimi için", "Zor"),
+        Question("JSON verisi Python'da hangi tipe dönüştürülür?",
+                 ["Her zaman list", "Her zaman dict",
+                  "JSON içeriğine göre list/dict", "Her zaman str"],
+                 "JSON içeriğine göre list/dict", "Zor"),
+        Question("open('dosya.txt', 'wb') modu ne yapar?",
+                 ["Metin okur", "Metin yazar", "Binary yazar", "Binary okur"],
+                 "Binary yazar", "Zor"),
+        Question("async/await yapısı ne için kullanılır?",
+                 ["Çoklu miras için", "Asenkron programlama için",
+                  "Dosya yönetimi için", "Dekorator tanımı için"],
+                 "Asenkron programlama için", "Zor"),
+        Question("list(set([1, 1, 2, 2, 3])) sonucu nedir?",
+                 ["[1, 1, 2, 2, 3]", "[1, 2, 3]", "[3, 2, 1]", "Sırasız bir liste, tekrar yok"],
+                 "Sırasız bir liste, tekrar yok", "Zor"),
+        Question("a = {1, 2, 3}; b = {3, 4, 5}; a & b nedir?",
+                 ["{1, 2, 3, 4, 5}", "{1, 2}", "{3}", "Boş küme"],
+                 "{3}", "Zor"),
+        Question("a = {1, 2, 3}; b = {3, 4, 5}; a | b nedir?",
+                 ["{1, 2, 3, 4, 5}", "{1, 2}", "{3}", "Boş küme"],
+                 "{1, 2, 3, 4, 5}", "Zor"),
+        Question("context manager ne sağlar?",
+                 ["Bellek yönetimi yapar",
+                  "Kaynağın güvenli açılıp kapatılmasını sağlar",
+                  "Değişkenleri siler", "Sadece dosya okur"],
+                 "Kaynağın güvenli açılıp kapatılmasını sağlar", "Zor"),
+        Question("__name__ == '__main__' kontrolü ne için kullanılır?",
+                 ["Modülü silmek için",
+                  "Dosya direkt çalıştırıldığında kod bloğunu çalıştırmak için",
+                  "Her zaman import etmek için", "Hiçbir şey için"],
+                 "Dosya direkt çalıştırıldığında kod bloğunu çalıştırmak için", "Zor"),
+        Question("logging modülü ne için kullanılır?",
+                 ["Rastgele sayı üretmek için",
+                  "Loglama ve kayıt tutmak için",
+                  "Şifreleme için", "Dosya silmek için"],
+                 "Loglama ve kayıt tutmak için", "Zor"),
+        Question("pip ne için kullanılır?",
+                 ["Python sürümünü güncellemek için",
+                  "Python paketlerini yönetmek için",
+                  "İşletim sistemi kurmak için", "Veritabanı yönetmek için"],
+                 "Python paketlerini yönetmek için", "Zor"),
+        Question("PEP 8 neyi ifade eder?",
+                 ["Standart kütüphane", "Python stil rehberi",
+                  "Paket yöneticisi", "Veritabanı arayüzü"],
+                 "Python stil rehberi", "Zor"),
+    ]
+
+    return easy, medium, hard
+
+def build_custom_questions(items: list, level: str) -> List[Question]:
+    questions = []
+    for qd in items:
+        try:
+            questions.append(Question(qd["text"], qd["choices"], qd["answer"], level))
+        except (KeyError, TypeError, ValueError):
+            # Cevabı şıklarda olmayan bozuk kayıt hiçbir zaman doğru cevaplanamaz; atlanır.
+            continue
+    return questions
+
+class QuestionBank:
+    # Yerleşik sorular bir kez kurulur; questions.json yalnızca imzası
+    # (mtime/boyut ya da veritabanı sayacı) değiştiğinde yeniden okunur.
+    def __init__(self) -> None:
+        self.builtin = None
+        self.signature = None
+        self.loaded = False
+        self.easy = ()
+        self.medium = ()
+        self.hard = ()
+        self.by_level = {}
+
+    def refresh(self) -> bool:
+        if self.builtin is None:
+            self.builtin = build_builtin_questions()
+        signature = custom_questions_signature()
+        if self.loaded and signature == self.signature:
+            return False
+        easy, medium, hard = (list(pool) for pool in self.builtin)
+        extra = load_custom_questions()
+        easy.extend(build_custom_questions(extra["easy"], "Kolay"))
+        medium.extend(build_custom_questions(extra["medium"], "Orta"))
+        hard.extend(build_custom_questions(extra["hard"], "Zor"))
+        self.easy = tuple(easy)
+        self.medium = tuple(medium)
+        self.hard = tuple(hard)
+        self.by_level = {"Kolay": self.easy, "Orta": self.medium, "Zor": self.hard}
+        self.signature = signature
+        self.loaded = True
+        return True
+
+    def pools(self):
+        self.refresh()
+        return self.easy, self.medium, self.hard
+
+    def level_pool(self, level: str):
+        self.refresh()
+        return self.by_level.get(level, ())
+
+_question_bank = None
+
+def get_question_bank() -> QuestionBank:
+    global _question_bank
+    if _question_bank is None:
+        _question_bank = QuestionBank()
+    return _question_bank
+
+def build_question_bank():
+    easy, medium, hard = get_question_bank().pools()
+    return list(easy), list(medium), list(hard)
+
+def build_exam_questions(easy, medium, hard, per_level=5):
+    if len(easy) < per_level or len(medium) < per_level or len(hard) < per_level:
+        raise ValueError("Her seviye için yeterli sayıda soru yok.")
+    selected_easy = random.sample(easy, per_level)
+    selected_medium = random.sample(medium, per_level)
+    selected_hard = random.sample(hard, per_level)
+    questions = selected_easy + selected_medium + selected_hard
+    random.shuffle(questions)
+    return questions
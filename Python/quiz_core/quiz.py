@@ -0,0 +1,167 @@
+import sys
+import time
+import zlib
+from datetime import datetime
+from typing import List
+
+LEVEL_POINTS = {
+    "Kolay": 1,
+    "Orta": 2,
+    "Zor": 3,
+}
+
+LEVELS = ("Kolay", "Orta", "Zor")
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
+LEVEL_POINTS_BY_CODE = tuple(LEVEL_POINTS[level] for level in LEVELS)
+
+def question_id(text: str, choices, answer_index: int) -> str:
+    # Metin, şıklar ve doğru cevaptan türeyen kararlı kimlik (16 hex); soru
+    # değiştirilirse madde istatistikleri yeni kimlikle sıfırdan başlar.
+    data = "\x1f".join((text, *choices, str(answer_index))).encode("utf-8")
+    return f"{zlib.crc32(data):08x}{zlib.adler32(data):08x}"
+
+class Question:
+    # Şıklar paylaşılan (intern edilmiş) string'lerden oluşan bir tuple'dır;
+    # doğru cevap ve seviye küçük tamsayılar olarak tutulur.
+    __slots__ = ("text", "choices", "answer_index", "level_code", "_qid")
+
+    def __init__(self, text: str, choices: List[str], answer: str, level: str) -> None:
+        self.text = text
+        self.choices = tuple(sys.intern(c) for c in choices)
+        if answer not in self.choices:
+            raise ValueError(f"Doğru cevap şıklar arasında yok: {answer!r}")
+        self.answer_index = self.choices.index(answer)
+        self.level_code = LEVEL_CODES[level]
+        self._qid = None
+
+    @property
+    def qid(self) -> str:
+        if self._qid is None:
+            self._qid = question_id(self.text, self.choices, self.answer_index)
+        return self._qid
+
+    @property
+    def answer(self) -> str:
+        return self.choices[self.answer_index]
+
+    @property
+    def level(self) -> str:
+        return LEVELS[self.level_code]
+
+    def check_answer(self, answer: str) -> bool:
+        return self.answer == answer
+
+    def check_index(self, choice_index: int) -> bool:
+        return self.answer_index == choice_index
+
+class Quiz:
+    def __init__(self, questions: List[Question], exam_end_time: datetime | None = None) -> None:
+        self.questions = questions
+        self.score = 0
+        self.index = 0
+        self.answered = 0
+        self.early_terminated = False
+        self.points = 0
+        self.max_points = 0
+        self.level_stats = {
+            "Kolay": {"correct": 0, "wrong": 0},
+            "Orta": {"correct": 0, "wrong": 0},
+            "Zor": {"correct": 0, "wrong": 0},
+        }
+        self.exam_end_time = exam_end_time
+        # Cevap olayları: (soru kimliği, seçilen şık, doğru mu, cevap süresi ms).
+        # on_answer verilirse her olay oluştuğu anda ona da iletilir.
+        self.events = []
+        self.on_answer = None
+        self.shown_at = time.monotonic()
+
+    def has_more_questions(self) -> bool:
+        return self.index < len(self.questions)
+
+    def time_over(self) -> bool:
+        if self.exam_end_time is None:
+            return False
+        now = datetime.now()
+        if now >= self.exam_end_time:
+            self.early_terminated = True
+            self.index = len(self.questions)
+            return True
+        return False
+
+    def get_remaining_time(self) -> int:
+        if self.exam_end_time is None:
+            return -1
+        remaining = self.exam_end_time - datetime.now()
+        total = int(remaining.total_seconds())
+        if total < 0:
+            total = 0
+        return total
+
+    def planned_total(self) -> int:
+        # Ekranda gösterilen toplam soru sayısı (uyarlamalı sınavda üst sınır).
+        return len(self.questions)
+
+    def record_extras(self) -> dict:
+        return {}
+
+    def get_current_question(self) -> "Question":
+        return self.questions[self.index]
+
+    def answer_current(self, choice_index: int) -> bool:
+        if self.time_over():
+            return False
+        soru = self.get_current_question()
+        soru_puan = LEVEL_POINTS_BY_CODE[soru.level_code]
+        self.max_points += soru_puan
+        correct = soru.check_index(choice_index)
+        now = time.monotonic()
+        event = (soru.qid, choice_index, correct, int((now - self.shown_at) * 1000))
+        self.events.append(event)
+        self.shown_at = now
+        if self.on_answer is not None:
+            self.on_answer(event)
+        level_stats = self.level_stats[LEVELS[soru.level_code]]
+        if correct:
+            self.score += 1
+            self.points += soru_puan
+            level_stats["correct"] += 1
+        else:
+            level_stats["wrong"] += 1
+        self.index += 1
+        self.answered += 1
+        return correct
+
+    def get_results(self):
+        total_questions = len(self.questions)
+        total_answered = self.answered
+        correct = self.score
+        wrong = total_answered - correct
+        if total_answered > 0:
+            percent = (correct / total_answered) * 100
+        else:
+            percent = 0
+        if self.max_points > 0:
+            point_percent = (self.points / self.max_points) * 100
+        else:
+            point_percent = 0
+        level_label = get_level_label(point_percent)
+        return (
+            correct,
+            wrong,
+            percent,
+            total_answered,
+            total_questions,
+            self.points,
+            self.max_points,
+            point_percent,
+            level_label,
+            self.level_stats,
+        )
+
+def get_level_label(point_percent: float) -> str:
+    if point_percent < 40:
+        return "Beginner"
+    elif point_percent < 70:
+        return "Intermediate"
+    else:
+        return "Advanced"
@@ -0,0 +1,199 @@
+import heapq
+import random
+from typing import Dict, Any, List, Optional
+
+RANKING_METRICS = {
+    "best_points": lambda s: s.best_points,
+    "avg_percent": lambda s: s.avg_percent,
+    "total_exams": lambda s: s.total_exams,
+}
+
+class _Node:
+    __slots__ = ("key", "item", "priority", "left", "right", "size")
+
+    def __init__(self, key, item, priority: float) -> None:
+        self.key = key
+        self.item = item
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+
+def _size(node) -> int:
+    return node.size if node is not None else 0
+
+def _update(node) -> None:
+    node.size = 1 + _size(node.left) + _size(node.right)
+
+def _split(node, key):
+    # (anahtarı key'den küçükler, key ve büyükler)
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        _update(node)
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    _update(node)
+    return left, node
+
+def _merge(left, right):
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+class RankingTree:
+    # Boyut bilgili treap: ekleme, silme ve sıra sorgusu beklenen O(log n).
+    # Anahtarlar benzersiz olmalıdır; küçük anahtar önde sıralanır.
+    def __init__(self) -> None:
+        self.root = None
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def insert(self, key, item) -> None:
+        left, right = _split(self.root, key)
+        node = _Node(key, item, random.random())
+        self.root = _merge(_merge(left, node), right)
+
+    def remove(self, key) -> bool:
+        parent = None
+        node = self.root
+        path = []
+        while node is not None and node.key != key:
+            path.append(node)
+            parent = node
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+        merged = _merge(node.left, node.right)
+        if parent is None:
+            self.root = merged
+        elif parent.left is node:
+            parent.left = merged
+        else:
+            parent.right = merged
+        for ancestor in path:
+            ancestor.size -= 1
+        return True
+
+    def load(self, keys: list, items: list) -> None:
+        # Sıralı anahtarlardan dengeli ağaç O(n) kurulur; rastgele öncelikler
+        # büyükten küçüğe seviye sırasıyla dağıtılır, yığın özelliği korunur.
+        def build(lo: int, hi: int):
+            mid = (lo + hi) // 2
+            node = _Node(keys[mid], items[mid], 0.0)
+            if lo < mid:
+                node.left = build(lo, mid)
+            if mid + 1 < hi:
+                node.right = build(mid + 1, hi)
+            node.size = hi - lo
+            return node
+
+        self.root = build(0, len(keys)) if keys else None
+        priorities = sorted((random.random() for _ in keys), reverse=True)
+        level = [self.root] if self.root is not None else []
+        position = 0
+        while level:
+            next_level = []
+            for node in level:
+                node.priority = priorities[position]
+                position += 1
+                if node.left is not None:
+                    next_level.append(node.left)
+                if node.right is not None:
+                    next_level.append(node.right)
+            level = next_level
+
+    def rank(self, key) -> int:
+        # key'den önce gelen anahtar sayısı.
+        count = 0
+        node = self.root
+        while node is not None:
+            if key <= node.key:
+                node = node.left
+            else:
+                count += _size(node.left) + 1
+                node = node.right
+        return count
+
+    def first(self, n: int) -> list:
+        items = []
+        stack = []
+        node = self.root
+        while (stack or node is not None) and len(items) < n:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            items.append(node.item)
+            node = node.right
+        return items
+
+class Leaderboard:
+    # Her metrik için bir RankingTree; anahtar (-değer, ilk görülme sırası),
+    # yani büyükten küçüğe ve eşitlikte ilk eklenen önde (kararlı sıralama).
+    def __init__(self, metrics: Dict[str, Any] = None) -> None:
+        self.metrics = metrics or RANKING_METRICS
+        self.names = list(self.metrics)
+        self.values = [self.metrics[name] for name in self.names]
+        self.trees = [RankingTree() for _ in self.names]
+        self.order = {}
+        self.keys = {}
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def load(self, items: list) -> None:
+        order = self.order
+        for item in items:
+            order.setdefault(item.name, len(order))
+        seqs = [order[item.name] for item in items]
+        columns = []
+        for value, tree in zip(self.values, self.trees):
+            keys = [(-value(item), seq) for item, seq in zip(items, seqs)]
+            ranked = sorted(range(len(items)), key=keys.__getitem__)
+            tree.load([keys[i] for i in ranked], [items[i] for i in ranked])
+            columns.append(keys)
+        self.keys = {item.name: row for item, row in zip(items, zip(*columns))}
+
+    def update(self, item) -> None:
+        old = self.keys.get(item.name)
+        if old is None:
+            self.order[item.name] = len(self.order)
+        seq = self.order[item.name]
+        new = tuple((-value(item), seq) for value in self.values)
+        for i, tree in enumerate(self.trees):
+            if old is not None:
+                if old[i] == new[i]:
+                    continue
+                tree.remove(old[i])
+            tree.insert(new[i], item)
+        self.keys[item.name] = new
+
+    def tree(self, metric: str) -> RankingTree:
+        return self.trees[self.names.index(metric)]
+
+    def top(self, metric: str, n: int) -> list:
+        return self.tree(metric).first(n)
+
+    def rank_of(self, metric: str, name: str) -> Optional[int]:
+        keys = self.keys.get(name)
+        if keys is None:
+            return None
+        return self.tree(metric).rank(keys[self.names.index(metric)]) + 1
+
+def select_top(items: List[Any], metric: str, n: int) -> list:
+    # Durumsuz kullanım için yığın tabanlı seçim; sorted(...)[:n] ile aynı sıra.
+    value = RANKING_METRICS[metric]
+    return heapq.nsmallest(n, items, key=lambda s: -value(s))
@@ -0,0 +1,297 @@
+import json
+import sys
+from typing import Dict, Any, List
+
+from .analysis import SUGGESTION_IDS, SUGGESTION_TABLE
+from .quiz import LEVELS
+
+# Sıkıştırılmış kayıt biçimi (results.json, günlük, SQLite ve parça dosyaları):
+# [tarih, doğru, yanlış, yüzde, cevaplanan, toplam soru, erken bitti (0/1),
+#  puan, en yüksek puan, puan yüzdesi, seviye etiketi,
+#  [Kolay doğru, Kolay yanlış, Orta doğru, Orta yanlış, Zor doğru, Zor yanlış],
+#  [öneri no, ...], öğretmen, (isteğe bağlı) diğer alanlar]
+# null alan "kayıtta yok" demektir; kayıtta açıkça null olan alanlar diğer
+# alanlarda null olarak saklanır. Öneri tabloda yoksa metin olarak kalır.
+RECORD_FIELDS = (
+    "datetime",
+    "correct",
+    "wrong",
+    "percent",
+    "answered",
+    "total_questions",
+    "early_terminated",
+    "points",
+    "max_points",
+    "point_percent",
+    "level_label",
+    "level_stats",
+    "study_suggestions",
+    "teacher",
+)
+_PLAIN_FIELDS = frozenset(RECORD_FIELDS) - {"early_terminated", "level_stats", "study_suggestions"}
+_SLOT_COUNT = len(RECORD_FIELDS)
+_MISSING = object()
+
+# Aynı değerli küçük tuple'lar kayıtlar arasında paylaşılır.
+_shared_tuples = {}
+
+def _shared(values) -> tuple:
+    key = tuple(values)
+    return _shared_tuples.setdefault(key, key)
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+def _encode_levels(level_stats):
+    # Yalnızca LEVELS sırasında, tamsayı doğru/yanlış içeren sözlük sıkıştırılır.
+    if not isinstance(level_stats, dict) or tuple(level_stats) != LEVELS:
+        return None
+    values = []
+    for level in LEVELS:
+        stats = level_stats[level]
+        if not isinstance(stats, dict) or len(stats) != 2:
+            return None
+        correct = stats.get("correct")
+        wrong = stats.get("wrong")
+        if type(correct) is not int or type(wrong) is not int:
+            return None
+        values.append(correct)
+        values.append(wrong)
+    return _shared(values)
+
+def _encode_suggestions(suggestions):
+    if not isinstance(suggestions, list):
+        return None
+    return _shared(SUGGESTION_IDS.get(text, text) for text in suggestions)
+
+class ExamRecord:
+    # Bir sınav kaydı; sözlük gibi okunur (get, [], in) ama alanlar slot'larda,
+    # seviye istatistikleri 6 küçük tamsayılık tuple'da ve öneriler tablo
+    # numaralarıyla tutulur. Sözlük biçimi yalnızca istendiğinde üretilir.
+    __slots__ = (
+        "datetime",
+        "correct",
+        "wrong",
+        "percent",
+        "answered",
+        "total_questions",
+        "early",
+        "points",
+        "max_points",
+        "point_percent",
+        "level_label",
+        "levels",
+        "suggestions",
+        "teacher",
+        "extra",
+    )
+
+    def __init__(
+        self,
+        datetime=None,
+        correct=None,
+        wrong=None,
+        percent=None,
+        answered=None,
+        total_questions=None,
+        early=None,
+        points=None,
+        max_points=None,
+        point_percent=None,
+        level_label=None,
+        levels=None,
+        suggestions=None,
+        teacher=None,
+        extra=None,
+    ) -> None:
+        self.datetime = datetime
+        self.correct = correct
+        self.wrong = wrong
+        self.percent = percent
+        self.answered = answered
+        self.total_questions = total_questions
+        self.early = early
+        self.points = points
+        self.max_points = max_points
+        self.point_percent = point_percent
+        self.level_label = _intern(level_label)
+        self.levels = levels
+        self.suggestions = suggestions
+        self.teacher = _intern(teacher)
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "ExamRecord":
+        extra = {
+            key: value for key, value in record.items() if key not in RECORD_FIELDS or value is None
+        } or None
+        level_stats = record.get("level_stats")
+        levels = _encode_levels(level_stats)
+        if levels is None and level_stats is not None:
+            extra = dict(extra or {}, level_stats=level_stats)
+        suggestions = _encode_suggestions(record.get("study_suggestions"))
+        if suggestions is None and record.get("study_suggestions") is not None:
+            extra = dict(extra or {}, study_suggestions=record["study_suggestions"])
+        early = record.get("early_terminated")
+        return cls(
+            record.get("datetime"),
+            record.get("correct"),
+            record.get("wrong"),
+            record.get("percent"),
+            record.get("answered"),
+            record.get("total_questions"),
+            None if early is None else bool(early),
+            record.get("points"),
+            record.get("max_points"),
+            record.get("point_percent"),
+            record.get("level_label"),
+            levels,
+            suggestions,
+            record.get("teacher"),
+            extra,
+        )
+
+    @classmethod
+    def from_compact(cls, row: list) -> "ExamRecord":
+        early = row[6]
+        levels = row[11]
+        suggestions = row[12]
+        return cls(
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            row[5],
+            None if early is None else bool(early),
+            row[7],
+            row[8],
+            row[9],
+            row[10],
+            None if levels is None else _shared(levels),
+            None if suggestions is None else _shared(suggestions),
+            row[13],
+            row[14] if len(row) > _SLOT_COUNT else None,
+        )
+
+    def to_compact(self) -> list:
+        row = [
+            self.datetime,
+            self.correct,
+            self.wrong,
+            self.percent,
+            self.answered,
+            self.total_questions,
+            None if self.early is None else int(self.early),
+            self.points,
+            self.max_points,
+            self.point_percent,
+            self.level_label,
+            None if self.levels is None else list(self.levels),
+            None if self.suggestions is None else list(self.suggestions),
+            self.teacher,
+        ]
+        if self.extra:
+            row.append(self.extra)
+        return row
+
+    @property
+    def level_stats(self) -> Dict[str, Dict[str, int]]:
+        levels = self.levels
+        if levels is None:
+            return self.extra.get("level_stats") if self.extra else None
+        return {
+            level: {"correct": levels[2 * i], "wrong": levels[2 * i + 1]}
+            for i, level in enumerate(LEVELS)
+        }
+
+    @property
+    def study_suggestions(self) -> List[str]:
+        suggestions = self.suggestions
+        if suggestions is None:
+            return self.extra.get("study_suggestions") if self.extra else None
+        return [SUGGESTION_TABLE[s] if type(s) is int else s for s in suggestions]
+
+    def get(self, key: str, default=None):
+        if key in _PLAIN_FIELDS:
+            value = getattr(self, key)
+        elif key == "early_terminated":
+            value = self.early
+        elif key == "level_stats":
+            value = self.level_stats
+        elif key == "study_suggestions":
+            value = self.study_suggestions
+        elif self.extra:
+            value = self.extra.get(key)
+        else:
+            value = None
+        if value is None and not (self.extra and key in self.extra):
+            return default
+        return value
+
+    def __getitem__(self, key: str):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def keys(self) -> List[str]:
+        keys = [key for key in RECORD_FIELDS if key in self]
+        if self.extra:
+            keys.extend(key for key in self.extra if key not in RECORD_FIELDS)
+        return keys
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ExamRecord):
+            return self.to_compact() == other.to_compact()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ExamRecord({self.to_dict()!r})"
+
+def as_exam_record(record) -> ExamRecord:
+    if isinstance(record, ExamRecord):
+        return record
+    return ExamRecord.from_dict(record)
+
+def decode_record(raw) -> ExamRecord:
+    # Dosyadan okunan kayıt: sıkıştırılmış liste ya da eski sözlük biçimi.
+    if isinstance(raw, list):
+        return ExamRecord.from_compact(raw)
+    return ExamRecord.from_dict(raw)
+
+def encode_record(record) -> list:
+    return as_exam_record(record).to_compact()
+
+def decode_results(data: Dict[str, Any]) -> Dict[str, Any]:
+    for name, records in data.items():
+        data[name] = [decode_record(raw) for raw in records]
+    return data
+
+def dumps_record(record) -> str:
+    return json.dumps(encode_record(record), ensure_ascii=False, separators=(",", ":"))
+
+def dump_results(data: Dict[str, Any], f) -> None:
+    # Öğrenci başına bir blok, kayıt başına bir satır: dosya hem küçük hem okunur.
+    f.write("{")
+    first = True
+    for name, records in data.items():
+        f.write("\n" if first else ",\n")
+        first = False
+        f.write(f"  {json.dumps(name, ensure_ascii=False)}: [")
+        f.write(",".join(f"\n    {dumps_record(record)}" for record in records))
+        f.write("\n  ]" if records else "]")
+    f.write("\n}\n" if data else "}\n")
@@ -0,0 +1,314 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+
+from .ranking import Leaderboard, select_top
+from .storage import add_result_listener
+
+# Genel rapordaki sıralama bölümlerinde gösterilen öğrenci sayısı (None: hepsi).
+LEADERBOARD_SIZE = 10
+
+class StudentStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.total_exams = 0
+        self.percent_sum = 0
+        self.best_points = 0
+        self.last_record = None
+
+    def add_record(self, record: Dict[str, Any]) -> None:
+        # Kayıtta açıkça null olan sayısal alanlar eksik gibi 0 sayılır.
+        points = record.get("points") or 0
+        if self.total_exams == 0 or points > self.best_points:
+            self.best_points = points
+        self.total_exams += 1
+        self.percent_sum += record.get("percent") or 0
+        self.last_record = record
+
+    @property
+    def avg_percent(self) -> float:
+        if self.total_exams == 0:
+            return 0
+        return self.percent_sum / self.total_exams
+
+    @property
+    def last_date(self) -> str:
+        return self.last_record.get("datetime", "?")
+
+    @property
+    def last_level(self) -> str:
+        return self.last_record.get("level_label", "?")
+
+class ResultStats:
+    # Kayıtlar append_result üzerinden eklendiği sürece toplamlar O(1) güncellenir.
+    # Rapor arka plan iş parçacığında da üretilebildiği için erişim kilitlidir.
+    # append_result kaydı listeye dinleyicilerden önce ekler: kurulum bu arada
+    # yapılırsa kayıt hem kurulumda hem dinleyicide görülür. Bu yüzden kurulumda
+    # öğrenci başına sayılan kayıt sayısı tutulur ve o aralıktaki kayıtlar
+    # dinleyiciden gelince atlanır.
+    def __init__(self, results: Dict[str, Any]) -> None:
+        self.results = results
+        self.students: Dict[str, StudentStats] = {}
+        self.counted: Dict[str, int] = {}
+        self.version = 0
+        self.lock = threading.Lock()
+        self.leaderboard = None
+        self._report_text = None
+        self._report_key = None
+        for name, records in list(results.items()):
+            records = list(records)
+            self.counted[name] = len(records)
+            for record in records:
+                self._add(name, record)
+
+    def _add(self, name: str, record: Dict[str, Any]) -> StudentStats:
+        stats = self.students.get(name)
+        if stats is None:
+            stats = StudentStats(name)
+            self.students[name] = stats
+        stats.add_record(record)
+        self.version += 1
+        return stats
+
+    def _already_counted(self, name: str, record: Dict[str, Any]) -> bool:
+        counted = self.counted.get(name, 0)
+        if not counted:
+            return False
+        records = self.results.get(name, [])
+        # Yeni kayıt listenin sonundadır; konumu sondan aranır.
+        for i in range(len(records) - 1, -1, -1):
+            if records[i] is record:
+                return i < counted
+        return False
+
+    def add_record(self, name: str, record: Dict[str, Any]) -> None:
+        with self.lock:
+            if self._already_counted(name, record):
+                return
+            stats = self._add(name, record)
+            if self.leaderboard is not None:
+                self.leaderboard.update(stats)
+
+    def _rankings(self) -> Leaderboard:
+        # Sıralama ağaçları ilk sıra sorgusunda toplu kurulur, sonra kayıt
+        # başına O(log n) güncellenir.
+        if self.leaderboard is None:
+            self.leaderboard = Leaderboard()
+            self.leaderboard.load(list(self.students.values()))
+        return self.leaderboard
+
+    def build_rankings(self) -> None:
+        with self.lock:
+            self._rankings()
+
+    def top(self, metric: str, n: int) -> List[StudentStats]:
+        with self.lock:
+            if self.leaderboard is not None:
+                return self.leaderboard.top(metric, n)
+            return select_top(list(self.students.values()), metric, n)
+
+    def rank_of(self, metric: str, name: str) -> Optional[int]:
+        with self.lock:
+            return self._rankings().rank_of(metric, name)
+
+    def general_report(self, top_n: Optional[int] = None) -> str:
+        with self.lock:
+            key = (self.version, top_n)
+            if self._report_key != key:
+                if self.results:
+                    self._report_text = render_teacher_general_report(
+                        list(self.students.values()), top_n, self.leaderboard
+                    )
+                else:
+                    self._report_text = "Kayıtlı hiçbir öğrenci bulunamadı."
+                self._report_key = key
+            return self._report_text
+
+_result_stats = None
+_result_stats_lock = threading.Lock()
+
+def get_result_stats(results: Dict[str, Any]) -> ResultStats:
+    global _result_stats
+    with _result_stats_lock:
+        if _result_stats is None or _result_stats.results is not results:
+            _result_stats = ResultStats(results)
+        return _result_stats
+
+def _on_result_appended(results: Dict[str, Any], name: str, record: Dict[str, Any]) -> None:
+    with _result_stats_lock:
+        stats = _result_stats
+    if stats is not None and stats.results is results:
+        stats.add_record(name, record)
+
+add_result_listener(_on_result_appended)
+
+def build_teacher_general_report(results: Dict[str, Any], top_n: Optional[int] = None) -> str:
+    return ResultStats(results).general_report(top_n)
+
+def render_teacher_general_report(
+    students_stats: List[StudentStats],
+    top_n: Optional[int] = None,
+    leaderboard: Leaderboard = None,
+) -> str:
+    total = len(students_stats)
+    shown = total if top_n is None else min(top_n, total)
+
+    def ranked(metric: str) -> List[StudentStats]:
+        if leaderboard is not None:
+            return leaderboard.top(metric, shown)
+        return select_top(students_stats, metric, shown)
+
+    def truncated_note() -> None:
+        if shown < total:
+            lines.append(f"... ilk {shown} öğrenci gösteriliyor (toplam {total}).")
+
+    lines = []
+    lines.append("ÖĞRETMEN PANELİ - GENEL RAPOR")
+    lines.append("")
+    lines.append("[Öğrenci Bazlı Özet]")
+    lines.append("-" * 60)
+    for s in students_stats:
+        lines.append(
+            f"Öğrenci : {s.name}\n"
+            f"  Toplam Sınav   : {s.total_exams}\n"
+            f"  Son Sınav      : {s.last_date}\n"
+            f"  En Yüksek Puan : {s.best_points}\n"
+            f"  Ortalama Yüzde : {s.avg_percent:.2f}%\n"
+            f"  Son Seviye     : {s.last_level}\n"
+            + "-" * 60
+        )
+    lines.append("")
+    lines.append("[En Yüksek Puan Sıralaması]")
+    lines.append("-" * 60)
+    for i, s in enumerate(ranked("best_points"), start=1):
+        lines.append(f"{i:>2}) {s.name:<20}  En Yüksek Puan: {s.best_points}  | Son Seviye: {s.last_level}")
+    truncated_note()
+    lines.append("")
+    lines.append("[Ortalama Başarı Yüzdesi Sıralaması]")
+    lines.append("-" * 60)
+    for i, s in enumerate(ranked("avg_percent"), start=1):
+        lines.append(f"{i:>2}) {s.name:<20}  Ortalama: {s.avg_percent:.2f}%  | Son Seviye: {s.last_level}")
+    truncated_note()
+    lines.append("")
+    lines.append("[En Çok Sınava Giren Öğrenciler]")
+    lines.append("-" * 60)
+    for i, s in enumerate(ranked("total_exams"), start=1):
+        lines.append(f"{i:>2}) {s.name:<20}  Sınav Sayısı: {s.total_exams}  | Son Seviye: {s.last_level}")
+    truncated_note()
+    level_counts = {"Beginner": 0, "Intermediate": 0, "Advanced": 0, "Diğer": 0}
+    for s in students_stats:
+        lvl = s.last_level
+        if lvl in level_counts:
+            level_counts[lvl] += 1
+        else:
+            level_counts["Diğer"] += 1
+    lines.append("")
+    lines.append("[Son Sınavlara Göre Seviye Dağılımı]")
+    lines.append("-" * 60)
+    for lvl, count in level_counts.items():
+        lines.append(f"{lvl:<12}: {count} öğrenci")
+    return "\n".join(lines)
+
+def build_teacher_student_detail_text(results: Dict[str, Any], name: str) -> str:
+    records = results.get(name, [])
+    if not records:
+        return "Bu öğrencinin kayıtlı sınavı yok."
+    lines = []
+    lines.append(f"ÖĞRENCİ DETAY RAPORU - {name}")
+    lines.append("=" * 50)
+    for i, rec in enumerate(records, start=1):
+        lines.append(f"\n--- Sınav #{i} ---")
+        lines.append(f"Tarih          : {rec.get('datetime', '?')}")
+        lines.append(f"Doğru / Yanlış : {rec.get('correct', '?')} / {rec.get('wrong', '?')}")
+        lines.append(f"Cevaplanan     : {rec.get('answered', '?')} / {rec.get('total_questions', '?')}")
+        lines.append(f"Yüzde          : {rec.get('percent', 0):.2f}%")
+        if "points" in rec and "max_points" in rec:
+            lines.append(
+                f"Puan           : {rec['points']}/{rec['max_points']} "
+                f"({rec.get('point_percent', 0):.2f}%)"
+            )
+        if "level_label" in rec:
+            lines.append(f"Seviye etiketi : {rec['level_label']}")
+        if rec.get("early_terminated"):
+            lines.append("Not            : Bu sınav erken sonlandırılmış.")
+        teacher_name = rec.get("teacher", None)
+        if teacher_name:
+            lines.append(f"Öğretmen       : {teacher_name}")
+        lines.append("-" * 50)
+    return "\n".join(lines)
+
+EXAM_HISTORY_COLUMNS = (
+    "#", "Tarih", "Doğru / Yanlış", "Cevaplanan", "Yüzde", "Puan", "Seviye", "Öğretmen", "Not",
+)
+
+def format_exam_row(number: int, rec: Dict[str, Any]) -> tuple:
+    if "points" in rec and "max_points" in rec:
+        points = f"{rec['points']}/{rec['max_points']} ({rec.get('point_percent', 0):.2f}%)"
+    else:
+        points = ""
+    return (
+        str(number),
+        str(rec.get("datetime", "?")),
+        f"{rec.get('correct', '?')} / {rec.get('wrong', '?')}",
+        f"{rec.get('answered', '?')} / {rec.get('total_questions', '?')}",
+        f"{rec.get('percent', 0):.2f}%",
+        points,
+        str(rec.get("level_label", "")),
+        rec.get("teacher") or "",
+        "Erken sonlandırıldı" if rec.get("early_terminated") else "",
+    )
+
+def _row_size(row: tuple) -> int:
+    return sys.getsizeof(row) + sum(sys.getsizeof(cell) for cell in row)
+
+class ExamRowCache:
+    # Son bakılan öğrencilerin biçimlenmiş satırları; satırlar ekrana
+    # geldikçe biçimlenir, toplam bayt sınırı aşılınca en eski öğrenci atılır.
+    def __init__(self, max_bytes: int = 2 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.total_bytes = 0
+
+    def rows_for(self, name: str, records: list) -> list:
+        rows = self.entries.get(name)
+        if rows is None:
+            rows = [None] * len(records)
+            self.entries[name] = rows
+            self.sizes[name] = 0
+        else:
+            self.entries.move_to_end(name)
+            if len(rows) < len(records):
+                # Kayıtlar yalnızca sona eklenir; eski satırlar geçerli kalır.
+                rows.extend([None] * (len(records) - len(rows)))
+            elif len(rows) > len(records):
+                self.discard(name)
+                return self.rows_for(name, records)
+        return rows
+
+    def row(self, name: str, records: list, index: int) -> tuple:
+        rows = self.rows_for(name, records)
+        row = rows[index]
+        if row is None:
+            row = format_exam_row(index + 1, records[index])
+            rows[index] = row
+            size = _row_size(row)
+            self.sizes[name] += size
+            self.total_bytes += size
+            self.evict()
+        return row
+
+    def evict(self) -> None:
+        # Son kullanılan öğrenci sonda durur ve hiçbir zaman atılmaz.
+        while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+            self.discard(next(iter(self.entries)))
+
+    def discard(self, name: str) -> None:
+        if self.entries.pop(name, None) is not None:
+            self.total_bytes -= self.sizes.pop(name)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.sizes.clear()
+        self.total_bytes = 0
@@ -0,0 +1,221 @@
+import re
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional
+
+from .accounts import account_key
+from .quiz import LEVELS, question_id
+from .questions import build_builtin_questions
+from .storage import QUESTION_LEVEL_KEYS, custom_questions_signature, load_custom_questions, save_custom_questions
+
+LEVEL_KEYS = dict(zip(LEVELS, QUESTION_LEVEL_KEYS))
+
+_TOKEN = re.compile(r"\w+")
+# Türkçe klavyesiz aramada "sozluk" da "sözlük"ü bulsun diye harfler katlanır.
+_FOLD = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+
+def search_terms(text: str) -> List[str]:
+    return _TOKEN.findall(account_key(text).translate(_FOLD))
+
+class QuestionSearchIndex:
+    # Ters dizin: terim -> belge numaralarının artan listesi. Sorgu terimleri
+    # önek olarak eşleşir (Türkçe ekler: "döngü" -> "döngüsü", "döngüyü"),
+    # bu yüzden terimler ayrıca sıralı bir listede tutulur. Tüm terimler
+    # eşleşmelidir; tam terim eşleşmesi olan belgeler önce gelir.
+    def __init__(self) -> None:
+        self.postings: Dict[str, List[int]] = {}
+        self.terms: List[str] = []
+        self.doc_terms: Dict[int, tuple] = {}
+        self.doc_level: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_terms)
+
+    def add(self, doc: int, level: str, text: str, choices) -> None:
+        terms = set(search_terms(text))
+        for choice in choices:
+            terms.update(search_terms(choice))
+        self.doc_terms[doc] = tuple(terms)
+        self.doc_level[doc] = level
+        for term in terms:
+            docs = self.postings.get(term)
+            if docs is None:
+                self.postings[term] = [doc]
+                insort(self.terms, term)
+            elif docs[-1] < doc:
+                docs.append(doc)
+            else:
+                insort(docs, doc)
+
+    def remove(self, doc: int) -> None:
+        self.doc_level.pop(doc, None)
+        for term in self.doc_terms.pop(doc, ()):
+            docs = self.postings[term]
+            del docs[bisect_left(docs, doc)]
+            if not docs:
+                del self.postings[term]
+                del self.terms[bisect_left(self.terms, term)]
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        start = bisect_left(self.terms, prefix)
+        end = start
+        while end < len(self.terms) and self.terms[end].startswith(prefix):
+            end += 1
+        return self.terms[start:end]
+
+    def search(self, query: str, level: Optional[str] = None) -> List[int]:
+        tokens = sorted(set(search_terms(query)), key=len, reverse=True)
+        if not tokens:
+            docs = sorted(self.doc_terms)
+            return [d for d in docs if self.doc_level[d] == level] if level else docs
+        matched = None
+        for token in tokens:
+            found = set()
+            for term in self._prefix_terms(token):
+                found.update(self.postings[term])
+            matched = found if matched is None else matched & found
+            if not matched:
+                return []
+        if level:
+            matched = {d for d in matched if self.doc_level[d] == level}
+        # Sıralama: tam terim eşleşmesi sayısına göre kovalar, kova içinde belge sırası.
+        exact = [set(self.postings.get(token, ())) for token in tokens]
+        buckets = [[] for _ in range(len(tokens) + 1)]
+        for doc in matched:
+            buckets[sum(doc in docs for docs in exact)].append(doc)
+        ranked = []
+        for bucket in reversed(buckets):
+            bucket.sort()
+            ranked.extend(bucket)
+        return ranked
+
+class CatalogEntry:
+    # custom_index: soru ekstra ise questions verisindeki (seviye listesi) sırası.
+    __slots__ = ("level", "text", "choices", "answer", "custom_index")
+
+    def __init__(self, level: str, text: str, choices, answer: str, custom_index: Optional[int] = None) -> None:
+        self.level = level
+        self.text = text
+        self.choices = tuple(choices)
+        self.answer = answer
+        self.custom_index = custom_index
+
+    @property
+    def is_custom(self) -> bool:
+        return self.custom_index is not None
+
+    @property
+    def answer_index(self) -> int:
+        # Şıklarda olmayan cevap (bozuk kayıt) düzenlenebilsin diye 0 sayılır.
+        return self.choices.index(self.answer) if self.answer in self.choices else 0
+
+    @property
+    def qid(self) -> str:
+        return question_id(self.text, self.choices, self.answer_index)
+
+class QuestionCatalog:
+    # Soru Bankası sekmesindeki tarayıcının verisi: yerleşik ve ekstra
+    # sorular (sınavda atlanan bozuk ekstra kayıtlar da düzeltilebilsin diye)
+    # tek listede. Belge numarası listedeki sıradır ve değişmez. Ekstra sorular
+    # yalnızca imza değişince yeniden okunur; buradan yapılan ekleme ve
+    # düzenlemeler dizini artımlı günceller.
+    def __init__(self) -> None:
+        self.builtin = None
+        self.signature = None
+        self.loaded = False
+        self.entries: List[CatalogEntry] = []
+        self.custom: Dict[str, list] = {}
+        self.index = QuestionSearchIndex()
+
+    def refresh(self) -> bool:
+        if self.builtin is None:
+            self.builtin = [
+                CatalogEntry(q.level, q.text, q.choices, q.answer)
+                for pool in build_builtin_questions()
+                for q in pool
+            ]
+        signature = custom_questions_signature()
+        if self.loaded and signature == self.signature:
+            return False
+        self.custom = load_custom_questions()
+        self.entries = []
+        self.index = QuestionSearchIndex()
+        for entry in self.builtin:
+            self._append(entry)
+        for level, key in LEVEL_KEYS.items():
+            for position, qd in enumerate(self.custom[key]):
+                entry = self._custom_entry(level, qd, position)
+                if entry is not None:
+                    self._append(entry)
+        self.signature = signature
+        self.loaded = True
+        return True
+
+    @staticmethod
+    def _custom_entry(level: str, qd, position: int) -> Optional[CatalogEntry]:
+        try:
+            return CatalogEntry(level, qd["text"], [str(c) for c in qd["choices"]], qd["answer"], position)
+        except (KeyError, TypeError):
+            return None
+
+    def _append(self, entry: CatalogEntry) -> int:
+        doc = len(self.entries)
+        self.entries.append(entry)
+        self.index.add(doc, entry.level, entry.text, entry.choices)
+        return doc
+
+    def _save(self) -> None:
+        save_custom_questions(self.custom)
+        self.signature = custom_questions_signature()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self.entries)
+
+    def entry(self, doc: int) -> CatalogEntry:
+        return self.entries[doc]
+
+    def search(self, query: str, level: Optional[str] = None) -> List[int]:
+        self.refresh()
+        return self.index.search(query, level)
+
+    def add_custom(self, level: str, text: str, choices, answer: str) -> int:
+        self.refresh()
+        items = self.custom[LEVEL_KEYS[level]]
+        items.append({"text": text, "choices": list(choices), "answer": answer})
+        self._save()
+        return self._append(CatalogEntry(level, text, choices, answer, len(items) - 1))
+
+    def update_custom(self, doc: int, level: str, text: str, choices, answer: str) -> None:
+        # Seviye değişirse soru yeni seviyenin listesinin sonuna taşınır; eski
+        # listede arkasından gelenlerin sırası bir azalır. Sorular başka bir
+        # yerde değişmişse belge numaraları da değişmiş olabilir: ValueError.
+        if self.refresh():
+            raise ValueError("Soru bankası bu arada değişti; listeyi yenileyip tekrar deneyin.")
+        entry = self.entries[doc]
+        if not entry.is_custom:
+            raise ValueError("Yerleşik sorular düzenlenemez.")
+        qd = {"text": text, "choices": list(choices), "answer": answer}
+        old_items = self.custom[LEVEL_KEYS[entry.level]]
+        if level == entry.level:
+            old_items[entry.custom_index] = qd
+            position = entry.custom_index
+        else:
+            del old_items[entry.custom_index]
+            for other in self.entries:
+                if other.level == entry.level and other.is_custom and other.custom_index > entry.custom_index:
+                    other.custom_index -= 1
+            new_items = self.custom[LEVEL_KEYS[level]]
+            new_items.append(qd)
+            position = len(new_items) - 1
+        self._save()
+        self.index.remove(doc)
+        self.entries[doc] = CatalogEntry(level, text, choices, answer, position)
+        self.index.add(doc, level, text, choices)
+
+_question_catalog = None
+
+def get_question_catalog() -> QuestionCatalog:
+    global _question_catalog
+    if _question_catalog is None:
+        _question_catalog = QuestionCatalog()
+    return _question_catalog
@@ -0,0 +1,74 @@
+import json
+import os
+import zlib
+from typing import Dict, Any, List
+
+from .records import decode_record, encode_record
+
+SHARD_COUNT = 8
+SHARD_MANIFEST = "manifest.json"
+SHARD_KEYS = ("student", "teacher")
+
+def shard_index(key: str, count: int) -> int:
+    # hash() süreç başına rastgele tohumlanır; parça seçimi kalıcı olmalı.
+    return zlib.crc32(key.encode("utf-8")) % count
+
+def partition_results(results: Dict[str, Any], count: int = SHARD_COUNT, by: str = "student") -> List[list]:
+    # Her parça [isim, öğrenci sırası, kayıtlar, kayıt sıra numaraları] girdilerinden
+    # oluşur. Öğrenciye göre bölmede bir öğrencinin tüm kayıtları tek parçadadır
+    # (sıra numaraları None); öğretmene göre bölmede kayıtlar parçalara dağılır.
+    if by not in SHARD_KEYS:
+        raise ValueError(f"Bilinmeyen parçalama anahtarı: {by}")
+    shards = [[] for _ in range(count)]
+    for order, (name, records) in enumerate(results.items()):
+        if by == "student":
+            shards[shard_index(name, count)].append([name, order, records, None])
+            continue
+        grouped = {}
+        for seq, record in enumerate(records):
+            index = shard_index(record.get("teacher") or "", count)
+            entry = grouped.get(index)
+            if entry is None:
+                entry = grouped[index] = [name, order, [], []]
+                shards[index].append(entry)
+            entry[2].append(record)
+            entry[3].append(seq)
+        if not records:
+            shards[shard_index("", count)].append([name, order, [], []])
+    return shards
+
+def shard_file(directory: str, index: int) -> str:
+    return os.path.join(directory, f"shard-{index:03d}.json")
+
+def write_shards(results: Dict[str, Any], directory: str, count: int = SHARD_COUNT, by: str = "student") -> List[str]:
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, entries in enumerate(partition_results(results, count, by)):
+        path = shard_file(directory, index)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, separators=(",", ":"), default=encode_record)
+        paths.append(path)
+    manifest = {
+        "count": count,
+        "by": by,
+        "students": len(results),
+        "records": sum(len(records) for records in results.values()),
+        "files": [os.path.basename(path) for path in paths],
+    }
+    with open(os.path.join(directory, SHARD_MANIFEST), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return paths
+
+def read_manifest(directory: str) -> Dict[str, Any]:
+    with open(os.path.join(directory, SHARD_MANIFEST), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def shard_paths(directory: str) -> List[str]:
+    return [os.path.join(directory, name) for name in read_manifest(directory)["files"]]
+
+def read_shard(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    for entry in entries:
+        entry[2] = [decode_record(raw) for raw in entry[2]]
+    return entries
@@ -0,0 +1,632 @@
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Any
+
+from .filelock import FileLock
+from .records import as_exam_record, decode_record, decode_results, dump_results, dumps_record
+
+RESULTS_FILE = "results.json"
+RESULTS_JOURNAL_FILE = "results.jsonl"
+RESULTS_STORAGE_MODE = "journal"
+JOURNAL_COMPACT_THRESHOLD = 200
+QUESTIONS_FILE = "questions.json"
+TEACHERS_FILE = "teachers.json"
+STUDENTS_FILE = "students.json"
+DATABASE_FILE = "sinav.db"
+ANSWER_EVENTS_FILE = "answers.jsonl"
+TEACHER_PASSWORD = "Melomonik.21"
+
+STORAGE_BACKEND = "json"
+
+QUESTION_LEVEL_KEYS = ("easy", "medium", "hard")
+
+_journal_lines = 0
+_compaction_thread = None
+_file_locks = {}
+_file_locks_guard = threading.Lock()
+
+def _file_lock(path: str) -> FileLock:
+    with _file_locks_guard:
+        lock = _file_locks.get(path)
+        if lock is None:
+            lock = _file_locks[path] = FileLock(path)
+        return lock
+
+def _results_lock() -> FileLock:
+    # Sonuç dosyalarındaki her değişiklik (günlüğe ekleme, döndürme, anlık
+    # görüntü yazma) ve kurtarma bu süreçler arası kilit altında yapılır.
+    return _file_lock(RESULTS_FILE + ".lock")
+
+def account_lock(kind: str) -> FileLock:
+    # Hesap listesinde oku-değiştir-yaz bu süreçler arası kilit altında yapılır.
+    return _file_lock((TEACHERS_FILE if kind == "teachers" else STUDENTS_FILE) + ".lock")
+
+def _compaction_lock() -> FileLock:
+    # Aynı anda tek sıkıştırıcı; tutulduğu sürece results.json.new ve
+    # .jsonl.1 yarım kalmış sayılmaz, kurtarılmaz.
+    return _file_lock(RESULTS_FILE + ".compact.lock")
+
+def _rotated_journal_file() -> str:
+    return RESULTS_JOURNAL_FILE + ".1"
+
+def _pending_snapshot_file() -> str:
+    return RESULTS_FILE + ".new"
+
+def _read_results_snapshot(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return {}
+        return decode_results(data)
+    except Exception:
+        return {}
+
+def _replay_journal(data: Dict[str, Any], path: str, repair: bool = False) -> int:
+    # Her satır {"name": ..., "record": ...}; yarım kalmış son satır atlanır.
+    if not os.path.exists(path):
+        return 0
+    count = 0
+    good_end = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break
+            good_end += len(raw)
+            try:
+                entry = json.loads(raw.decode("utf-8"))
+                name = entry["name"]
+                record = decode_record(entry["record"])
+            except Exception:
+                continue
+            data.setdefault(name, []).append(record)
+            count += 1
+    if repair and good_end < os.path.getsize(path):
+        with open(path, "r+b") as f:
+            f.truncate(good_end)
+    return count
+
+def _drop_torn_tail(f) -> None:
+    # Çöken bir yazıcıdan kalan yarım son satır, eklemeden önce son satır
+    # sonuna kadar kesilir; yoksa yeni kayıt ona yapışır ve o da okunamaz.
+    end = f.seek(0, os.SEEK_END)
+    if end == 0:
+        return
+    f.seek(end - 1)
+    if f.read(1) == b"\n":
+        return
+    while end > 0:
+        start = max(0, end - 65536)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline >= 0:
+            f.truncate(start + newline + 1)
+            return
+        end = start
+    f.truncate(0)
+
+def _recover_compaction() -> None:
+    # results.json.new varsa: eski günlük hâlâ duruyorsa sıkıştırma yarım kalmıştır,
+    # günlük silinmişse yeni anlık görüntü zaten kesinleşmiştir.
+    pending = _pending_snapshot_file()
+    if not os.path.exists(pending):
+        return
+    if os.path.exists(_rotated_journal_file()):
+        os.remove(pending)
+    else:
+        os.replace(pending, RESULTS_FILE)
+
+def _try_recover_compaction() -> None:
+    lock = _compaction_lock()
+    if lock.acquire(blocking=False):
+        try:
+            _recover_compaction()
+        finally:
+            lock.release()
+
+def _read_current_results() -> Dict[str, Any]:
+    global _journal_lines
+    _try_recover_compaction()
+    data = _read_results_snapshot(RESULTS_FILE)
+    _replay_journal(data, _rotated_journal_file())
+    _journal_lines = _replay_journal(data, RESULTS_JOURNAL_FILE, repair=True)
+    return data
+
+def _remove_journals() -> None:
+    global _journal_lines
+    for path in (RESULTS_JOURNAL_FILE, _rotated_journal_file()):
+        if os.path.exists(path):
+            os.remove(path)
+    _journal_lines = 0
+
+def _compaction_running() -> bool:
+    return _compaction_thread is not None and _compaction_thread.is_alive()
+
+def _write_results_atomic(path: str, data: Dict[str, Any]) -> None:
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        dump_results(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def compact_results() -> None:
+    global _journal_lines
+    compaction_lock = _compaction_lock()
+    if not compaction_lock.acquire(blocking=False):
+        # Başka bir süreç (ya da iş parçacığı) zaten sıkıştırıyor.
+        return
+    try:
+        rotated = _rotated_journal_file()
+        with _results_lock():
+            _recover_compaction()
+            if os.path.exists(RESULTS_JOURNAL_FILE):
+                if os.path.exists(rotated):
+                    with open(RESULTS_JOURNAL_FILE, "rb") as src, open(rotated, "a+b") as dst:
+                        _drop_torn_tail(dst)
+                        dst.write(src.read())
+                    os.remove(RESULTS_JOURNAL_FILE)
+                else:
+                    os.replace(RESULTS_JOURNAL_FILE, rotated)
+            _journal_lines = 0
+        if not os.path.exists(rotated):
+            return
+        # Anlık görüntü ve döndürülmüş günlük yalnızca sıkıştırıcı tarafından
+        # değiştirilir; yeni görüntü kilit dışında hazırlanır, ekleyenler beklemez.
+        data = _read_results_snapshot(RESULTS_FILE)
+        _replay_journal(data, rotated)
+        pending = _pending_snapshot_file()
+        with open(pending, "w", encoding="utf-8") as f:
+            dump_results(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        with _results_lock():
+            os.remove(rotated)
+            os.replace(pending, RESULTS_FILE)
+    finally:
+        compaction_lock.release()
+
+def wait_for_compaction() -> None:
+    thread = _compaction_thread
+    if thread is not None:
+        thread.join()
+
+def _start_compaction() -> None:
+    global _compaction_thread
+    _compaction_thread = threading.Thread(target=compact_results, name="results-compaction", daemon=True)
+    _compaction_thread.start()
+
+def _read_json_list(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _normalize_accounts(raw, default_password: str) -> list:
+    accounts = []
+    for item in raw:
+        if isinstance(item, dict):
+            name = item.get("name", "")
+            pwd = item.get("password", default_password)
+            if name:
+                accounts.append({"name": name, "password": pwd})
+        elif isinstance(item, str):
+            accounts.append({"name": item, "password": default_password})
+    return accounts
+
+class JsonStorage:
+    name = "json"
+
+    def load_results(self) -> Dict[str, Any]:
+        with _results_lock():
+            return _read_current_results()
+
+    def save_results(self, data: Dict[str, Any]) -> None:
+        # Tüm içeriği bilinçli olarak değiştirir (ör. taşıma); sınav sonu
+        # yazımları append_result ile yalnızca kendi kayıtlarını ekler.
+        with _compaction_lock(), _results_lock():
+            _write_results_atomic(RESULTS_FILE, data)
+            _remove_journals()
+
+    def _merge_results(self, entries: list) -> None:
+        # Anlık görüntü kipi: dosya kilit altında yeniden okunur, yalnızca bu
+        # sürecin yeni kayıtları eklenip atomik olarak yazılır (başkalarınınki korunur).
+        with _compaction_lock(), _results_lock():
+            data = _read_current_results()
+            for name, record in entries:
+                data.setdefault(name, []).append(record)
+            _write_results_atomic(RESULTS_FILE, data)
+            _remove_journals()
+
+    def append_results(self, entries: list, sync: bool = False) -> None:
+        # entries: [(isim, kayıt), ...]; toplu yazım tek yazma ve en fazla bir fsync.
+        global _journal_lines
+        if not entries:
+            return
+        if RESULTS_STORAGE_MODE != "journal":
+            self._merge_results(entries)
+            return
+        payload = b"".join(
+            f'{{"name":{json.dumps(name, ensure_ascii=False)},"record":{dumps_record(record)}}}\n'.encode("utf-8")
+            for name, record in entries
+        )
+        with _results_lock():
+            with open(RESULTS_JOURNAL_FILE, "a+b") as f:
+                _drop_torn_tail(f)
+                f.write(payload)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            _journal_lines += len(entries)
+            should_compact = _journal_lines >= JOURNAL_COMPACT_THRESHOLD and not _compaction_running()
+            if should_compact:
+                _start_compaction()
+
+    def append_result(self, results: Dict[str, Any], name: str, record: Dict[str, Any]) -> None:
+        self.append_results([(name, record)])
+
+    def sync_results(self) -> None:
+        with _results_lock():
+            if os.path.exists(RESULTS_JOURNAL_FILE):
+                with open(RESULTS_JOURNAL_FILE, "ab") as f:
+                    os.fsync(f.fileno())
+
+    def student_records(self, name: str) -> list:
+        return self.load_results().get(name, [])
+
+    def teacher_results(self, teacher: str) -> Dict[str, Any]:
+        filtered = {}
+        for student, records in self.load_results().items():
+            own = [r for r in records if r.get("teacher") == teacher]
+            if own:
+                filtered[student] = own
+        return filtered
+
+    def load_custom_questions(self) -> Dict[str, list]:
+        if not os.path.exists(QUESTIONS_FILE):
+            return {"easy": [], "medium": [], "hard": []}
+        try:
+            with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                "easy": data.get("easy", []),
+                "medium": data.get("medium", []),
+                "hard": data.get("hard", []),
+            }
+        except Exception:
+            return {"easy": [], "medium": [], "hard": []}
+
+    def save_custom_questions(self, data: Dict[str, list]) -> None:
+        with open(QUESTIONS_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def custom_questions_signature(self):
+        try:
+            st = os.stat(QUESTIONS_FILE)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def save_teachers(self, data: list) -> None:
+        with open(TEACHERS_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def load_teachers(self) -> list:
+        if not os.path.exists(TEACHERS_FILE):
+            data = [{"name": "Admin", "password": TEACHER_PASSWORD}]
+            self.save_teachers(data)
+            return data
+        try:
+            raw = _read_json_list(TEACHERS_FILE)
+        except Exception:
+            data = [{"name": "Admin", "password": TEACHER_PASSWORD}]
+            self.save_teachers(data)
+            return data
+        if isinstance(raw, list):
+            normalized = _normalize_accounts(raw, TEACHER_PASSWORD)
+        else:
+            normalized = [{"name": "Admin", "password": TEACHER_PASSWORD}]
+        if normalized != raw:
+            self.save_teachers(normalized)
+        return normalized
+
+    def save_students(self, data: list) -> None:
+        with open(STUDENTS_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def load_students(self) -> list:
+        if not os.path.exists(STUDENTS_FILE):
+            return []
+        try:
+            raw = _read_json_list(STUDENTS_FILE)
+        except Exception:
+            return []
+        students = []
+        if isinstance(raw, list):
+            students = _normalize_accounts(raw, "")
+        if students != raw:
+            self.save_students(students)
+        return students
+
+    def accounts_signature(self, kind: str):
+        path = TEACHERS_FILE if kind == "teachers" else STUDENTS_FILE
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def close(self) -> None:
+        wait_for_compaction()
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student TEXT NOT NULL,
+    teacher TEXT,
+    datetime TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_student ON results(student);
+CREATE INDEX IF NOT EXISTS idx_results_teacher ON results(teacher);
+CREATE INDEX IF NOT EXISTS idx_results_datetime ON results(datetime);
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS teachers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    level TEXT NOT NULL,
+    text TEXT NOT NULL,
+    choices TEXT NOT NULL,
+    answer TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_questions_level ON questions(level);
+"""
+
+class SqliteStorage:
+    name = "sqlite"
+
+    def __init__(self, path: str = DATABASE_FILE) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SQLITE_SCHEMA)
+        self.conn.commit()
+
+    def load_results(self) -> Dict[str, Any]:
+        data = {}
+        with self.lock:
+            rows = self.conn.execute("SELECT student, record FROM results ORDER BY id").fetchall()
+        for student, record in rows:
+            data.setdefault(student, []).append(decode_record(json.loads(record)))
+        return data
+
+    def _insert_result(self, name: str, record: Dict[str, Any]) -> None:
+        self.conn.execute(
+            "INSERT INTO results (student, teacher, datetime, record) VALUES (?, ?, ?, ?)",
+            (name, record.get("teacher"), record.get("datetime"), dumps_record(record)),
+        )
+
+    def save_results(self, data: Dict[str, Any]) -> None:
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM results")
+            for name, records in data.items():
+                for record in records:
+                    self._insert_result(name, record)
+
+    def append_results(self, entries: list, sync: bool = False) -> None:
+        # Tek işlem; WAL + synchronous=NORMAL kalıcılığı SQLite'a bırakılır.
+        with self.lock, self.conn:
+            for name, record in entries:
+                self._insert_result(name, record)
+
+    def append_result(self, results: Dict[str, Any], name: str, record: Dict[str, Any]) -> None:
+        self.append_results([(name, record)])
+
+    def sync_results(self) -> None:
+        pass
+
+    def student_records(self, name: str) -> list:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT record FROM results WHERE student = ? ORDER BY id", (name,)
+            ).fetchall()
+        return [decode_record(json.loads(r[0])) for r in rows]
+
+    def teacher_results(self, teacher: str) -> Dict[str, Any]:
+        data = {}
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT student, record FROM results WHERE teacher = ? ORDER BY id", (teacher,)
+            ).fetchall()
+        for student, record in rows:
+            data.setdefault(student, []).append(decode_record(json.loads(record)))
+        return data
+
+    def load_custom_questions(self) -> Dict[str, list]:
+        data = {key: [] for key in QUESTION_LEVEL_KEYS}
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT level, text, choices, answer FROM questions ORDER BY id"
+            ).fetchall()
+        for level, text, choices, answer in rows:
+            if level in data:
+                data[level].append({"text": text, "choices": json.loads(choices), "answer": answer})
+        return data
+
+    def save_custom_questions(self, data: Dict[str, list]) -> None:
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM questions")
+            for level in QUESTION_LEVEL_KEYS:
+                for qd in data.get(level, []):
+                    self.conn.execute(
+                        "INSERT INTO questions (level, text, choices, answer) VALUES (?, ?, ?, ?)",
+                        (level, qd["text"], json.dumps(qd["choices"], ensure_ascii=False), qd["answer"]),
+                    )
+
+    def custom_questions_signature(self):
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*), MAX(id) FROM questions").fetchone()
+
+    def _load_accounts(self, table: str) -> list:
+        with self.lock:
+            rows = self.conn.execute(f"SELECT name, password FROM {table} ORDER BY id").fetchall()
+        return [{"name": name, "password": pwd} for name, pwd in rows]
+
+    def _save_accounts(self, table: str, data: list) -> None:
+        with self.lock, self.conn:
+            self.conn.execute(f"DELETE FROM {table}")
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (name, password) VALUES (?, ?)",
+                [(item["name"], item.get("password", "")) for item in data],
+            )
+
+    def save_teachers(self, data: list) -> None:
+        self._save_accounts("teachers", data)
+
+    def load_teachers(self) -> list:
+        teachers = self._load_accounts("teachers")
+        if not teachers:
+            teachers = [{"name": "Admin", "password": TEACHER_PASSWORD}]
+            self.save_teachers(teachers)
+        return teachers
+
+    def save_students(self, data: list) -> None:
+        self._save_accounts("students", data)
+
+    def load_students(self) -> list:
+        return self._load_accounts("students")
+
+    def accounts_signature(self, kind: str):
+        table = "teachers" if kind == "teachers" else "students"
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*), MAX(id) FROM {table}").fetchone()
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+_storage = None
+
+def create_storage(backend: str):
+    if backend == "json":
+        return JsonStorage()
+    if backend == "sqlite":
+        return SqliteStorage()
+    raise ValueError(f"Bilinmeyen depolama türü: {backend}")
+
+def get_storage():
+    global _storage
+    if _storage is None:
+        _storage = create_storage(STORAGE_BACKEND)
+    return _storage
+
+def set_storage(storage) -> None:
+    global _storage
+    _storage = storage
+
+def load_results() -> Dict[str, Any]:
+    return get_storage().load_results()
+
+def save_results(data: Dict[str, Any]) -> None:
+    get_storage().save_results(data)
+
+_result_listeners = []
+_result_writer = None
+
+def set_result_writer(writer) -> None:
+    # Verilirse append_result diske yazmayı bu yazıcının kuyruğuna bırakır.
+    global _result_writer
+    _result_writer = writer
+
+def get_result_writer():
+    return _result_writer
+
+def add_result_listener(listener) -> None:
+    _result_listeners.append(listener)
+
+def remove_result_listener(listener) -> None:
+    if listener in _result_listeners:
+        _result_listeners.remove(listener)
+
+def append_result(results: Dict[str, Any], name: str, record: Dict[str, Any]) -> None:
+    record = as_exam_record(record)
+    user_records = results.get(name, [])
+    user_records.append(record)
+    results[name] = user_records
+    writer = _result_writer
+    if writer is not None:
+        writer.submit(name, record)
+    else:
+        get_storage().append_result(results, name, record)
+    for listener in list(_result_listeners):
+        listener(results, name, record)
+
+def write_answer_events(payload: bytes) -> None:
+    # Cevap olayı günlüğü her iki arka uçta da ayrı bir JSON satırları
+    # dosyasıdır; satırlar tek yazmayla, kilit altında eklenir.
+    if not payload:
+        return
+    with _file_lock(ANSWER_EVENTS_FILE + ".lock"):
+        with open(ANSWER_EVENTS_FILE, "a+b") as f:
+            _drop_torn_tail(f)
+            f.write(payload)
+
+def append_answer_events(payload: bytes) -> None:
+    # Sonuç yazıcısı çalışıyorsa yazım onun iş parçacığına bırakılır.
+    writer = _result_writer
+    if writer is not None:
+        writer.submit_events(payload)
+    else:
+        write_answer_events(payload)
+
+def load_custom_questions() -> Dict[str, list]:
+    return get_storage().load_custom_questions()
+
+def save_custom_questions(data: Dict[str, list]) -> None:
+    get_storage().save_custom_questions(data)
+
+def custom_questions_signature():
+    return get_storage().custom_questions_signature()
+
+def load_teachers() -> list:
+    return get_storage().load_teachers()
+
+def save_teachers(data: list) -> None:
+    get_storage().save_teachers(data)
+
+def load_students() -> list:
+    return get_storage().load_students()
+
+def save_students(data: list) -> None:
+    get_storage().save_students(data)
+
+def accounts_signature(kind: str):
+    return get_storage().accounts_signature(kind)
+
+def migrate_storage(source, target) -> Dict[str, int]:
+    results = source.load_results()
+    students = source.load_students()
+    teachers = source.load_teachers()
+    questions = source.load_custom_questions()
+    target.save_results(results)
+    target.save_students(students)
+    target.save_teachers(teachers)
+    target.save_custom_questions(questions)
+    return {
+        "results": sum(len(records) for records in results.values()),
+        "students": len(students),
+        "teachers": len(teachers),
+        "questions": sum(len(questions[key]) for key in QUESTION_LEVEL_KEYS),
+    }
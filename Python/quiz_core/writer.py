@@ -0,0 +1,230 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from .storage import get_result_writer, get_storage, set_result_writer, write_answer_events
+
+FSYNC_POLICIES = ("always", "interval", "never")
+RESULTS_FSYNC_POLICY = "always"
+FSYNC_INTERVAL = 1.0
+WRITER_MAX_BATCH = 256
+WRITER_LINGER = 0.0
+RETRY_DELAY = 0.5
+LATENCY_SAMPLES = 256
+
+class ResultWriter:
+    # Sonuç kayıtlarını tek bir arka plan iş parçacığında diske yazar. Bir
+    # yazım sürerken gelen kayıtlar birikir ve sonraki yazımda tek seferde
+    # (tek yazma, en fazla bir fsync) kaydedilir: grup kesinleştirme.
+    # fsync: "always" her toplu yazımda, "interval" en fazla FSYNC_INTERVAL
+    # saniyede bir, "never" işletim sistemine bırakılır. Cevap olayı
+    # satırları (submit_events) aynı kuyruktan, fsync'siz eklenir.
+    def __init__(
+        self,
+        storage=None,
+        fsync_policy: str = RESULTS_FSYNC_POLICY,
+        max_batch: int = WRITER_MAX_BATCH,
+        linger: float = WRITER_LINGER,
+        fsync_interval: float = FSYNC_INTERVAL,
+    ) -> None:
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Bilinmeyen fsync politikası: {fsync_policy}")
+        self.storage = storage
+        self.fsync_policy = fsync_policy
+        self.max_batch = max_batch
+        self.linger = linger
+        self.fsync_interval = fsync_interval
+        self.cond = threading.Condition()
+        self.pending = []
+        self.submitted = 0
+        self.written = 0
+        self.events_written = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_error = None
+        self.max_depth = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.dirty = False
+        self.last_sync = time.monotonic()
+        self.stopping = False
+        self.thread = None
+
+    def start(self) -> "ResultWriter":
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+            self.thread.start()
+        return self
+
+    def submit(self, name: str, record: Dict[str, Any]) -> None:
+        self._enqueue((name, record))
+
+    def submit_events(self, payload: bytes) -> None:
+        if payload:
+            self._enqueue((None, payload))
+
+    def _enqueue(self, entry: tuple) -> None:
+        with self.cond:
+            if self.stopping:
+                raise RuntimeError("Sonuç yazıcısı kapatıldı.")
+            self.pending.append(entry)
+            self.submitted += 1
+            if len(self.pending) > self.max_depth:
+                self.max_depth = len(self.pending)
+            self.cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        # O ana kadar gelen tüm kayıtlar yazılana kadar bekler.
+        with self.cond:
+            target = self.submitted
+            return self.cond.wait_for(lambda: self.written >= target, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        with self.cond:
+            self.stopping = True
+            self.cond.notify_all()
+        if self.thread is not None:
+            self.thread.join(timeout)
+        with self.cond:
+            return self.written >= self.submitted
+
+    def _backend(self):
+        return self.storage if self.storage is not None else get_storage()
+
+    def _wait_for_work(self) -> list:
+        with self.cond:
+            while not self.pending and not self.stopping:
+                if self.dirty and self.fsync_policy == "interval":
+                    remaining = self.last_sync + self.fsync_interval - time.monotonic()
+                    if remaining <= 0:
+                        return []
+                    self.cond.wait(remaining)
+                else:
+                    self.cond.wait()
+            if self.linger and not self.stopping and len(self.pending) < self.max_batch:
+                self.cond.wait_for(lambda: self.stopping or len(self.pending) >= self.max_batch, self.linger)
+            batch = self.pending[:self.max_batch]
+            del self.pending[:self.max_batch]
+            return batch
+
+    def _should_sync(self, final: bool) -> bool:
+        if self.fsync_policy == "always":
+            return True
+        if self.fsync_policy == "never":
+            return False
+        return final or time.monotonic() - self.last_sync >= self.fsync_interval
+
+    def _sync_idle(self) -> None:
+        # "interval" kipinde yeni kayıt gelmese de bekleyen fsync yapılır.
+        try:
+            self._backend().sync_results()
+        except Exception as exc:
+            self._failed(exc)
+            return
+        self.dirty = False
+        self.last_sync = time.monotonic()
+
+    def _failed(self, exc: Exception) -> None:
+        with self.cond:
+            self.errors += 1
+            self.last_error = str(exc)
+
+    def _run(self) -> None:
+        while True:
+            batch = self._wait_for_work()
+            if not batch:
+                if self.stopping and not self.pending:
+                    if self.dirty and self.fsync_policy != "never":
+                        self._sync_idle()
+                    return
+                if self.dirty:
+                    self._sync_idle()
+                continue
+            final = self.stopping and not self.pending
+            records = [entry for entry in batch if entry[0] is not None]
+            events = [entry for entry in batch if entry[0] is None]
+            if events:
+                try:
+                    write_answer_events(b"".join(payload for _, payload in events))
+                except Exception as exc:
+                    with self.cond:
+                        self.pending[:0] = events
+                    self._failed(exc)
+                    events = None
+                else:
+                    with self.cond:
+                        self.written += len(events)
+                        self.events_written += len(events)
+                        self.cond.notify_all()
+                if not records:
+                    if events is None:
+                        time.sleep(RETRY_DELAY)
+                    continue
+            sync = self._should_sync(final)
+            started = time.perf_counter()
+            try:
+                self._backend().append_results(records, sync)
+            except Exception as exc:
+                # Kayıtlar kaybolmaz: kuyruğun başına dönüp yeniden denenir.
+                with self.cond:
+                    self.pending[:0] = records
+                self._failed(exc)
+                time.sleep(RETRY_DELAY)
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            if sync:
+                self.dirty = False
+                self.last_sync = time.monotonic()
+            else:
+                self.dirty = True
+            with self.cond:
+                self.written += len(records)
+                self.batches += 1
+                self.latencies.append(elapsed)
+                self.cond.notify_all()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self.cond:
+            last = self.latencies[-1] if self.latencies else 0.0
+            latencies = sorted(self.latencies)
+            depth = len(self.pending)
+            in_flight = self.submitted - self.written - depth
+            metrics = {
+                "queue_depth": depth,
+                "in_flight": in_flight,
+                "max_queue_depth": self.max_depth,
+                "submitted": self.submitted,
+                "written": self.written,
+                "events_written": self.events_written,
+                "batches": self.batches,
+                "errors": self.errors,
+                "last_error": self.last_error,
+            }
+        records = metrics["written"] - metrics["events_written"]
+        metrics["records_per_batch"] = records / metrics["batches"] if metrics["batches"] else 0.0
+        if latencies:
+            metrics["flush_ms_last"] = last
+            metrics["flush_ms_avg"] = sum(latencies) / len(latencies)
+            metrics["flush_ms_p95"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+            metrics["flush_ms_max"] = latencies[-1]
+        else:
+            metrics["flush_ms_last"] = metrics["flush_ms_avg"] = metrics["flush_ms_p95"] = metrics["flush_ms_max"] = 0.0
+        return metrics
+
+def start_result_writer(fsync_policy: str = RESULTS_FSYNC_POLICY, **options) -> ResultWriter:
+    writer = get_result_writer()
+    if writer is None:
+        writer = ResultWriter(fsync_policy=fsync_policy, **options).start()
+        set_result_writer(writer)
+    return writer
+
+def flush_results(timeout: Optional[float] = None) -> bool:
+    writer = get_result_writer()
+    return writer.flush(timeout) if writer is not None else True
+
+def stop_result_writer(timeout: Optional[float] = None) -> bool:
+    writer = get_result_writer()
+    if writer is None:
+        return True
+    set_result_writer(None)
+    return writer.close(timeout)
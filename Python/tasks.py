@@ -0,0 +1,84 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class TaskSignals(QObject):
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+class TaskRunner(QObject):
+    # İşler havuzdaki iş parçacıklarında çalışır, sonuç sinyalle GUI iş
+    # parçacığına döner. Aynı anahtarla yeni iş gelince bekleyen eski iş iptal
+    # edilir; çalışmaya başlamışsa sonucu bayat sayılıp atılır.
+    busy_changed = pyqtSignal(bool)
+
+    def __init__(self, parent: QObject = None, max_workers: int = 2):
+        super().__init__(parent)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gui-task")
+        self.tickets = count(1)
+        self.latest = {}
+        self.callbacks = {}
+        self.signals = TaskSignals(self)
+        self.signals.finished.connect(self.on_finished)
+        self.signals.failed.connect(self.on_failed)
+
+    def submit(self, key: str, fn, *args, on_done=None, on_error=None) -> int:
+        was_busy = self.is_busy()
+        self.drop(key)
+        ticket = next(self.tickets)
+        self.callbacks[ticket] = (key, on_done, on_error)
+        future = self.executor.submit(fn, *args)
+        self.latest[key] = (ticket, future)
+        future.add_done_callback(lambda f, t=ticket: self.deliver(t, f))
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return ticket
+
+    def drop(self, key: str) -> None:
+        entry = self.latest.pop(key, None)
+        if entry is not None:
+            ticket, future = entry
+            if future.cancel():
+                self.callbacks.pop(ticket, None)
+
+    def cancel(self, key: str) -> None:
+        was_busy = self.is_busy()
+        self.drop(key)
+        if was_busy and not self.is_busy():
+            self.busy_changed.emit(False)
+
+    def is_busy(self) -> bool:
+        return bool(self.latest)
+
+    def deliver(self, ticket: int, future) -> None:
+        # Havuz iş parçacığında çağrılır; sinyal GUI iş parçacığına kuyruklanır.
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            self.signals.failed.emit(ticket, str(exc))
+        else:
+            self.signals.finished.emit(ticket, future.result())
+
+    def take(self, ticket: int):
+        key, on_done, on_error = self.callbacks.pop(ticket, (None, None, None))
+        entry = self.latest.get(key)
+        if entry is None or entry[0] != ticket:
+            return None, None
+        del self.latest[key]
+        if not self.latest:
+            self.busy_changed.emit(False)
+        return on_done, on_error
+
+    def on_finished(self, ticket: int, result):
+        on_done, _ = self.take(ticket)
+        if on_done is not None:
+            on_done(result)
+
+    def on_failed(self, ticket: int, message: str):
+        _, on_error = self.take(ticket)
+        if on_error is not None:
+            on_error(message)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,29 @@
+import os
+import tempfile
+import unittest
+
+from quiz_core.accounts import AccountRegistry
+from quiz_core.storage import load_teachers
+
+class AccountRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_set_password_keeps_accounts_added_elsewhere(self):
+        # İki ayrı kayıt defteri iki süreci temsil eder.
+        first, second = AccountRegistry("teachers"), AccountRegistry("teachers")
+        admin = first.find("Admin")
+        self.assertIsNotNone(second.add("Ayşe Hoca", "1234"))
+        first.set_password(admin, "yeni")
+        teachers = {t["name"]: t["password"] for t in load_teachers()}
+        self.assertEqual(teachers, {"Admin": "yeni", "Ayşe Hoca": "1234"})
+        self.assertEqual(admin["password"], "yeni")
+
+if __name__ == "__main__":
+    unittest.main()
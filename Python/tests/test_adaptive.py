@@ -0,0 +1,28 @@
+import random
+import unittest
+from datetime import datetime, timedelta
+
+from quiz_core.adaptive import AdaptiveQuiz
+from quiz_core.questions import build_builtin_questions
+
+class AdaptiveDeadlineTest(unittest.TestCase):
+    def test_answer_after_deadline_is_ignored(self):
+        quiz = AdaptiveQuiz(build_builtin_questions(), exam_end_time=datetime.now() + timedelta(minutes=5),
+                            rng=random.Random(1))
+        quiz.answer_current(quiz.get_current_question().answer_index)
+        ability = quiz.ability
+        posterior = list(quiz.posterior)
+        served = len(quiz.questions)
+        quiz.exam_end_time = datetime.now() - timedelta(seconds=1)
+
+        self.assertFalse(quiz.answer_current(0))
+        self.assertEqual(quiz.posterior, posterior)
+        self.assertEqual(quiz.ability, ability)
+        self.assertEqual(len(quiz.questions), served)
+        self.assertEqual(quiz.answered, 1)
+        self.assertFalse(quiz.has_more_questions())
+        self.assertFalse(quiz.answer_current(0))
+        self.assertEqual(len(quiz.questions), served)
+
+if __name__ == "__main__":
+    unittest.main()
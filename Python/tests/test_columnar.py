@@ -0,0 +1,26 @@
+import copy
+import tempfile
+import unittest
+
+from quiz_core.columnar import ColumnarSnapshot, refresh_snapshot
+from quiz_core.reports import build_teacher_general_report
+from tests.test_records import RECORD
+
+class ColumnarSnapshotTest(unittest.TestCase):
+    def test_summary_matches_report_with_null_fields(self):
+        record = dict(RECORD, datetime="2025-01-05 10:00:00")
+        nulls = dict(copy.deepcopy(record), datetime=None, points=None, percent=None)
+        nulls["level_stats"]["Orta"]["wrong"] = None
+        results = {
+            "ayşe": [copy.deepcopy(record), nulls],
+            "mehmet": [dict(copy.deepcopy(record), level_label="Orta")],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            refresh_snapshot(results, tmp)
+            summary = ColumnarSnapshot(tmp).summary()
+        for top_n in (None, 1):
+            self.assertEqual(summary.general_report(top_n), build_teacher_general_report(results, top_n))
+        self.assertIn("None", summary.general_report())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import json
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from exam_server import ExamServer, SessionManager
+
+class DispatchTest(unittest.TestCase):
+    def setUp(self):
+        self.server = ExamServer(SessionManager({}))
+
+    def test_invalid_json(self):
+        status, payload = self.server.dispatch("POST", "/answer", b"{")
+        self.assertEqual((status, payload["error"]), (400, "Geçersiz JSON."))
+
+    def test_handler_value_error_is_server_error(self):
+        def broken(body):
+            raise ValueError("boom")
+        self.server.routes[("POST", "/answer")] = broken
+        with redirect_stderr(StringIO()) as err:
+            status, payload = self.server.dispatch("POST", "/answer", b"{}")
+        self.assertEqual(status, 500)
+        self.assertNotEqual(payload["error"], "Geçersiz JSON.")
+        self.assertIn("boom", err.getvalue())
+
+    def test_bool_choice_rejected(self):
+        body = json.dumps({"token": "x", "choice": True}).encode()
+        status, _ = self.server.dispatch("POST", "/answer", body)
+        self.assertEqual(status, 400)
+
+if __name__ == "__main__":
+    unittest.main()
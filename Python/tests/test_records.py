@@ -0,0 +1,43 @@
+import json
+import unittest
+
+from quiz_core.records import ExamRecord, decode_record, dumps_record
+
+RECORD = {
+    "datetime": "2025-01-05 10:00",
+    "correct": 3,
+    "wrong": 2,
+    "percent": 60.0,
+    "answered": 5,
+    "total_questions": 15,
+    "early_terminated": True,
+    "points": 6,
+    "max_points": 10,
+    "point_percent": 60.0,
+    "level_label": None,
+    "level_stats": {"Kolay": {"correct": 2, "wrong": 0}, "Orta": {"correct": 1, "wrong": 1}, "Zor": {"correct": 0, "wrong": 1}},
+    "study_suggestions": [],
+}
+
+class ExamRecordTest(unittest.TestCase):
+    def test_explicit_null_round_trips(self):
+        record = ExamRecord.from_dict(RECORD)
+        self.assertEqual(record.to_dict(), RECORD)
+        self.assertIn("level_label", record)
+        self.assertIsNone(record["level_label"])
+        self.assertIsNone(record.get("level_label", "?"))
+        self.assertNotIn("teacher", record)
+        self.assertEqual(record.get("teacher", "?"), "?")
+        with self.assertRaises(KeyError):
+            record["teacher"]
+
+        decoded = decode_record(json.loads(dumps_record(record)))
+        self.assertEqual(decoded.to_dict(), RECORD)
+        self.assertEqual(decoded, record)
+
+    def test_dict_format_round_trips(self):
+        record = dict(RECORD, level_label="Orta", teacher="Ayşe", adaptive=True)
+        self.assertEqual(decode_record(json.loads(dumps_record(record))).to_dict(), record)
+
+if __name__ == "__main__":
+    unittest.main()
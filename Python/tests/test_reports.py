@@ -0,0 +1,21 @@
+import unittest
+
+from quiz_core.reports import ResultStats
+
+class ResultStatsTest(unittest.TestCase):
+    def test_record_counted_at_construction_is_not_added_again(self):
+        # append_result kaydı listeye ekledikten sonra, dinleyici çalışmadan
+        # kurulan istatistik aynı kaydı dinleyiciden ikinci kez almamalı.
+        first, late, next_one = {"points": 4, "percent": 40.0}, {"points": 8, "percent": 80.0}, {"points": 6, "percent": 60.0}
+        results = {"ayşe": [first, late]}
+        stats = ResultStats(results)
+        stats.add_record("ayşe", late)
+        results["ayşe"].append(next_one)
+        stats.add_record("ayşe", next_one)
+        student = stats.students["ayşe"]
+        self.assertEqual(student.total_exams, 3)
+        self.assertEqual(student.avg_percent, 60.0)
+        self.assertEqual(student.best_points, 8)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import tempfile
+import unittest
+
+from quiz_core import storage
+
+class JournalTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_append_after_torn_line_keeps_new_record(self):
+        json_storage = storage.JsonStorage()
+        json_storage.append_results([("ayşe", {"points": 4})])
+        with open(storage.RESULTS_JOURNAL_FILE, "ab") as f:
+            f.write(b'{"name":"mehmet","rec')
+        json_storage.append_results([("ali", {"points": 7})])
+        data = {}
+        self.assertEqual(storage._replay_journal(data, storage.RESULTS_JOURNAL_FILE), 2)
+        self.assertEqual(sorted(data), ["ali", "ayşe"])
+        self.assertEqual(data["ali"][0]["points"], 7)
+
+if __name__ == "__main__":
+    unittest.main()
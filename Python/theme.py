@@ -0,0 +1,52 @@
+from PyQt6.QtWidgets import QApplication
+
+# Tüm uygulama için tek stil sayfası. Pencereye özel farklar objectName
+# üzerinden seçilir (ör. #modePage, #loginPage, QLabel#pageTitle).
+APP_STYLE_SHEET = """
+QWidget {background-color: #020617; color: white;}
+QPushButton {background-color: #2563eb; color: white; border-radius: 10px; padding: 8px; font-size: 14px;}
+QPushButton:hover {background-color: #3b82f6;}
+QLabel {font-size: 14px;}
+QLineEdit {background-color: #020617; color: white; padding: 8px; border-radius: 8px; border: 1px solid #1d4ed8;}
+QCheckBox {color: #e5e7eb;}
+QComboBox {background-color: #020617; color: white; padding: 6px; border-radius: 8px; border: 1px solid #1d4ed8;}
+QPlainTextEdit {background-color: #020617; color: white; border-radius: 8px; padding: 6px; border: 1px solid #1f2937;}
+QListWidget, QListView {background-color: #020617; color: white; border-radius: 8px; border: 1px solid #1f2937;}
+QTableView {background-color: #020617; color: white; gridline-color: #1f2937; border: 1px solid #1f2937; border-radius: 8px;}
+QTableView::item:selected {background-color: #1d4ed8;}
+QProgressBar {background-color: #0b1120; border: 1px solid #1f2937; border-radius: 5px;}
+QProgressBar::chunk {background-color: #2563eb; border-radius: 5px;}
+QHeaderView::section {background-color: #0b1120; color: #9ca3af; padding: 4px; border: none; border-bottom: 1px solid #1f2937;}
+
+QLabel#pageTitle {font-size: 18px; font-weight: bold;}
+
+QWidget#modePage {
+  background-color: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 #020617, stop:1 #0b1120);
+}
+#modePage QLabel {background-color: transparent;}
+#modePage QPushButton {border-radius: 12px; padding: 10px; font-size: 16px; font-weight: 500;}
+QWidget#modeCard {background-color: rgba(15, 23, 42, 0.9); border-radius: 18px; border: 1px solid #1d4ed8;}
+QLabel#logoLabel {font-size: 44px;}
+QLabel#heroTitle {font-size: 24px; font-weight: bold;}
+QLabel#cardTitle {font-size: 16px; font-weight: bold;}
+QLabel#mutedLabel {color: #9ca3af; font-size: 13px;}
+QLabel#hintLabel {color: #6b7280; font-size: 12px; margin-top: 4px;}
+QLabel#linkLabel {font-size: 13px;}
+
+#loginPage QPushButton {padding: 10px; font-size: 15px;}
+#loginPage QLabel#pageTitle {font-size: 20px;}
+
+QLabel#quizInfo {font-size: 16px; font-weight: bold;}
+QLabel#quizTimer {padding: 6px 14px; border-radius: 10px; border: 1px solid #1d4ed8;}
+QLabel#quizQuestion {font-size: 16px; margin-top: 10px;}
+QLabel#quizFeedback {margin-top: 8px;}
+
+#resultPage QLabel#pageTitle {font-size: 20px;}
+
+#teacherPage QLabel#pageTitle {font-size: 22px;}
+#teacherPage QLineEdit {padding: 6px; border: 1px solid #1f2937;}
+#teacherPage QComboBox {border: 1px solid #1f2937;}
+"""
+
+def apply_theme(app: QApplication) -> None:
+    app.setStyleSheet(APP_STYLE_SHEET)